@@ -81,10 +81,11 @@ from helpers.transliterate import (
 
 # Kontrola existence složky programových modulů
 # Kontrola existence datové složky
+# (ověření proběhne jednou za proces - kontrola_projektu, rerun už na disk nesahá)
 if_dir_exist("adresare_projektu.csv")  # utils
 
 # Kontrola existence souborů programových modulů
-# Kontrola existence datových souborů
+# Kontrola existence datových souborů (existence a velikost, chybějící soubory hlásí jednou za session)
 if_file_exist("soubory_projektu.csv")  # utils
 
 
@@ -5,7 +5,7 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
-from helpers.loader_csv import nacti_csv
+from helpers.koncovky import koncovky_casu_k, koncovka_casu_d
 from helpers.sklonovani import ziskej_koncovku_padu_k
 
 # koncovky_casy_d.csv 9 ř. cas_l;pada;aktiv;osoba;cislo;koncovka;pozn
@@ -13,48 +13,18 @@ from helpers.sklonovani import ziskej_koncovku_padu_k
 
 
 def ziskej_koncovku_casu_d(cas_l: str, pada: str, osoba: int, cislo: str) -> str:
-    # df = pd.read_csv("data/koncovky_casy_d.csv", sep=";")
-    df = nacti_csv(
-        cesta="data/koncovky_casy_d.csv", sloupec_trideni=None, zobraz=False, typ="dataframe"
-    )
-    filtr = (
-        (df["cas_l"] == cas_l)
-        & (df["pada"] == pada)
-        & (df["osoba"] == osoba)
-        & (df["cislo"] == cislo)
-    )
-    vysledky = df[filtr]
-    if not vysledky.empty:
-        return vysledky.iloc[0]["koncovka"]
-    return ""
+    # Index koncovky_casy_d.csv podle (cas_l, pada, osoba, cislo), viz helpers/koncovky.py
+    return koncovka_casu_d(cas_l, pada, osoba, cislo)
 
 
 def ziskej_koncovku_casu_k(cas_l: str, pada: str, osoba: int, cislo: str) -> tuple[str, str]:
-    # df = pd.read_csv("data/koncovky_casy_k.csv", sep=";")
-    df = nacti_csv(
-        cesta="data/koncovky_casy_k.csv", sloupec_trideni=None, zobraz=False, typ="dataframe"
-    )
-    filtr = (df["cas_l"] == cas_l) & (df["pada"] == pada) & (df["osoba"] == osoba)
-    vysledky = df[filtr]
-    if not vysledky.empty:
-        k_cislo = f"k_{cislo.rstrip('. ')}"
-        # st.write(f"(k_cislo>{k_cislo}<, vysledky>{vysledky}<)")
-
-        if k_cislo in vysledky.columns:
-            row = vysledky.iloc[0]
-            prefix = row.get("prefix", "")
-            koncovka_casu = row.get(k_cislo, "")
-
-            # Pokud je hodnota NaN, převést na prázdný řetězec
-            if isinstance(prefix, float) and pd.isna(prefix):
-                prefix = ""
-            if isinstance(koncovka_casu, float) and pd.isna(koncovka_casu):
-                koncovka_casu = ""
-
-            # st.write(f"(prefix>{prefix}<, koncovka>{koncovka}<)")
-            # Vrátí prefix a koncovku pro dané číslo
-            return prefix, koncovka_casu
-    return "", ""
+    # Index koncovky_casy_k.csv podle (cas_l, pada, osoba), viz helpers/koncovky.py
+    row = koncovky_casu_k(cas_l, pada, osoba)
+    k_cislo = f"k_{cislo.rstrip('. ')}"
+    if row is None or k_cislo not in row:
+        return "", ""
+    # Vrátí prefix a koncovku pro dané číslo (prázdná buňka = "")
+    return row.get("prefix", ""), row[k_cislo]
 
 
 def ziskej_kmen(slovo_in: str, x_kmen: str, cas_l: str, pada: str) -> tuple[str, str]:
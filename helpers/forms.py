@@ -7,8 +7,8 @@
 # Volá:
 # zobraz_prepinac_pad, zobraz_prepinac_rod, zobraz_prepinac_cislo, zobraz_prepinac_osoba, zobraz_prepinac_cas,
 # zobraz_prepinac_pada, vyber_slova_form, urci_koncovku,
-# clean_value, safe_index_or_default, zobraz_toast, nacti_csv, sklonuj_k, casuj_k, transliterate_iast_to_deva,
-# transliterate_czech_v_to_iast
+# clean_value, safe_index_or_default, zobraz_toast, nacti_lexikon, sklonuj_z_tabulky, casuj_z_tabulky,
+# transliterate_iast_to_deva, transliterate_czech_v_to_iast
 
 # ⬆️ ⬇️ ➡️ 🔜 🔁 🔡 🔠 📘 ℹ️ ▶️ ✅ 🗑️ ✏️
 # 👉 👍 👇 🙏 🔔 🧪 📎 🛠️ 🏗️ 🔧 ✂️ 🔑
@@ -37,9 +37,10 @@ from typing import List, Dict, Union, Optional
 
 from helpers.ui_display import zobraz_toast, dump_state
 from helpers.utils import clean_value, safe_index_or_default, urci_koncovku
-from helpers.loader_csv import nacti_csv
+from helpers.lexikon import nacti_lexikon
 from helpers.sklonovani import ziskej_koncovku_padu_k, sklonuj_k
 from helpers.casovani import casuj_k
+from helpers.paradigmata import sklonuj_z_tabulky, casuj_z_tabulky
 from helpers.transliterate import (
     transliterate_iast_to_deva,
     transliterate_deva_to_iast,
@@ -204,9 +205,6 @@ class Form_Slovo_Editace:
     f_typ_disable: bool = False
     f_slovo_disable: bool = False
 
-    # 🔹 Slovník pro všechny načtené datové rámce podle koncovky - slovník ke slovnímu druhu
-    df_slovnik: Dict[str, pd.DataFrame] = field(default_factory=dict)
-
     # 🔹 Slovník pro vybrané slovo - typ, slovo a parametry tvarování
     # po přidání tvarů pro zobrazení do věty vznikne matice_nove_slovo
     # parametr, hodnota
@@ -561,42 +559,44 @@ def _form_slovo() -> None:
     # 🔹 OSTATNÍ, ost
     if form.df_vybrane_slovo[form.df_klice["key_typ"]] in ss["slovni_druhy_set"]:
         # Načtení dat
-        # Typ: pandas.DataFrame
-        # Pokud nacti_csv() načítá CSV, je typicky DataFrame.
-        form.df_slovnik[form.df_klice["koncovka"]] = nacti_csv(
-            cesta=form.df_klice["cesta_slovniku"],
-            sloupec_trideni="cz",
-            zobraz=False,
-            typ="dataframe",
-        )
+        # Lexikon slovního druhu (sdílený procesem, načtený při prvním použití) - setříděné volby
+        # a indexy voleb (cz → pozice) a řádků (cz → řádek), z CSV nebo z SQLite (velké slovníky)
+        lexikon = nacti_lexikon(form.df_klice["cesta_slovniku"])
+        slovo_k_editaci = (form.slovo_k_editaci or {}).get(form.df_klice["key_cz"])
 
         # Výběr konkrétního slova s možností předvolby
         label_slovo = f"🔍 **Vyber {form.df_klice['typ_nazev'].lower()}:**"
-        # sloupec voleb - slovíčka
-        volby_slovo = form.df_slovnik[form.df_klice["koncovka"]]["cz"].dropna().unique()
+        f_hledani = hasattr(lexikon, "hledej")
+        if f_hledani:
+            # SQLite - volby jen z hledání podle začátku slova v cz, kmenu nebo dévanágarí (FTS5)
+            hledani = st.text_input(
+                label=f"🔎 Hledat {form.df_klice['typ_nazev'].lower()}:",
+                key=f"hledej_slovo_{form.df_klice['koncovka']}",
+                disabled=form.f_slovo_disable,
+            )
+            volby_slovo = lexikon.hledej(hledani, limit=ss["cfg"]["lexikon_hledani_limit"])
+            if slovo_k_editaci and slovo_k_editaci not in volby_slovo:
+                volby_slovo = [slovo_k_editaci, *volby_slovo]
+        else:
+            # sloupec voleb - slovíčka (setříděná, unikátní)
+            volby_slovo = lexikon.volby
         # pokud je slovo_k_editaci, tak to použij, jinak první z
         # co chceme jako default (např. podle slovo_k_editaci)
         # cz slovo
         # ulož do slovníku vybraného slova
-        form.df_vybrane_slovo[form.df_klice["key_cz"]] = (form.slovo_k_editaci or {}).get(
-            form.df_klice["key_cz"]
-        ) or volby_slovo[0]
+        form.df_vybrane_slovo[form.df_klice["key_cz"]] = slovo_k_editaci or (
+            volby_slovo[0] if volby_slovo else ""
+        )
         key_slovo_cz = f"{form.df_klice['key_cz']}_{form.df_vybrane_slovo.get(form.df_klice['key_cz'])}_{ss.get('index_edit_word', 'new')}"  # unikátní klíč pro každé editační slovo
 
         # Výběr konkrétního slova
-        # najít index vybrané hodnoty v volby
-        try:
-            # když volby už je list nebo iterovatelný objekt
-            index_slovo = list(volby_slovo).index(form.df_vybrane_slovo[form.df_klice["key_cz"]])
-        except Exception:
-            try:
-                # když je to numpy/pandas
-                index_slovo = volby_slovo.tolist().index(
-                    form.df_vybrane_slovo[form.df_klice["key_cz"]]
-                )
-            except (AttributeError, ValueError):
-                # fallback, když tam není
-                index_slovo = 0
+        # index vybrané hodnoty ve volbách (0, když tam není)
+        vybrane = form.df_vybrane_slovo[form.df_klice["key_cz"]]
+        if f_hledani:
+            # výsledek hledání - nejvýše lexikon_hledani_limit + 1 slov
+            index_slovo = volby_slovo.index(vybrane) if vybrane in volby_slovo else 0
+        else:
+            index_slovo = lexikon.index_volby(vybrane)
 
         # st.write(f">{typ_slova.lower()}< >{label_slovo}< >{form.df_vybrane_slovo[form.df_klice['key_cz']]}< >{index_slovo}<")
 
@@ -641,11 +641,10 @@ def _form_tvar_sub() -> tuple[dict, str, dict]:
     # cz;kmen;rod;devanagari
     # Pokud je vybráno slovo, zobraz další možnosti
     if form.df_vybrane_slovo.get(form.df_klice["key_cz"]) not in (None, ""):
-        # Vybere řádky a z nich 1. (0.) kde je zvolené slovo
-        r_vybrane_slovo = form.df_slovnik[form.df_klice["koncovka"]][
-            form.df_slovnik[form.df_klice["koncovka"]]["cz"]
-            == form.df_vybrane_slovo.get(form.df_klice["key_cz"])
-        ].iloc[0]
+        # Řádek vybraného slova - první řádek se zvoleným slovem (index lexikonu cz → řádek)
+        r_vybrane_slovo = nacti_lexikon(form.df_klice["cesta_slovniku"]).radek(
+            form.df_vybrane_slovo.get(form.df_klice["key_cz"])
+        )
         # Z tohoto řádku vybere položky - kmen, rod, devanagari
         # kmen - v cz vědecké transliteraci na konci s pomlčkou
         form.df_tvary_slova["kmen_tran_cz"] = r_vybrane_slovo["kmen"]
@@ -791,7 +790,7 @@ def _form_tvar_sub() -> tuple[dict, str, dict]:
             form.df_tvary_slova["kmen_0_tran_cz"],
             form.df_tvary_slova["koncovka_tran_cz"],
             form.df_tvary_slova["slovo_tran_cz"],
-        ) = sklonuj_k(
+        ) = sklonuj_z_tabulky(
             slovo_in=form.df_tvary_slova["kmen_tran_cz"],
             pad=form.df_vybrane_slovo[form.df_klice["key_pad"]],
             rod=form.df_vybrane_slovo[form.df_klice["key_rod"]],
@@ -1140,11 +1139,10 @@ def _form_tvar_pron() -> tuple[dict, str, dict]:
     # cz;transliterace;devanagari;osoba;rod;cislo;pad;variant;pozice;funkce;poznamka
     # Pokud je vybráno slovo, zobraz další možnosti
     if form.df_vybrane_slovo.get(form.df_klice["key_cz"]) not in (None, ""):
-        # Vybere řádky a z nich 1. (0.) kde je zvolené slovo
-        r_vybrane_slovo = form.df_slovnik[form.df_klice["koncovka"]][
-            form.df_slovnik[form.df_klice["koncovka"]]["cz"]
-            == form.df_vybrane_slovo.get(form.df_klice["key_cz"])
-        ].iloc[0]
+        # Řádek vybraného slova - první řádek se zvoleným slovem (index lexikonu cz → řádek)
+        r_vybrane_slovo = nacti_lexikon(form.df_klice["cesta_slovniku"]).radek(
+            form.df_vybrane_slovo.get(form.df_klice["key_cz"])
+        )
         # Z tohoto řádku vybere položky (některá zámena mají jeden tvar, jiná více a parametry ale nepravidelná)
         # Doplnit do slovníku základní tvar
         # dát do výběru parametry pad;rod;osoba;cislo;
@@ -1698,14 +1696,13 @@ def _form_tvar_verb() -> tuple[dict, str, dict]:
     # if cz_slv:
     if form.df_vybrane_slovo.get(form.df_klice["key_cz"]) not in (None, ""):
         # Získání řádku (slovníku) s daty
-        # Vybere řádky a z nich 1. (0.) kde je zvolené slovo
+        # Řádek vybraného slova - první řádek se zvoleným slovem (index lexikonu cz → řádek)
         # Typ: pandas.Series
         # Jeden řádek DataFrame (slovo se všemi parametry slova).
         # zobraz_toast(text = f"Koncovka >{koncovka}<", trvani = 20)
-        r_vybrane_slovo = form.df_slovnik[form.df_klice["koncovka"]][
-            form.df_slovnik[form.df_klice["koncovka"]]["cz"]
-            == form.df_vybrane_slovo.get(form.df_klice["key_cz"])
-        ].iloc[0]
+        r_vybrane_slovo = nacti_lexikon(form.df_klice["cesta_slovniku"]).radek(
+            form.df_vybrane_slovo.get(form.df_klice["key_cz"])
+        )
         # r_vybrane_slovo = slv[slv['cz'] == cz_slv].iloc[0].to_dict() # pandas.Series to dict
         # a pak načtení do matice_vety - vypsat dict položky přidané + původní takto:
         # ss.matice_slovo = {lic_typ: form.df_vybrane_slovo[form.df_klice['key_typ']], **r_vybrane_slovo} # rozbalí do něj původní dict položky slovesa
@@ -1803,7 +1800,7 @@ def _form_tvar_verb() -> tuple[dict, str, dict]:
             form.df_tvary_slova["kmen_0_tran_cz"],
             form.df_tvary_slova["koncovka_tran_cz"],
             form.df_tvary_slova["slovo_tran_cz"],
-        ) = casuj_k(
+        ) = casuj_z_tabulky(
             # PPP nebo 3. os. sg.
             slovo_in=form.df_tvary_slova["kmen_tran_cz"],
             # a-, i-, u- kmen
@@ -1982,11 +1979,10 @@ def _form_tvar_ost() -> tuple[dict, str, dict]:
     # cz;transliterace;devanagari
     # Pokud je vybráno slovo, zobraz další možnosti
     if form.df_vybrane_slovo.get(form.df_klice["key_cz"]):
-        # Vybere řádky a z nich 1. (0.) kde je zvolené slovo
-        r_vybrane_slovo = form.df_slovnik[form.df_klice["koncovka"]][
-            form.df_slovnik[form.df_klice["koncovka"]]["cz"]
-            == form.df_vybrane_slovo.get(form.df_klice["key_cz"])
-        ].iloc[0]
+        # Řádek vybraného slova - první řádek se zvoleným slovem (index lexikonu cz → řádek)
+        r_vybrane_slovo = nacti_lexikon(form.df_klice["cesta_slovniku"]).radek(
+            form.df_vybrane_slovo.get(form.df_klice["key_cz"])
+        )
         # Z tohoto řádku vybere položky - kmen, devanagari
         # v cz vědecké transliteraci na konci bez pomlčky
         form.df_tvary_slova["slovo_tran_cz"] = r_vybrane_slovo["transliterace"]
@@ -2056,7 +2052,7 @@ def vyber_slova_form() -> tuple[dict, str, dict]:
 
     # zobraz_toast(text=f"Před Edituji - {ss['index_edit_word']} + 1. slovo >{ss['slovo']}<", trvani=20)
     # st.sidebar.write(f"**Před - {ss['index_edit_word']} + 1. slovo >{ss['slovo']}<**")
-    # Form_Slovo_Editace (df_slovnik, df_vybrane_slovo, df_tvary_slova, df_klice, df_value)
+    # Form_Slovo_Editace (df_vybrane_slovo, df_tvary_slova, df_klice, df_value)
     _form_data()
 
     # st.sidebar.write("**f_edit:**", ss.get('f_edit'))
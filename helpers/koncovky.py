@@ -0,0 +1,159 @@
+# helpers/koncovky.py
+# koncovka_padu_k, koncovky_padu_k_klice, koncovky_padu_k_tabulka, koncovky_casu_k, koncovky_casu_k_klice,
+# koncovka_casu_d, statistika_indexu
+#
+# Indexy tabulek koncovek - každý koncovky_*.csv se načte jednou do slovníku podle klíče
+# a vyhledání koncovky je jeden dotaz do slovníku místo filtru nad DataFrame při každém volání.
+# Při změně souboru (mtime, velikost) se index při dalším dotazu sestaví znovu.
+#
+# Klíče (normalizované):
+#   koncovky_pady_k.csv : (x_kmen bez diakritiky, pád, rod, číslo)
+#   koncovky_casy_k.csv : (čas, pada, osoba)            → celý řádek (prefix, k_sg, k_du, k_pl, ...)
+#   koncovky_casy_d.csv : (čas, pada, osoba, číslo bez tečky)
+# Osoba se převádí na int, prázdné buňky jsou "". Při více řádcích se stejným klíčem platí první
+# (stejně jako iloc[0] po filtru).
+# Pro hromadné (vektorové) skloňování je index k dispozici i jako DataFrame (koncovky_padu_k_tabulka).
+#
+# Příklad použití:
+# koncovka = koncovka_padu_k("a", "G", "m", "sg.")          # "asja"
+# radek = koncovky_casu_k("prezent", "parasmai", 3)         # {"prefix": "", "k_sg": "ati", ...}
+
+# import
+import csv
+import os
+import threading
+import unicodedata
+
+from typing import Callable
+
+import pandas as pd
+
+soubor_pady_k = "data/koncovky_pady_k.csv"
+soubor_casy_k = "data/koncovky_casy_k.csv"
+soubor_casy_d = "data/koncovky_casy_d.csv"
+
+
+def odstran_diacritiku(text: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn")
+
+
+def _osoba(osoba) -> int | str:
+    """1, "1", " 1 " → 1, jiné hodnoty beze změny."""
+    try:
+        return int(osoba)
+    except (TypeError, ValueError):
+        return osoba
+
+
+def _cislo(cislo: str) -> str:
+    return cislo.rstrip(". ")
+
+
+class IndexKoncovek:
+    """
+    Slovník klíč → řádek CSV (dict) pro jeden soubor, znovu sestavený při změně souboru.
+    klic : funkce řádek → klíč (normalizace hodnot)
+    """
+
+    def __init__(self, cesta: str, klic: Callable[[dict], tuple]):
+        self.cesta = cesta
+        self.klic = klic
+        self._podpis = None
+        self._radky: dict[tuple, dict] = {}
+        self._tabulka: pd.DataFrame | None = None
+        self._zamek = threading.Lock()
+        self.nacteni = 0
+        self.dotazy = 0
+
+    def _sestav(self) -> dict[tuple, dict]:
+        radky = {}
+        with open(self.cesta, "r", encoding="utf-8", newline="") as f:
+            for radek in csv.DictReader(f, delimiter=";"):
+                # chybějící buňky (kratší řádek) jsou None
+                radek = {k: (v or "").strip() for k, v in radek.items() if k is not None}
+                radky.setdefault(self.klic(radek), radek)
+        return radky
+
+    def radky(self) -> dict[tuple, dict]:
+        try:
+            st_ = os.stat(self.cesta)
+            podpis = (st_.st_mtime_ns, st_.st_size)
+        except OSError:
+            podpis = None
+        if podpis != self._podpis:
+            with self._zamek:
+                if podpis != self._podpis:
+                    self._radky = self._sestav() if podpis is not None else {}
+                    self._tabulka = None
+                    self._podpis = podpis
+                    self.nacteni += 1
+        return self._radky
+
+    def tabulka(self, sloupce_klice: list[str]) -> pd.DataFrame:
+        """Platné řádky indexu jako DataFrame - sloupce klíče (normalizované) a sloupce CSV."""
+        radky = self.radky()
+        tabulka = self._tabulka
+        if tabulka is None:
+            klice = pd.DataFrame(list(radky), columns=sloupce_klice)
+            hodnoty = pd.DataFrame(list(radky.values()))
+            hodnoty = hodnoty.drop(columns=sloupce_klice, errors="ignore")
+            tabulka = self._tabulka = pd.concat([klice, hodnoty], axis=1)
+        return tabulka
+
+    def najdi(self, klic: tuple) -> dict | None:
+        self.dotazy += 1
+        return self.radky().get(klic)
+
+
+_pady_k = IndexKoncovek(
+    soubor_pady_k, lambda r: (odstran_diacritiku(r["x_kmen"]), r["pad"], r["rod"], r["cislo"])
+)
+_casy_k = IndexKoncovek(soubor_casy_k, lambda r: (r["cas_l"], r["pada"], _osoba(r["osoba"])))
+_casy_d = IndexKoncovek(
+    soubor_casy_d,
+    lambda r: (r["cas_l"], r["pada"], _osoba(r["osoba"]), _cislo(r["cislo"])),
+)
+
+
+def koncovka_padu_k(x_kmen: str, pad: str, rod: str, cislo: str) -> str:
+    """Pádová koncovka pro koncovou hlásku kmene (bez ohledu na diakritiku), "" = není."""
+    radek = _pady_k.najdi((odstran_diacritiku(x_kmen), pad, rod, cislo))
+    return radek["koncovka"] if radek else ""
+
+
+def koncovky_padu_k_klice() -> list[tuple]:
+    """Všechny klíče (x_kmen bez diakritiky, pád, rod, číslo) z koncovky_pady_k.csv v pořadí souboru."""
+    return list(_pady_k.radky())
+
+
+def koncovky_padu_k_tabulka() -> pd.DataFrame:
+    """koncovky_pady_k.csv jako DataFrame (x_kmen bez diakritiky, pad, rod, cislo, koncovka), bez duplicit."""
+    return _pady_k.tabulka(["x_kmen", "pad", "rod", "cislo"])
+
+
+def koncovky_casu_k(cas_l: str, pada: str, osoba: int) -> dict | None:
+    """Řádek koncovek času (prefix, k_sg, k_du, k_pl, ...), None = není."""
+    return _casy_k.najdi((cas_l, pada, _osoba(osoba)))
+
+
+def koncovky_casu_k_klice() -> list[tuple]:
+    """Všechny klíče (čas, pada, osoba) z koncovky_casy_k.csv v pořadí souboru."""
+    return list(_casy_k.radky())
+
+
+def koncovka_casu_d(cas_l: str, pada: str, osoba: int, cislo: str) -> str:
+    """Koncovka času z koncovky_casy_d.csv, "" = není."""
+    radek = _casy_d.najdi((cas_l, pada, _osoba(osoba), _cislo(cislo)))
+    return radek["koncovka"] if radek else ""
+
+
+def statistika_indexu() -> dict[str, dict]:
+    """Počet klíčů, načtení souboru a dotazů pro každý index."""
+    return {
+        os.path.basename(i.cesta): {
+            "klicu": len(i._radky),
+            "nacteni": i.nacteni,
+            "dotazy": i.dotazy,
+        }
+        for i in (_pady_k, _casy_k, _casy_d)
+    }
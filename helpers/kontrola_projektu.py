@@ -0,0 +1,274 @@
+# helpers/kontrola_projektu.py
+# Schema, SouborProjektu, overeni_adresaru, overeni_souboru, obnov_overeni, zkontroluj_csv,
+# statistika_overeni, main
+#
+# Kontrola projektu podle seznamů adresare_projektu.csv a soubory_projektu.csv (cesta;popis).
+#
+# Ověření při startu (overeni_adresaru, overeni_souboru) proběhne jednou za proces - chybějící
+# adresáře se vytvoří, u souborů se zjistí existence a velikost (os.stat, obsah se nečte). Výsledek
+# se drží v paměti procesu, takže rerun Streamlitu už na disk nesahá (seznamy ani soubory se znovu
+# nečtou). obnov_overeni() ověření zahodí - další volání ho provede znovu.
+#
+# Kontrola CSV (zkontroluj_csv, CLI) ověří u každého CSV ze seznamu souborů kódování, hlavičku
+# (prázdné a zdvojené názvy sloupců), povinné sloupce a povolené hodnoty podle SCHEMATA a počet
+# buněk v řádcích. Chyby (chybí soubor, nečitelný soubor, chybí povinný sloupec) vrací kód 1,
+# varování (prázdný soubor, nerovné řádky, neznámá hodnota) ne.
+#
+# Příklad použití:
+# soubory = overeni_souboru("soubory_projektu.csv")   # [SouborProjektu(cesta, popis, velikost)]
+# python -m helpers.kontrola_projektu                  # kontrola všech CSV ze soubory_projektu.csv
+
+# import
+import argparse
+import csv
+import os
+import sys
+import threading
+
+from dataclasses import dataclass, field
+
+# Vlastní moduly
+from helpers.sklonovani import CISLA, PADY, RODY
+
+SEZNAM_ADRESARU = "adresare_projektu.csv"
+SEZNAM_SOUBORU = "soubory_projektu.csv"
+
+CHYBA = "chyba"
+VAROVANI = "varování"
+
+
+@dataclass(frozen=True)
+class Schema:
+    sloupce: tuple[str, ...] = ()  # povinné sloupce
+    oddelovac: str = ";"
+    hodnoty: dict[str, tuple] = field(default_factory=dict)  # sloupec → povolené hodnoty
+
+
+_PADY_ROD_CISLO = {"pad": PADY, "rod": RODY, "cislo": CISLA}
+
+# Schémata CSV ze soubory_projektu.csv (soubor bez schématu má jen kontrolu hlavičky a řádků)
+SCHEMATA = {
+    "data/cas.csv": Schema(("poradi", "lakara", "cas_l", "cas_cz", "pada", "aktivita")),
+    "data/koncovky_pady_k.csv": Schema(
+        ("x_kmen", "pad", "rod", "cislo", "koncovka"), hodnoty=_PADY_ROD_CISLO
+    ),
+    "data/koncovky_pady_d.csv": Schema(
+        ("pad", "rod", "cislo", "koncovka"), hodnoty=_PADY_ROD_CISLO
+    ),
+    "data/koncovky_pady_l.csv": Schema(
+        ("pad", *(f"{r}_{c.rstrip('.')}" for r in RODY for c in CISLA)), hodnoty={"pad": PADY}
+    ),
+    "data/koncovky_casy_k.csv": Schema(
+        ("cas_l", "pada", "osoba", "prefix", "k_sg", "k_du", "k_pl"),
+        hodnoty={"osoba": ("1", "2", "3")},
+    ),
+    "data/koncovky_casy_d.csv": Schema(
+        ("cas_l", "pada", "osoba", "cislo", "koncovka"),
+        hodnoty={"osoba": ("1", "2", "3"), "cislo": ("sg", "du", "pl", *CISLA)},
+    ),
+    "data/podstatna_jmena.csv": Schema(("cz", "kmen", "rod", "devanagari"), hodnoty={"rod": RODY}),
+    "data/pridavna_jmena.csv": Schema(
+        ("cz", "kmen", "rod", "devanagari"), hodnoty={"rod": ("", *RODY)}
+    ),
+    "data/slovesa.csv": Schema(
+        (
+            "cz",
+            "pada",
+            "tran_kmen",
+            "tran_prezens_3sg",
+            "tran_ppp",
+            "dev_kmen",
+            "dev_prezens_3sg",
+            "dev_ppp",
+        )
+    ),
+    "data/ostatni_slova.csv": Schema(("cz", "transliterace", "devanagari")),
+    "data/zajmena.csv": Schema(("cz", "transliterace", "devanagari")),
+    "data/pad_rod_ciso_osoba_sans.csv": Schema(
+        ("typ", "zkratka", "nazev", "sanskrt", "devanagari", "slovnik")
+    ),
+    "data/pravidla_sklonovani.csv": Schema(oddelovac=","),
+    "data/pravidla_zajmena.csv": Schema(oddelovac=","),
+    "data/pravidla_casovani.csv": Schema(oddelovac=","),
+}
+
+
+@dataclass(frozen=True)
+class SouborProjektu:
+    cesta: str
+    popis: str
+    velikost: int | None  # None = soubor neexistuje
+
+    @property
+    def existuje(self) -> bool:
+        return self.velikost is not None
+
+
+# ==============================================================================================================================================
+# Ověření při startu (jednou za proces)
+
+
+def nacti_seznam(seznam: str) -> list[dict] | None:
+    """Řádky seznamu (cesta;popis) bez prázdných řádků, None = seznam neexistuje."""
+    if not os.path.exists(seznam):
+        return None
+    with open(seznam, newline="", encoding="utf-8") as f:
+        return [r for r in csv.DictReader(f, delimiter=";") if any(r.values()) and r["cesta"]]
+
+
+def _velikost(cesta: str) -> int | None:
+    """Velikost souboru v bajtech, None pro neexistující soubor."""
+    try:
+        return os.stat(cesta).st_size
+    except OSError:
+        return None
+
+
+_overeni: dict[tuple[str, str], object] = {}
+_zamek = threading.Lock()
+
+
+def _jednou(druh: str, seznam: str, overeni):
+    """Výsledek ověření z paměti procesu, jinak ho provede. None (chybí seznam) se nepamatuje."""
+    klic = (druh, os.path.abspath(seznam))
+    vysledek = _overeni.get(klic)
+    if vysledek is None:
+        with _zamek:
+            vysledek = _overeni.get(klic)
+            if vysledek is None:
+                vysledek = overeni()
+                if vysledek is not None:
+                    _overeni[klic] = vysledek
+    return vysledek
+
+
+def overeni_adresaru(seznam: str = SEZNAM_ADRESARU) -> list[dict] | None:
+    """
+    Adresáře ze seznamu - chybějící se vytvoří (jednou za proces).
+    Vrací řádky seznamu s klíčem "vytvoren", None = seznam neexistuje.
+    """
+
+    def overeni():
+        radky = nacti_seznam(seznam)
+        if radky is None:
+            return None
+        for radek in radky:
+            radek["vytvoren"] = not os.path.exists(radek["cesta"])
+            if radek["vytvoren"]:
+                os.makedirs(radek["cesta"])
+        return radky
+
+    return _jednou("adresare", seznam, overeni)
+
+
+def overeni_souboru(seznam: str = SEZNAM_SOUBORU) -> list[SouborProjektu] | None:
+    """Existence a velikost souborů ze seznamu (jednou za proces), None = seznam neexistuje."""
+
+    def overeni():
+        radky = nacti_seznam(seznam)
+        if radky is None:
+            return None
+        return [
+            SouborProjektu(r["cesta"], r.get("popis") or "", _velikost(r["cesta"])) for r in radky
+        ]
+
+    return _jednou("soubory", seznam, overeni)
+
+
+def obnov_overeni():
+    """Zahodí výsledky ověření - další volání overeni_* znovu projde disk."""
+    with _zamek:
+        _overeni.clear()
+
+
+def statistika_overeni(seznam: str = SEZNAM_SOUBORU) -> dict[str, dict]:
+    """Soubory projektu pro stránku Diagnostika {cesta: {existuje, velikost}}."""
+    return {
+        s.cesta: {"existuje": s.existuje, "velikost": s.velikost}
+        for s in overeni_souboru(seznam) or []
+    }
+
+
+# ==============================================================================================================================================
+# Kontrola CSV
+
+
+def zkontroluj_csv(cesta: str, schema: Schema | None = None) -> list[tuple[str, str]]:
+    """Nálezy kontroly jednoho CSV - [(CHYBA / VAROVANI, zpráva)], prázdný seznam = v pořádku."""
+    schema = schema or SCHEMATA.get(cesta.replace(os.sep, "/"), Schema())
+    nalezy = []
+    try:
+        with open(cesta, newline="", encoding="utf-8") as f:
+            radky = list(csv.reader(f, delimiter=schema.oddelovac))
+    except FileNotFoundError:
+        return [(CHYBA, "soubor neexistuje")]
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        return [(CHYBA, f"soubor nelze přečíst: {e}")]
+
+    if not radky:
+        return [(VAROVANI, "prázdný soubor")]
+
+    hlavicka = [s.strip() for s in radky[0]]
+    if len(hlavicka) < 2:
+        nalezy.append(
+            (VAROVANI, f"hlavička má jediný sloupec - oddělovač není '{schema.oddelovac}'?")
+        )
+    if any(not s for s in hlavicka):
+        nalezy.append((VAROVANI, "prázdný název sloupce v hlavičce"))
+    zdvojene = sorted({s for s in hlavicka if s and hlavicka.count(s) > 1})
+    if zdvojene:
+        nalezy.append((CHYBA, f"zdvojené sloupce: {', '.join(zdvojene)}"))
+    chybi = [s for s in schema.sloupce if s not in hlavicka]
+    if chybi:
+        nalezy.append((CHYBA, f"chybí sloupce: {', '.join(chybi)}"))
+
+    nerovne = [i for i, r in enumerate(radky[1:], start=2) if r and len(r) != len(hlavicka)]
+    if nerovne:
+        ukazka = ", ".join(map(str, nerovne[:5])) + (" ..." if len(nerovne) > 5 else "")
+        nalezy.append(
+            (VAROVANI, f"{len(nerovne)} řádků s jiným počtem buněk než hlavička: {ukazka}")
+        )
+
+    for sloupec, povolene in schema.hodnoty.items():
+        if sloupec not in hlavicka:
+            continue
+        i = hlavicka.index(sloupec)
+        nezname = sorted({r[i].strip() for r in radky[1:] if len(r) > i} - set(povolene))
+        if nezname:
+            nalezy.append((VAROVANI, f"neznámé hodnoty ve sloupci {sloupec}: {', '.join(nezname)}"))
+    return nalezy
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Kontrola souborů a CSV ze seznamu projektu.")
+    parser.add_argument("--seznam", default=SEZNAM_SOUBORU, help="seznam souborů (cesta;popis)")
+    parser.add_argument("--tiche", action="store_true", help="vypsat jen soubory s nálezy")
+    args = parser.parse_args(argv)
+
+    soubory = overeni_souboru(args.seznam)
+    if soubory is None:
+        print(f"Seznam {args.seznam} neexistuje.", file=sys.stderr)
+        return 1
+
+    chyb = varovani = 0
+    for soubor in soubory:
+        if not soubor.existuje:
+            nalezy = [(CHYBA, "soubor neexistuje")]
+        elif soubor.cesta.endswith(".csv"):
+            nalezy = zkontroluj_csv(soubor.cesta)
+        else:
+            nalezy = []
+        chyb += sum(u == CHYBA for u, _ in nalezy)
+        varovani += sum(u == VAROVANI for u, _ in nalezy)
+        if nalezy or not args.tiche:
+            stav = "❌" if any(u == CHYBA for u, _ in nalezy) else "⚠️" if nalezy else "✅"
+            print(f"{stav} {soubor.cesta} ({soubor.velikost or 0} B)")
+        for uroven, zprava in nalezy:
+            print(f"    {uroven}: {zprava}")
+
+    print(f"Souborů: {len(soubory)}, chyb: {chyb}, varování: {varovani}", file=sys.stderr)
+    return 1 if chyb else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# helpers/lexikon.py
+# Lexikon, nacti_lexikon, nastav_backend_lexikonu, statistika_lexikonu
+#
+# Slovníky slovních druhů (podstatna_jmena.csv, slovesa.csv, ...) s indexy pro formulář výběru slova.
+# Slovník se načte až při prvním použití slovního druhu (repozitar_dat, setříděný podle cz)
+# a sdílí se všemi sessions. Drží:
+#   volby  : setříděné unikátní hodnoty cz (bez prázdných) - volby selectboxu
+#   poradi : cz → pozice ve volbách (předvolba selectboxu)
+#   radky  : cz → pozice prvního řádku se slovem (řádek vybraného slova)
+# Předvolba i řádek vybraného slova jsou jeden dotaz do slovníku místo filtru nad celým
+# DataFrame při každém rerunu. Při změně souboru (mtime, velikost) se lexikon sestaví znovu.
+#
+# Backend "sqlite" (nastav_backend_lexikonu) bere slovník z data/lexikon.sqlite (lexikon_sqlite),
+# pokud v databázi je a CSV se od migrace nezměnilo - jinak, i při výchozím backendu "csv", platí CSV.
+#
+# Příklad použití:
+# lexikon = nacti_lexikon("data/podstatna_jmena.csv")
+# index = lexikon.index_volby("syn")     # pozice v lexikon.volby, 0 = není
+# radek = lexikon.radek("syn")           # pd.Series (cz, kmen, rod, devanagari)
+
+# import
+import os
+import threading
+
+import pandas as pd
+
+# Vlastní moduly
+from helpers.lexikon_sqlite import LexikonSQLite, soubor_databaze
+from helpers.repozitar_dat import nacti_tabulku
+
+BACKENDY = ("csv", "sqlite")
+
+
+class Lexikon:
+    """Slovník slovního druhu setříděný podle cz s indexy voleb a řádků (viz hlavička modulu)."""
+
+    def __init__(self, cesta: str, podpis: tuple):
+        self.cesta = cesta
+        self.podpis = podpis
+        df = nacti_tabulku(cesta)
+        if "cz" in df.columns:
+            # stabilní třídění - ze stejných cz zůstává první řádek souboru
+            df = df.sort_values(by="cz", kind="stable", ignore_index=True)
+            cz = df["cz"].tolist()
+        else:
+            cz = []
+        self.df = df
+
+        self.radky: dict[str, int] = {}
+        for i, slovo in enumerate(cz):
+            if isinstance(slovo, str) and slovo not in self.radky:
+                self.radky[slovo] = i
+        # dict zachovává pořadí vložení → setříděné unikátní cz
+        self.volby: tuple[str, ...] = tuple(self.radky)
+        self.poradi: dict[str, int] = {slovo: i for i, slovo in enumerate(self.volby)}
+
+    def __len__(self) -> int:
+        return len(self.volby)
+
+    def index_volby(self, slovo: str | None) -> int:
+        """Pozice slova ve volbách, 0 pokud tam není."""
+        return self.poradi.get(slovo, 0)
+
+    def radek(self, slovo: str) -> pd.Series:
+        """První řádek slovníku se slovem (KeyError, pokud ve slovníku není)."""
+        return self.df.iloc[self.radky[slovo]]
+
+
+_lexikony: dict[str, Lexikon | LexikonSQLite] = {}
+_zamek = threading.Lock()
+_backend = "csv"
+
+
+def _podpis(cesta: str) -> tuple[int, int] | None:
+    try:
+        st_ = os.stat(cesta)
+    except OSError:
+        return None
+    return st_.st_mtime_ns, st_.st_size
+
+
+def nacti_lexikon(cesta: str) -> Lexikon | LexikonSQLite:
+    """
+    Lexikon slovníku sdílený procesem - sestaví se při prvním použití a při změně souboru
+    (u backendu "sqlite" i při změně databáze).
+    """
+    klic = os.path.abspath(cesta)
+    podpis = (_podpis(cesta), _backend, _podpis(soubor_databaze) if _backend == "sqlite" else None)
+    lexikon = _lexikony.get(klic)
+    if lexikon is None or lexikon.podpis != podpis:
+        with _zamek:
+            lexikon = _lexikony.get(klic)
+            if lexikon is None or lexikon.podpis != podpis:
+                lexikon = None
+                if _backend == "sqlite":
+                    lexikon = LexikonSQLite.otevri(cesta, soubor_databaze, podpis)
+                if lexikon is None:
+                    lexikon = Lexikon(cesta, podpis)
+                _lexikony[klic] = lexikon
+    return lexikon
+
+
+def nastav_backend_lexikonu(backend: str):
+    """Úložiště slovníků sdílené procesem - "csv" nebo "sqlite" (data/lexikon.sqlite)."""
+    global _backend
+    if backend not in BACKENDY:
+        raise ValueError(f"Neznámý backend lexikonu '{backend}': použij {' nebo '.join(BACKENDY)}.")
+    _backend = backend
+
+
+def statistika_lexikonu() -> dict[str, dict]:
+    """Backend, počet řádků a unikátních slov načtených lexikonů."""
+    return {
+        os.path.relpath(klic): {
+            "backend": "sqlite" if isinstance(lexikon, LexikonSQLite) else "csv",
+            "radku": len(lexikon.df) if isinstance(lexikon, Lexikon) else None,
+            "slov": len(lexikon),
+        }
+        for klic, lexikon in list(_lexikony.items())
+    }
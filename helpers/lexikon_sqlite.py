@@ -0,0 +1,333 @@
+# helpers/lexikon_sqlite.py
+# LexikonSQLite, migruj, slovniky_ciselniku, statistika_databaze, main
+#
+# Volitelné úložiště slovníků v SQLite (standardní knihovna, lokální soubor data/lexikon.sqlite)
+# pro velké slovníky (statisíce slov) - slovník se nenačítá celý do paměti, dotazy jdou do databáze.
+#
+# Tabulky:
+#   slovniky  : nazev (soubor CSV), sloupce (JSON), podpis CSV při migraci [mtime_ns, velikost], pocet
+#   slova     : id (pořadí řádku v CSV), slovnik, cz, kmen, devanagari, data (celý řádek jako JSON)
+#               indexy (slovnik, cz), (slovnik, kmen), (slovnik, devanagari)
+#   slova_fts : FTS5 nad cz, kmen, devanagari (prefixové indexy 2 a 3 znaky) - hledání podle začátku slova
+# kmen je první ze sloupců SLOUPCE_KMENE (kmen, tran_kmen, transliterace), devanagari první
+# ze SLOUPCE_DEVANAGARI, který slovník má.
+#
+# LexikonSQLite má rozhraní lexikon.Lexikon (volby, index_volby, radek, df, len) a navíc hledej
+# (prefixové hledání pro výběr slova) a najdi (přesná shoda v cz, kmenu nebo dévanágarí).
+# Řádek se vrací jako pd.Series se stejnými hodnotami jako z CSV (prázdná buňka = NaN).
+# Lexikon se ze SQLite bere jen při nastavení backendu "sqlite" (lexikon.nastav_backend_lexikonu)
+# a jen pro slovník, který v databázi je a jehož CSV se od migrace nezměnilo (CSV, které už
+# neexistuje, se bere z databáze) - jinak platí CSV.
+#
+# Příklad použití:
+# python -m helpers.lexikon_sqlite                               # migrace slovníků z číselníku
+# python -m helpers.lexikon_sqlite data/slovnik_mw.csv --hledej "gam"
+# lexikon = LexikonSQLite.otevri("data/podstatna_jmena.csv")     # None = v databázi není
+# lexikon.hledej("pu")                                           # ["syn", ...] (cz)
+
+# import
+import argparse
+import csv
+import glob
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+soubor_databaze = "data/lexikon.sqlite"
+CISELNIK = "data/pad_rod_ciso_osoba_sans.csv"
+
+SLOUPCE_KMENE = ("kmen", "tran_kmen", "transliterace")
+SLOUPCE_DEVANAGARI = ("devanagari", "dev_kmen")
+
+_DAVKA = 50_000  # řádků CSV na jedno čtení při migraci (paměť nezávisí na velikosti slovníku)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS slovniky (
+    nazev   TEXT PRIMARY KEY,
+    sloupce TEXT NOT NULL,
+    podpis  TEXT,
+    pocet   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slova (
+    id         INTEGER PRIMARY KEY,
+    slovnik    TEXT NOT NULL,
+    cz         TEXT,
+    kmen       TEXT,
+    devanagari TEXT,
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS slova_cz ON slova (slovnik, cz);
+CREATE INDEX IF NOT EXISTS slova_kmen ON slova (slovnik, kmen);
+CREATE INDEX IF NOT EXISTS slova_devanagari ON slova (slovnik, devanagari);
+CREATE VIRTUAL TABLE IF NOT EXISTS slova_fts USING fts5 (
+    cz, kmen, devanagari,
+    content = 'slova', content_rowid = 'id',
+    tokenize = "unicode61 remove_diacritics 0 tokenchars '{znamenka}'",
+    prefix = '2 3'
+);
+""".format(
+    # znaménka dévanágarí (virám, samohláskové značky, anusvára, ...) jsou součástí slova,
+    # unicode61 by podle nich slovo rozdělil
+    znamenka="".join(
+        chr(c) for c in range(0x0900, 0x0980) if unicodedata.category(chr(c)).startswith("M")
+    )
+)
+
+
+def _podpis(cesta: str) -> list[int] | None:
+    try:
+        st_ = os.stat(cesta)
+    except OSError:
+        return None
+    return [st_.st_mtime_ns, st_.st_size]
+
+
+def _prvni(sloupce, kandidati: tuple[str, ...]) -> str | None:
+    return next((s for s in kandidati if s in sloupce), None)
+
+
+# ==============================================================================================================================================
+# Migrace z CSV
+
+
+def slovniky_ciselniku(ciselnik: str = CISELNIK) -> list[str]:
+    """Slovníky slovních druhů z číselníku (sloupec slovnik) a neprázdné data/zajmena_*.csv."""
+    with open(ciselnik, newline="", encoding="utf-8") as f:
+        slovniky = [(r.get("slovnik") or "").strip() for r in csv.DictReader(f, delimiter=";")]
+    zajmena = sorted(glob.glob(os.path.join(os.path.dirname(ciselnik), "zajmena_*.csv")))
+    zajmena = [z for z in zajmena if os.path.getsize(z) > 0]
+    return list(dict.fromkeys(s for s in (*slovniky, *zajmena) if s))
+
+
+def migruj(cesty: list[str], databaze: str = soubor_databaze) -> dict[str, int]:
+    """
+    Převede CSV slovníky do databáze (slovník, který už v ní je, se nahradí).
+    CSV se čte po dávkách _DAVKA řádků. Vrací {název slovníku: počet řádků}.
+    """
+    spojeni = sqlite3.connect(databaze)
+    pocty = {}
+    try:
+        spojeni.executescript(_SCHEMA)
+        for cesta in cesty:
+            nazev = os.path.basename(cesta)
+            podpis = _podpis(cesta)
+            with spojeni:
+                spojeni.execute("DELETE FROM slova WHERE slovnik = ?", (nazev,))
+                spojeni.execute("DELETE FROM slovniky WHERE nazev = ?", (nazev,))
+                sloupce, pocet = None, 0
+                for davka in pd.read_csv(cesta, sep=";", encoding="utf-8", chunksize=_DAVKA):
+                    sloupce = list(davka.columns)
+                    s_kmen = _prvni(sloupce, SLOUPCE_KMENE)
+                    s_dev = _prvni(sloupce, SLOUPCE_DEVANAGARI)
+                    # NaN → None (NULL, v JSON null)
+                    radky = davka.astype(object).where(davka.notna(), None).to_dict("records")
+                    spojeni.executemany(
+                        "INSERT INTO slova (slovnik, cz, kmen, devanagari, data) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (nazev, r.get("cz"), r.get(s_kmen), r.get(s_dev),
+                             json.dumps(r, ensure_ascii=False, default=_json_hodnota))
+                            for r in radky
+                        ),
+                    )  # fmt: skip
+                    pocet += len(radky)
+                spojeni.execute(
+                    "INSERT INTO slovniky (nazev, sloupce, podpis, pocet) VALUES (?, ?, ?, ?)",
+                    (nazev, json.dumps(sloupce or []), json.dumps(podpis), pocet),
+                )
+            pocty[nazev] = pocet
+        with spojeni:
+            spojeni.execute("INSERT INTO slova_fts (slova_fts) VALUES ('rebuild')")
+        spojeni.execute("ANALYZE")
+    finally:
+        spojeni.close()
+    return pocty
+
+
+def _json_hodnota(hodnota):
+    """numpy čísla (int64, float64) z pandas do JSON."""
+    if isinstance(hodnota, np.generic):
+        return hodnota.item()
+    raise TypeError(f"{type(hodnota).__name__} nelze uložit do JSON")
+
+
+# ==============================================================================================================================================
+# Lexikon nad databází
+
+
+class LexikonSQLite:
+    """Slovník v SQLite s rozhraním lexikon.Lexikon (viz hlavička modulu)."""
+
+    def __init__(self, cesta: str, databaze: str, sloupce: list[str], podpis=None):
+        self.cesta = cesta
+        self.databaze = databaze
+        self.nazev = os.path.basename(cesta)
+        self.sloupce = sloupce
+        self.podpis = podpis
+        self._vlakna = threading.local()
+        self._volby: tuple[str, ...] | None = None
+        self._poradi: dict[str, int] | None = None
+        self._pocet: int | None = None
+
+    @classmethod
+    def otevri(cls, cesta: str, databaze: str = soubor_databaze, podpis=None):
+        """Lexikon slovníku z databáze, None = databáze nebo slovník v ní není, nebo se CSV změnilo."""
+        if not os.path.exists(databaze):
+            return None
+        try:
+            spojeni = _spojeni_cteni(databaze)
+            try:
+                radek = spojeni.execute(
+                    "SELECT sloupce, podpis FROM slovniky WHERE nazev = ?",
+                    (os.path.basename(cesta),),
+                ).fetchone()
+            finally:
+                spojeni.close()
+        except sqlite3.Error:
+            return None
+        if radek is None:
+            return None
+        podpis_csv = _podpis(cesta)
+        if podpis_csv is not None and podpis_csv != json.loads(radek[1] or "null"):
+            return None
+        return cls(cesta, databaze, json.loads(radek[0]), podpis)
+
+    def _dotaz(self, sql: str, parametry: tuple = ()) -> list[tuple]:
+        # sqlite3 spojení nelze sdílet mezi vlákny (sessions) - jedno na vlákno
+        spojeni = getattr(self._vlakna, "spojeni", None)
+        if spojeni is None:
+            spojeni = self._vlakna.spojeni = _spojeni_cteni(self.databaze)
+        return spojeni.execute(sql, parametry).fetchall()
+
+    def _serie(self, data: str) -> pd.Series:
+        radek = json.loads(data)
+        return pd.Series(
+            {s: np.nan if radek.get(s) is None else radek[s] for s in self.sloupce}, dtype=object
+        )
+
+    def _nacti_volby(self):
+        if self._volby is None:
+            sql = "SELECT DISTINCT cz FROM slova WHERE slovnik = ? AND cz IS NOT NULL ORDER BY cz"
+            self._volby = tuple(r[0] for r in self._dotaz(sql, (self.nazev,)))
+            self._poradi = {slovo: i for i, slovo in enumerate(self._volby)}
+
+    @property
+    def volby(self) -> tuple[str, ...]:
+        """Všechna unikátní cz setříděná (načtou se při prvním použití - u velkých slovníků hledej)."""
+        self._nacti_volby()
+        return self._volby
+
+    def __len__(self) -> int:
+        if self._pocet is None:
+            self._pocet = self._dotaz(
+                "SELECT COUNT(DISTINCT cz) FROM slova WHERE slovnik = ?", (self.nazev,)
+            )[0][0]
+        return self._pocet
+
+    def index_volby(self, slovo: str | None) -> int:
+        """Pozice slova ve volbách, 0 pokud tam není."""
+        self._nacti_volby()
+        return self._poradi.get(slovo, 0)
+
+    def radek(self, slovo: str) -> pd.Series:
+        """První řádek slovníku se slovem (KeyError, pokud ve slovníku není)."""
+        radky = self._dotaz(
+            "SELECT data FROM slova WHERE slovnik = ? AND cz = ? ORDER BY id LIMIT 1",
+            (self.nazev, slovo),
+        )
+        if not radky:
+            raise KeyError(slovo)
+        return self._serie(radky[0][0])
+
+    def najdi(self, sloupec: str, hodnota: str) -> list[pd.Series]:
+        """Řádky s přesnou shodou ve sloupci cz, kmen nebo devanagari (index)."""
+        if sloupec not in ("cz", "kmen", "devanagari"):
+            raise ValueError(f"Neznámý sloupec '{sloupec}': použij cz, kmen nebo devanagari.")
+        radky = self._dotaz(
+            f"SELECT data FROM slova WHERE slovnik = ? AND {sloupec} = ? ORDER BY id",
+            (self.nazev, hodnota),
+        )
+        return [self._serie(r[0]) for r in radky]
+
+    def hledej(self, predpona: str, limit: int = 50) -> list[str]:
+        """
+        Setříděná unikátní cz slov, jejichž některé slovo v cz, kmenu nebo dévanágarí začíná
+        předponou (FTS5). Prázdná předpona = prvních `limit` slov podle cz.
+        """
+        predpona = predpona.strip()
+        if not predpona:
+            sql = "SELECT DISTINCT cz FROM slova WHERE slovnik = ? AND cz IS NOT NULL"
+            return [r[0] for r in self._dotaz(f"{sql} ORDER BY cz LIMIT ?", (self.nazev, limit))]
+        dotaz = " ".join(f'"{slovo.replace(chr(34), chr(34) * 2)}"*' for slovo in predpona.split())
+        radky = self._dotaz(
+            "SELECT DISTINCT s.cz FROM slova_fts JOIN slova s ON s.id = slova_fts.rowid"
+            " WHERE slova_fts MATCH ? AND s.slovnik = ? AND s.cz IS NOT NULL"
+            " ORDER BY s.cz LIMIT ?",
+            (dotaz, self.nazev, limit),
+        )
+        return [r[0] for r in radky]
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Celý slovník jako DataFrame setříděný podle cz (načte vše - jen pro malé slovníky)."""
+        radky = self._dotaz(
+            "SELECT data FROM slova WHERE slovnik = ? ORDER BY cz IS NULL, cz, id", (self.nazev,)
+        )
+        return pd.DataFrame([json.loads(r[0]) for r in radky], columns=self.sloupce)
+
+
+def _spojeni_cteni(databaze: str) -> sqlite3.Connection:
+    return sqlite3.connect(f"file:{os.path.abspath(databaze)}?mode=ro", uri=True)
+
+
+def statistika_databaze(databaze: str = soubor_databaze) -> dict[str, dict]:
+    """Slovníky v databázi {název: {radku, mb databáze}}, prázdné = databáze není."""
+    if not os.path.exists(databaze):
+        return {}
+    spojeni = _spojeni_cteni(databaze)
+    try:
+        radky = spojeni.execute("SELECT nazev, pocet FROM slovniky ORDER BY nazev").fetchall()
+    finally:
+        spojeni.close()
+    mb = round(os.path.getsize(databaze) / 2**20, 2)
+    return {nazev: {"radku": pocet, "mb_databaze": mb} for nazev, pocet in radky}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Migrace slovníků CSV do SQLite (data/lexikon.sqlite)."
+    )
+    parser.add_argument(
+        "csv", nargs="*", help="slovníky CSV (výchozí: slovníky z číselníku a zajmena_*.csv)"
+    )
+    parser.add_argument("--databaze", default=soubor_databaze, help="soubor databáze SQLite")
+    parser.add_argument("--hledej", help="po migraci vypsat slova začínající předponou")
+    args = parser.parse_args(argv)
+
+    cesty = args.csv or slovniky_ciselniku()
+    start = time.perf_counter()
+    pocty = migruj(cesty, args.databaze)
+    for nazev, pocet in pocty.items():
+        print(f"{nazev}: {pocet} řádků")
+    print(
+        f"→ {args.databaze}, {os.path.getsize(args.databaze) // 1024} kB,"
+        f" {time.perf_counter() - start:.2f} s",
+        file=sys.stderr,
+    )
+
+    if args.hledej:
+        for cesta in cesty:
+            lexikon = LexikonSQLite.otevri(cesta, args.databaze)
+            if lexikon is not None:
+                print(f"{lexikon.nazev}: {', '.join(lexikon.hledej(args.hledej, limit=20))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,9 @@
 import os
 import streamlit as st
 import pandas as pd
-import csv
 
 # Vlastní moduly
+from helpers.repozitar_dat import nacti_tabulku, nacti_zaznamy
 from helpers.ui_display import zobraz_toast
 
 
@@ -53,29 +53,15 @@ def nacti_csv(
     """
     try:
         if typ == "dataframe":
-            # načtení do pandas
-            df = pd.read_csv(filepath_or_buffer=cesta, sep=";", encoding="utf-8")
-            if sloupec_trideni and sloupec_trideni in df.columns:
-                # Seřazení přímo v df bez přiřazování a vytváření nové seřazené kopie
-                df.sort_values(by=sloupec_trideni, inplace=True)
+            # tabulka sdílená procesem (repozitar_dat) - soubor se čte jen poprvé a po změně
+            df = nacti_tabulku(cesta, sloupec_trideni=sloupec_trideni)
             if zobraz:
                 st.dataframe(data=df)
             return df
 
         elif typ == "list":
-            # načtení jako list slovníků
-            with open(file=cesta, mode="r", encoding="utf-8", newline="") as f:
-                data = list(csv.DictReader(f, delimiter=";"))
-            # načtení do listu slovníků - rozložený ekvivalent
-            # data = []
-            # with open(cesta, mode = "r", encoding="utf-8", newline = '') as f:
-            #     reader = csv.DictReader(f, delimiter=";")
-            #     data   = [row for row in reader]
-
-            # případné třídění podle sloupce
-            if sloupec_trideni and len(data) > 0 and sloupec_trideni in data[0]:
-                data = sorted(iterable=data, key=lambda x: x[sloupec_trideni])
-            return data
+            # list slovníků (csv.DictReader), případně setříděný podle sloupce - vlastní kopie záznamů
+            return nacti_zaznamy(cesta, sloupec_trideni=sloupec_trideni)
 
         else:
             raise ValueError(f"Neznámý typ načtení '{typ}': použij 'dataframe' nebo 'list'.")
@@ -0,0 +1,90 @@
+# helpers/lru_cache.py
+# LRUCache
+#
+# Omezená paměť výsledků (LRU - nejdéle nepoužitá položka se vytlačí první)
+# se statistikou zásahů, minutí a vytlačení.
+# Používá se jako dict: cache.get(klic), cache[klic] = hodnota, klic in cache, len(cache).
+#
+# Příklad použití:
+# cache = LRUCache(max_velikost=1000)
+# vysledek = cache.get(klic)
+# if vysledek is None:
+#     vysledek = spocitej(klic)
+#     cache[klic] = vysledek
+# cache.statistika()  # {"velikost": ..., "zasahy": ..., "minuti": ..., "vytlaceni": ..., ...}
+
+# import
+import threading
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+
+    def __init__(self, max_velikost: int = 10_000):
+        """
+        max_velikost : int
+            Nejvyšší počet položek, po jeho překročení se vytlačí nejdéle nepoužitá položka.
+        """
+        if max_velikost < 1:
+            raise ValueError("max_velikost musí být alespoň 1")
+
+        self.max_velikost = max_velikost
+        self._data = OrderedDict()
+        # sdílení mezi vlákny (sessions Streamlitu běží ve vláknech jednoho procesu)
+        self._zamek = threading.Lock()
+
+        # Statistika
+        self.zasahy = 0
+        self.minuti = 0
+        self.vytlaceni = 0
+
+    def get(self, klic: Hashable, default: Any = None) -> Any:
+        """Vrátí hodnotu a označí ji jako naposledy použitou, jinak default (a započte minutí)."""
+        with self._zamek:
+            try:
+                hodnota = self._data[klic]
+            except KeyError:
+                self.minuti += 1
+                return default
+            self._data.move_to_end(klic)
+            self.zasahy += 1
+            return hodnota
+
+    def __setitem__(self, klic: Hashable, hodnota: Any):
+        with self._zamek:
+            self._data[klic] = hodnota
+            self._data.move_to_end(klic)
+            while len(self._data) > self.max_velikost:
+                self._data.popitem(last=False)
+                self.vytlaceni += 1
+
+    def __contains__(self, klic: Hashable) -> bool:
+        # bez vlivu na pořadí a statistiku
+        return klic in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        """Vyprázdní paměť (statistika zůstává, viz reset_statistiky)."""
+        with self._zamek:
+            self._data.clear()
+
+    def reset_statistiky(self):
+        self.zasahy = 0
+        self.minuti = 0
+        self.vytlaceni = 0
+
+    def statistika(self) -> dict:
+        """Aktuální stav paměti pro výpis / diagnostiku."""
+        dotazy = self.zasahy + self.minuti
+        return {
+            "velikost": len(self._data),
+            "max_velikost": self.max_velikost,
+            "zasahy": self.zasahy,
+            "minuti": self.minuti,
+            "vytlaceni": self.vytlaceni,
+            "uspesnost": self.zasahy / dotazy if dotazy else 0.0,
+        }
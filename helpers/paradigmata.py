@@ -0,0 +1,304 @@
+# helpers/paradigmata.py
+# generuj_paradigmata, uloz_paradigmata, nacti_paradigmata, tvar_jmena, tvar_slovesa,
+# sklonuj_z_tabulky, casuj_z_tabulky, podpisy_zdroju, main
+#
+# Předpočítaná tabulka tvarů (paradigmat) všech slov slovníků:
+#   podstatna_jmena.csv, pridavna_jmena.csv - kmen × pád × rod × číslo (jako sklonovani.sklonuj_k)
+#   slovesa.csv - časy z koncovky_casy_k.csv × pada × osoba × číslo a PPP × pád × rod × číslo
+#                 (jako casovani.casuj_k, vstupem je tran_prezens_3sg, u PPP tran_ppp)
+# Každý řádek nese i přepis tvaru do IAST a dévanágarí (prepis_hromadne).
+#
+# Tabulka se ukládá do data/paradigmata.parquet (pyarrow, čte se přes memory map), v metadatech
+# jsou podpisy zdrojových CSV (mtime, velikost). Zastaralá nebo chybějící tabulka se při prvním
+# použití sestaví v paměti a zkusí se uložit. Vyhledání tvaru ve formuláři je pak jeden dotaz
+# do slovníku (tvar_jmena, tvar_slovesa), None = tvar v tabulce není. sklonuj_z_tabulky a
+# casuj_z_tabulky mají rozhraní sklonuj_k / casuj_k a při chybějícím tvaru je zavolají.
+#
+# Klíče odpovídají vstupům sklonuj_k / casuj_k, parametry, které výsledek neovlivní, se vynulují
+# (u časů x_kmen, pád a rod, u PPP pada a osoba).
+#
+# Příklad použití:
+# python -m helpers.paradigmata                  # offline sestavení data/paradigmata.parquet
+# tvar = tvar_jmena("putra-", "G", "m", "sg.")   # ("a", "putr", "asja", "putrasja")
+
+# import
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+# Vlastní moduly
+from helpers.casovani import casuj_k, ziskej_koncovku_casu_k
+from helpers.koncovky import koncovka_padu_k, koncovky_casu_k_klice
+from helpers.repozitar_dat import nacti_tabulku
+from helpers.sklonovani import CISLA, PADY, RODY, sklonuj_hromadne, sklonuj_k
+from helpers.transliterate import CZECH_V, DEVA, IAST, prepis_hromadne
+
+# pyarrow je volitelný - bez něj se tabulka drží jen v paměti
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+soubor_paradigmat = "data/paradigmata.parquet"
+
+SLOVNIKY_JMEN = {"sub": "data/podstatna_jmena.csv", "adj": "data/pridavna_jmena.csv"}
+SLOVNIK_SLOVES = "data/slovesa.csv"
+KONCOVKY_PADU = "data/koncovky_pady_k.csv"
+KONCOVKY_CASU = "data/koncovky_casy_k.csv"
+ZDROJE = (*SLOVNIKY_JMEN.values(), SLOVNIK_SLOVES, KONCOVKY_PADU, KONCOVKY_CASU)
+
+OSOBY = (1, 2, 3)
+CAS_PPP = "PPP"
+
+SLOUPCE = (
+    "typ",
+    "cz",
+    "slovo_in",
+    "x_kmen",
+    "cas_l",
+    "pada",
+    "osoba",
+    "pad",
+    "rod",
+    "cislo",
+    "prefix",
+    "kmen_0",
+    "koncovka",
+    "tvar_tran_cz",
+    "tvar_tran_iast",
+    "tvar_dev",
+)
+
+
+# ==============================================================================================================================================
+# Sestavení
+
+
+def _nacti(cesta: str) -> pd.DataFrame:
+    return nacti_tabulku(cesta, dtype=str, keep_default_na=False)
+
+
+def podpisy_zdroju() -> dict[str, list]:
+    """Podpisy zdrojových souborů (mtime_ns, velikost)."""
+    podpisy = {}
+    for cesta in ZDROJE:
+        try:
+            st_ = os.stat(cesta)
+            podpisy[cesta] = [st_.st_mtime_ns, st_.st_size]
+        except OSError:
+            podpisy[cesta] = None
+    return podpisy
+
+
+def _casuj(
+    slovo_in: str, x_kmen: str, cas_l: str, pada: str, osoba: int, cislo: str, pad: str, rod: str
+) -> tuple | None:
+    """Stejný výpočet jako casovani.casuj_k, None = tvar nelze sestavit."""
+    # ziskej_kmen
+    if cas_l == CAS_PPP:
+        prefix, vzor = "", x_kmen
+    else:
+        prefix, vzor = ziskej_koncovku_casu_k("prezent", pada, 3, "sg.")
+    if not vzor:
+        return None  # casuj_k vrací jen (prefix, slovo_in)
+    # slovo bez koncovky vzoru, při neshodě celé slovo
+    kmen_0 = slovo_in[: -len(vzor)] if slovo_in.endswith(vzor) else slovo_in
+    if kmen_0 == "":
+        return None
+
+    if cas_l == CAS_PPP:
+        koncovka = koncovka_padu_k(x_kmen, pad, rod, cislo)
+    else:
+        prefix, koncovka = ziskej_koncovku_casu_k(cas_l, pada, osoba, cislo)
+    return prefix, kmen_0, koncovka, prefix + kmen_0 + koncovka
+
+
+def generuj_paradigmata() -> pd.DataFrame:
+    """Rozvine všechna slova slovníků do všech tvarů (viz hlavička modulu)."""
+    radky = []
+
+    # jména - vektorově (sklonuj_hromadne)
+    jmena = []
+    for typ, cesta in SLOVNIKY_JMEN.items():
+        tvary = sklonuj_hromadne(_nacti(cesta)[["cz", "kmen"]], f_prepis=False)
+        jmena.append(
+            tvary.rename(columns={"kmen": "slovo_in"}).assign(
+                typ=typ, cas_l="", pada="", osoba=0, prefix=""
+            )
+        )
+
+    klice_casu = koncovky_casu_k_klice()
+    casy = list(dict.fromkeys(cas for cas, _, _ in klice_casu))
+    pady_sloves = list(dict.fromkeys(pada for _, pada, _ in klice_casu))
+    for sloveso in _nacti(SLOVNIK_SLOVES).itertuples(index=False):
+        prezens, ppp = sloveso.tran_prezens_3sg, sloveso.tran_ppp
+        if prezens.rstrip("- "):
+            for cas_l in casy:
+                for pada in pady_sloves:
+                    for osoba in OSOBY:
+                        for cislo in CISLA:
+                            tvar = _casuj(prezens, "", cas_l, pada, osoba, cislo, "", "")
+                            if tvar is not None:
+                                radky.append(
+                                    ("verb", sloveso.cz, prezens, "", cas_l, pada, osoba, "", "",
+                                     cislo, *tvar)
+                                )  # fmt: skip
+        if ppp.rstrip("- "):
+            x_kmen = ppp.rstrip("- ")[-1]
+            for pad in PADY:
+                for rod in RODY:
+                    for cislo in CISLA:
+                        tvar = _casuj(ppp, x_kmen, CAS_PPP, "", 0, cislo, pad, rod)
+                        if tvar is not None:
+                            radky.append(
+                                ("verb", sloveso.cz, ppp, x_kmen, CAS_PPP, "", 0, pad, rod, cislo,
+                                 *tvar)
+                            )  # fmt: skip
+
+    # tvar_tran_iast a tvar_dev se doplní níže
+    slovesa = pd.DataFrame(radky, columns=SLOUPCE[:-2])
+    df = pd.concat([*(j[list(SLOUPCE[:-2])] for j in jmena), slovesa], ignore_index=True)
+    df = df.drop_duplicates(subset=["typ", *SLOUPCE[2:10]], ignore_index=True)
+    df["tvar_tran_iast"] = prepis_hromadne(df["tvar_tran_cz"], CZECH_V, IAST)
+    df["tvar_dev"] = prepis_hromadne(df["tvar_tran_cz"], CZECH_V, DEVA)
+    df["osoba"] = df["osoba"].astype("int8")
+    return df
+
+
+def uloz_paradigmata(df: pd.DataFrame, cesta: str = soubor_paradigmat, podpisy=None) -> bool:
+    """Uloží tabulku do Parquet s podpisy zdrojů v metadatech. Bez pyarrow vrací False."""
+    if pa is None:
+        return False
+    tabulka = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(tabulka.schema.metadata or {})
+    metadata[b"zdroje"] = json.dumps(podpisy or podpisy_zdroju()).encode("utf-8")
+    pq.write_table(tabulka.replace_schema_metadata(metadata), cesta, compression="zstd")
+    return True
+
+
+def _nacti_ulozene(cesta: str, podpisy: dict) -> pd.DataFrame | None:
+    """Uložená tabulka, pokud existuje a odpovídá podpisům zdrojů, jinak None."""
+    if pq is None or not os.path.exists(cesta):
+        return None
+    try:
+        tabulka = pq.read_table(cesta, memory_map=True)
+        ulozene = json.loads((tabulka.schema.metadata or {}).get(b"zdroje", b"null"))
+    except Exception:
+        return None
+    if ulozene != podpisy:
+        return None
+    return tabulka.to_pandas()
+
+
+# ==============================================================================================================================================
+# Vyhledání tvaru
+
+
+class Paradigmata:
+    """Tabulka tvarů s indexy jmen a sloves (klíč → výsledek sklonuj_k / casuj_k)."""
+
+    def __init__(self, df: pd.DataFrame, podpisy: dict):
+        self.df = df
+        self.podpisy = podpisy
+        self.jmena = {}
+        self.slovesa = {}
+        sloupce = (df[s].tolist() for s in SLOUPCE[:14])
+        for typ, _, slovo_in, x_kmen, cas_l, pada, osoba, pad, rod, cislo, *tvar in zip(*sloupce):
+            prefix, kmen_0, koncovka, slovo_out = tvar
+            if typ == "verb":
+                self.slovesa.setdefault(
+                    (slovo_in, x_kmen, cas_l, pada, int(osoba), cislo, pad, rod),
+                    (prefix, kmen_0, koncovka, slovo_out),
+                )
+            else:
+                self.jmena.setdefault(
+                    (slovo_in, pad, rod, cislo), (x_kmen, kmen_0, koncovka, slovo_out)
+                )
+
+
+_paradigmata: Paradigmata | None = None
+_zamek = threading.Lock()
+
+
+def nacti_paradigmata(cesta: str = soubor_paradigmat, f_uloz: bool = True) -> Paradigmata:
+    """
+    Tabulka tvarů sdílená procesem. Při změně zdrojových CSV se znovu načte / sestaví
+    (kontrola stojí os.stat zdrojů). Sestavená tabulka se s f_uloz zkusí uložit do `cesta`.
+    """
+    global _paradigmata
+    podpisy = podpisy_zdroju()
+    if _paradigmata is not None and _paradigmata.podpisy == podpisy:
+        return _paradigmata
+
+    with _zamek:
+        if _paradigmata is not None and _paradigmata.podpisy == podpisy:
+            return _paradigmata
+        df = _nacti_ulozene(cesta, podpisy)
+        if df is None:
+            df = generuj_paradigmata()
+            if f_uloz:
+                try:
+                    uloz_paradigmata(df, cesta, podpisy)
+                except OSError:
+                    pass  # např. adresář jen pro čtení - tabulka zůstane v paměti
+        _paradigmata = Paradigmata(df, podpisy)
+        return _paradigmata
+
+
+def tvar_jmena(slovo_in: str, pad: str, rod: str, cislo: str) -> tuple | None:
+    """Výsledek sklonuj_k (x_kmen, kmen_0, koncovka, slovo_out) z tabulky, None = není v tabulce."""
+    return nacti_paradigmata().jmena.get((slovo_in, pad, rod, cislo))
+
+
+def tvar_slovesa(
+    slovo_in: str, x_kmen: str, cas_l: str, pada: str, osoba: int, cislo: str, pad: str, rod: str
+) -> tuple | None:
+    """Výsledek casuj_k (prefix, kmen_0, koncovka, slovo_out) z tabulky, None = není v tabulce."""
+    if cas_l == CAS_PPP:
+        klic = (slovo_in, x_kmen, cas_l, "", 0, cislo, pad, rod)
+    else:
+        klic = (slovo_in, "", cas_l, pada, osoba, cislo, "", "")
+    return nacti_paradigmata().slovesa.get(klic)
+
+
+def sklonuj_z_tabulky(slovo_in: str, pad: str, rod: str, cislo: str) -> tuple:
+    """sklonuj_k s vyhledáním v tabulce tvarů."""
+    return tvar_jmena(slovo_in, pad, rod, cislo) or sklonuj_k(slovo_in, pad, rod, cislo)
+
+
+def casuj_z_tabulky(
+    slovo_in: str, x_kmen: str, cas_l: str, pada: str, osoba: int, cislo: str, pad: str, rod: str
+) -> tuple:
+    """casuj_k s vyhledáním v tabulce tvarů."""
+    return tvar_slovesa(slovo_in, x_kmen, cas_l, pada, osoba, cislo, pad, rod) or casuj_k(
+        slovo_in, x_kmen, cas_l, pada, osoba, cislo, pad, rod
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sestavení tabulky tvarů všech slov slovníků.")
+    parser.add_argument("--vystup", default=soubor_paradigmat, help="výstupní soubor Parquet")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    df = generuj_paradigmata()
+    if not uloz_paradigmata(df, args.vystup):
+        print("Chybí pyarrow - tabulku nelze uložit.", file=sys.stderr)
+        return 1
+    trvani = time.perf_counter() - start
+    print(
+        f"Tvarů: {len(df)} ({df['typ'].value_counts().to_dict()}) → {args.vystup},"
+        f" {os.path.getsize(args.vystup) // 1024} kB, {trvani:.2f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
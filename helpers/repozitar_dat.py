@@ -0,0 +1,176 @@
+# helpers/repozitar_dat.py
+# nacti_tabulku, nacti_zaznamy, obnov_data, nastav_rozpocet_dat, statistika_dat
+#
+# Sdílená vrstva dat pro data/*.csv - každý soubor se v procesu načte jednou a načtená tabulka
+# se sdílí všemi sessions (sessions Streamlitu jsou vlákna jednoho procesu).
+#
+# Položka paměti je určena cestou, podobou výsledku (dataframe / list) a parametry načtení,
+# platnost se ověřuje podpisem souboru (mtime, velikost) - změněný soubor se načte znovu.
+# Paměť má rozpočet v bajtech (deep memory_usage tabulky), po jeho překročení se vytlačí
+# nejdéle nepoužité tabulky. obnov_data() zahodí vše - editor dat změny uvidí bez restartu serveru.
+#
+# Při prvním načtení se tabulka bere z binárního snímku dat (snimek_dat), pokud ho pro soubor
+# a parametry načtení má a není zastaralý, jinak se čte CSV.
+#
+# Volající dostane vlastní mělkou kopii tabulky (pandas Copy-on-Write - úpravy sdílená data
+# nezmění) a u záznamů vlastní kopie slovníků. Pandas 3 má Copy-on-Write vždy, u pandas 2 ho
+# zapne import modulu (bez něj by zápis do mělké kopie změnil tabulku všem sessions).
+#
+# Příklad použití:
+# df = nacti_tabulku("data/podstatna_jmena.csv")
+# zaznamy = nacti_zaznamy("data/cas.csv")
+# obnov_data()                                   # tlačítko "Znovu načíst data" na stránce Diagnostika
+
+# import
+import csv
+import os
+import sys
+import threading
+
+from collections import OrderedDict
+
+import pandas as pd
+
+# Vlastní moduly
+from helpers.snimek_dat import (
+    tabulka_ze_snimku,
+    varianta_snimku,
+    zavri_snimek,
+    zaznamy_ze_snimku,
+)
+
+# izolace mělkých kopií (viz hlavička) - pandas >= 3 má Copy-on-Write vždy
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+_ROZPOCET_MB = 64
+
+
+class _RepozitarDat:
+
+    def __init__(self, rozpocet_bajtu: int):
+        self.rozpocet_bajtu = rozpocet_bajtu
+        # klíč → (podpis souboru, hodnota, bajty)
+        self._data: OrderedDict[tuple, tuple] = OrderedDict()
+        self._bajty = 0
+        self._zamek = threading.Lock()
+        self.zasahy = 0
+        self.minuti = 0
+        self.vytlaceni = 0
+
+    @staticmethod
+    def _podpis(cesta: str) -> tuple[int, int]:
+        st_ = os.stat(cesta)  # FileNotFoundError se předá volajícímu
+        return st_.st_mtime_ns, st_.st_size
+
+    def nacti(self, klic: tuple, cesta: str, nacitani) -> object:
+        podpis = self._podpis(cesta)
+        with self._zamek:
+            polozka = self._data.get(klic)
+            if polozka is not None and polozka[0] == podpis:
+                self._data.move_to_end(klic)
+                self.zasahy += 1
+                return polozka[1]
+
+        # načtení mimo zámek - jiné soubory se mezitím mohou číst z paměti
+        hodnota, bajty = nacitani()
+        with self._zamek:
+            self.minuti += 1
+            stara = self._data.pop(klic, None)
+            if stara is not None:
+                self._bajty -= stara[2]
+            self._data[klic] = (podpis, hodnota, bajty)
+            self._bajty += bajty
+            # vytlačení nejdéle nepoužitých (poslední načtená položka zůstává vždy)
+            while self._bajty > self.rozpocet_bajtu and len(self._data) > 1:
+                _, (_, _, b) = self._data.popitem(last=False)
+                self._bajty -= b
+                self.vytlaceni += 1
+        return hodnota
+
+    def vycisti(self):
+        with self._zamek:
+            self._data.clear()
+            self._bajty = 0
+
+    def statistika(self) -> dict:
+        dotazy = self.zasahy + self.minuti
+        return {
+            "velikost": len(self._data),
+            "mb": round(self._bajty / 2**20, 2),
+            "rozpocet_mb": round(self.rozpocet_bajtu / 2**20, 2),
+            "zasahy": self.zasahy,
+            "minuti": self.minuti,
+            "vytlaceni": self.vytlaceni,
+            "uspesnost": self.zasahy / dotazy if dotazy else 0.0,
+        }
+
+    def soubory(self) -> dict[str, dict]:
+        with self._zamek:
+            polozky = list(self._data.items())
+        return {
+            f"{os.path.relpath(klic[0])} ({klic[1]})": {"mb": round(b / 2**20, 3)}
+            for klic, (_, _, b) in polozky
+        }
+
+
+_repozitar = _RepozitarDat(_ROZPOCET_MB * 2**20)
+
+
+def _klic(cesta: str, typ: str, parametry: dict) -> tuple:
+    return (os.path.abspath(cesta), typ, tuple(sorted(parametry.items())))
+
+
+def nacti_tabulku(cesta: str, sloupec_trideni: str | None = None, **parametry) -> pd.DataFrame:
+    """
+    CSV (oddělovač ;) jako DataFrame sdílený procesem, volitelně setříděný podle sloupce.
+    parametry : další parametry pd.read_csv (dtype=str, keep_default_na=False, ...)
+    """
+    parametry = {"sep": ";", "encoding": "utf-8", **parametry}
+
+    def nacitani():
+        varianta = varianta_snimku(parametry)
+        df = tabulka_ze_snimku(cesta, varianta) if varianta else None
+        if df is None:
+            df = pd.read_csv(cesta, **parametry)
+        if sloupec_trideni and sloupec_trideni in df.columns:
+            df = df.sort_values(by=sloupec_trideni)
+        return df, int(df.memory_usage(deep=True).sum())
+
+    klic = _klic(cesta, "dataframe", {**parametry, "sloupec_trideni": sloupec_trideni})
+    return _repozitar.nacti(klic, cesta, nacitani).copy(deep=False)
+
+
+def nacti_zaznamy(cesta: str, sloupec_trideni: str | None = None) -> list[dict]:
+    """CSV (oddělovač ;) jako list slovníků (csv.DictReader) sdílený procesem."""
+
+    def nacitani():
+        data = zaznamy_ze_snimku(cesta)
+        if data is None:
+            with open(cesta, mode="r", encoding="utf-8", newline="") as f:
+                data = list(csv.DictReader(f, delimiter=";"))
+        if sloupec_trideni and data and sloupec_trideni in data[0]:
+            data = sorted(data, key=lambda x: x[sloupec_trideni])
+        bajty = sys.getsizeof(data) + sum(
+            sys.getsizeof(r) + sum(sys.getsizeof(v) for v in r.values()) for r in data
+        )
+        return tuple(data), bajty
+
+    klic = _klic(cesta, "list", {"sloupec_trideni": sloupec_trideni})
+    return [dict(r) for r in _repozitar.nacti(klic, cesta, nacitani)]
+
+
+def obnov_data():
+    """Zahodí všechny načtené tabulky a uvolní snímek dat - další čtení půjde znovu ze souborů."""
+    _repozitar.vycisti()
+    zavri_snimek()
+
+
+def nastav_rozpocet_dat(rozpocet_mb: float):
+    """Rozpočet paměti tabulek v MB (sdílený procesem), při zmenšení se vytlačí při dalším načtení."""
+    _repozitar.rozpocet_bajtu = int(rozpocet_mb * 2**20)
+
+
+def statistika_dat() -> dict:
+    """Stav paměti tabulek (počet, MB, zásahy, minutí, vytlačení) a velikost jednotlivých tabulek."""
+    return {"souhrn": _repozitar.statistika(), "soubory": _repozitar.soubory()}
@@ -0,0 +1,239 @@
+# helpers/rozbor_tvaru.py
+# Rozbor, nacti_rozbor, rozeber_slovo, rozeber_vetu, main
+#
+# Zpětný rozbor tvaru: sanskrtské slovo → (slovo slovníku, pád, rod, číslo / čas, pada, osoba, číslo).
+# Obrácení tabulek koncovek (koncovky_pady_k.csv, koncovky_casy_k.csv) a slovníků
+# (podstatna_jmena.csv, pridavna_jmena.csv, slovesa.csv) do indexů podle přípony:
+#   koncovky jmen  : koncovka → [(x_kmen bez diakritiky, pád, rod, číslo)]
+#   koncovky sloves: (prefix, koncovka) → [(čas, pada, osoba, číslo)]
+#   kmeny          : (kmen_0, x_kmen bez diakritiky) → jména a PPP, (kmen_0, pada) → slovesa
+# kmen_0 se počítá stejně jako v sklonuj_k / casuj_k, takže rozbor je přesně obrácením tvarů,
+# které formuláře generují. Rod jména se bere ze slovníku (přídavná jména bez rodu mají všechny rody),
+# pada slovesa také (sloveso bez pady má obě).
+#
+# Slovo se rozebere zkusmo ve všech dělení kmen | koncovka, kde koncovka je v indexu - počet dotazů
+# je omezen délkou nejdelší koncovky (a počtem prefixů), ne velikostí slovníku.
+# Vstup může být v dévanágarí, IAST nebo českém vědeckém přepisu - latinka se zkouší v obou
+# výkladech (j = y v IAST / j v českém přepisu), výsledky se sloučí.
+# Indexy se sestaví jednou a znovu při změně zdrojových CSV (podpisy_zdroju).
+#
+# Příklad použití:
+# rozbory = rozeber_slovo("putrasja")    # [Rozbor(typ="sub", cz="syn", lemma="putra-", pad="G", ...)]
+# python -m helpers.rozbor_tvaru "नरः गच्छति"
+
+# import
+import argparse
+import re
+import sys
+import threading
+import unicodedata
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+import pandas as pd
+
+# Vlastní moduly
+from helpers.koncovky import (
+    koncovka_padu_k,
+    koncovky_casu_k,
+    koncovky_casu_k_klice,
+    koncovky_padu_k_klice,
+    odstran_diacritiku,
+)
+from helpers.paradigmata import CAS_PPP, SLOVNIK_SLOVES, SLOVNIKY_JMEN, podpisy_zdroju
+from helpers.repozitar_dat import nacti_tabulku
+from helpers.transliterate import CZECH_V, DEVA, IAST, prepis
+
+# Oddělovače slov ve větě (bílé znaky, daṇḍa, interpunkce)
+_ODDELOVACE = re.compile(r"[\s|।॥,.;:!?\"'()]+")
+_DEVANAGARI = re.compile(r"[ऀ-ॿ]")
+
+
+@dataclass(frozen=True)
+class Rozbor:
+    tvar: str  # rozebraný tvar v českém vědeckém přepisu
+    typ: str  # sub, adj, verb
+    cz: str
+    lemma: str  # kmen jména, tran_prezens_3sg nebo tran_ppp slovesa
+    cas_l: str = ""
+    pada: str = ""
+    osoba: int = 0
+    pad: str = ""
+    rod: str = ""
+    cislo: str = ""
+    prefix: str = ""
+    kmen_0: str = ""
+    koncovka: str = ""
+
+    @property
+    def popis(self) -> str:
+        """Popis tvaru jako ve formulářích - (G m sg.), (prezent parasmai 3 sg.), (PPP N m sg.)"""
+        if self.typ != "verb":
+            casti = (self.pad, self.rod, self.cislo)
+        elif self.cas_l == CAS_PPP:
+            casti = (self.cas_l, self.pad, self.rod, self.cislo)
+        else:
+            casti = (self.cas_l, self.pada, str(self.osoba), self.cislo)
+        return f"({' '.join(c for c in casti if c)})"
+
+
+def _nacti(cesta: str) -> pd.DataFrame:
+    return nacti_tabulku(cesta, dtype=str, keep_default_na=False)
+
+
+class IndexRozboru:
+    """Indexy koncovek a kmenů pro zpětný rozbor (viz hlavička modulu)."""
+
+    def __init__(self, podpisy: dict):
+        self.podpisy = podpisy
+
+        # koncovky jmen
+        self.koncovky_jmen: dict[str, list[tuple]] = defaultdict(list)
+        for x_kmen, pad, rod, cislo in koncovky_padu_k_klice():
+            koncovka = koncovka_padu_k(x_kmen, pad, rod, cislo)
+            if koncovka:
+                self.koncovky_jmen[koncovka].append((x_kmen, pad, rod, cislo))
+
+        # koncovky sloves a koncovka vzoru (prezent 3. os. sg.) pro každou padu
+        self.koncovky_sloves: dict[tuple, list[tuple]] = defaultdict(list)
+        self.vzory: dict[str, str] = {}
+        for cas_l, pada, osoba in koncovky_casu_k_klice():
+            radek = koncovky_casu_k(cas_l, pada, osoba)
+            for cislo in ("sg.", "du.", "pl."):
+                koncovka = radek.get(f"k_{cislo.rstrip('.')}", "")
+                klic = (radek.get("prefix", ""), koncovka)
+                self.koncovky_sloves[klic].append((cas_l, pada, osoba, cislo))
+            if cas_l == "prezent" and osoba == 3:
+                self.vzory[pada] = radek.get("k_sg", "")
+
+        # kmeny jmen a PPP: (kmen_0, x_kmen) → [(typ, cz, lemma, rod, cas_l)]
+        self.kmeny_jmen: dict[tuple, list[tuple]] = defaultdict(list)
+        for typ, cesta in SLOVNIKY_JMEN.items():
+            for r in _nacti(cesta).itertuples(index=False):
+                zaklad = r.kmen.rstrip("- ")
+                if zaklad:
+                    klic = (r.kmen.rstrip("aeiouáéíóú- "), odstran_diacritiku(zaklad[-1]))
+                    self.kmeny_jmen[klic].append((typ, r.cz, r.kmen, r.rod.strip(), ""))
+
+        # kmeny sloves: (kmen_0, pada) → [(cz, tran_prezens_3sg)]
+        self.kmeny_sloves: dict[tuple, list[tuple]] = defaultdict(list)
+        for r in _nacti(SLOVNIK_SLOVES).itertuples(index=False):
+            ppp = r.tran_ppp.rstrip("- ")
+            if ppp:
+                # kmen_0 PPP = slovo bez x_kmen (casovani.ziskej_kmen)
+                klic = (r.tran_ppp[: -len(ppp[-1])] if r.tran_ppp.endswith(ppp[-1]) else r.tran_ppp,
+                        odstran_diacritiku(ppp[-1]))  # fmt: skip
+                self.kmeny_jmen[klic].append(("verb", r.cz, r.tran_ppp, "", CAS_PPP))
+            if not r.tran_prezens_3sg.rstrip("- "):
+                continue
+            for pada, vzor in self.vzory.items():
+                if (r.pada and r.pada != pada) or not vzor:
+                    continue
+                slovo = r.tran_prezens_3sg
+                kmen_0 = slovo[: -len(vzor)] if slovo.endswith(vzor) else slovo
+                if kmen_0:
+                    self.kmeny_sloves[(kmen_0, pada)].append((r.cz, slovo))
+
+        self.max_jmena = max(map(len, self.koncovky_jmen), default=0)
+        self.max_slovesa = max((len(k) for _, k in self.koncovky_sloves), default=0)
+        self.prefixy = sorted({p for p, _ in self.koncovky_sloves})
+
+    def rozeber(self, tvar: str) -> list[Rozbor]:
+        """Všechny rozbory tvaru v českém vědeckém přepisu."""
+        rozbory = []
+
+        # jména a PPP: kmen_0 + koncovka
+        for delka in range(min(self.max_jmena, len(tvar) - 1), 0, -1):
+            koncovka = tvar[-delka:]
+            kandidati = self.koncovky_jmen.get(koncovka)
+            if not kandidati:
+                continue
+            kmen_0 = tvar[:-delka]
+            for x_kmen, pad, rod, cislo in kandidati:
+                for typ, cz, lemma, rod_slova, cas_l in self.kmeny_jmen.get((kmen_0, x_kmen), ()):
+                    if rod_slova and rod_slova != rod:
+                        continue
+                    rozbory.append(
+                        Rozbor(tvar, typ, cz, lemma, cas_l=cas_l, pad=pad, rod=rod, cislo=cislo,
+                               kmen_0=kmen_0, koncovka=koncovka)
+                    )  # fmt: skip
+
+        # určitá slovesa: prefix + kmen_0 + koncovka
+        for prefix in self.prefixy:
+            if not tvar.startswith(prefix):
+                continue
+            zbytek = tvar[len(prefix) :]
+            for delka in range(min(self.max_slovesa, len(zbytek) - 1), -1, -1):
+                koncovka = zbytek[len(zbytek) - delka :]
+                kandidati = self.koncovky_sloves.get((prefix, koncovka))
+                if not kandidati:
+                    continue
+                kmen_0 = zbytek[: len(zbytek) - delka]
+                for cas_l, pada, osoba, cislo in kandidati:
+                    for cz, lemma in self.kmeny_sloves.get((kmen_0, pada), ()):
+                        rozbory.append(
+                            Rozbor(tvar, "verb", cz, lemma, cas_l=cas_l, pada=pada, osoba=osoba,
+                                   cislo=cislo, prefix=prefix, kmen_0=kmen_0, koncovka=koncovka)
+                        )  # fmt: skip
+        return rozbory
+
+
+_index: IndexRozboru | None = None
+_zamek = threading.Lock()
+
+
+def nacti_rozbor() -> IndexRozboru:
+    """Index rozboru sdílený procesem, znovu sestavený při změně zdrojových CSV."""
+    global _index
+    podpisy = podpisy_zdroju()
+    if _index is None or _index.podpisy != podpisy:
+        with _zamek:
+            if _index is None or _index.podpisy != podpisy:
+                _index = IndexRozboru(podpisy)
+    return _index
+
+
+def vyklady(slovo: str) -> list[str]:
+    """Možné zápisy slova v českém vědeckém přepisu (dévanágarí jednoznačně, latinka jako IAST i czech_v)."""
+    slovo = unicodedata.normalize("NFC", slovo.strip()).lower()
+    if not slovo:
+        return []
+    if _DEVANAGARI.search(slovo):
+        return [unicodedata.normalize("NFC", prepis(slovo, DEVA, CZECH_V))]
+    z_iast = unicodedata.normalize("NFC", prepis(slovo, IAST, CZECH_V))
+    return list(dict.fromkeys((slovo, z_iast)))
+
+
+def rozeber_slovo(slovo: str) -> list[Rozbor]:
+    """Všechny rozbory slova zadaného v dévanágarí, IAST nebo českém vědeckém přepisu."""
+    index = nacti_rozbor()
+    rozbory = []
+    for tvar in vyklady(slovo):
+        rozbory.extend(index.rozeber(tvar))
+    return list(dict.fromkeys(rozbory))
+
+
+def rozeber_vetu(veta: str) -> list[tuple[str, list[Rozbor]]]:
+    """Rozbor každého slova věty - [(slovo, rozbory)], slova bez rozboru mají prázdný seznam."""
+    return [(slovo, rozeber_slovo(slovo)) for slovo in _ODDELOVACE.split(veta) if slovo]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Zpětný rozbor tvarů sanskrtské věty.")
+    parser.add_argument(
+        "veta", nargs="+", help="slova (dévanágarí, IAST nebo český vědecký přepis)"
+    )
+    args = parser.parse_args(argv)
+
+    for slovo, rozbory in rozeber_vetu(" ".join(args.veta)):
+        print(slovo)
+        if not rozbory:
+            print("  ❓ bez rozboru")
+        for r in rozbory:
+            print(f"  {r.tvar} = {r.lemma} ({r.cz}) {r.popis}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
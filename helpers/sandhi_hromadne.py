@@ -0,0 +1,142 @@
+# helpers/sandhi_hromadne.py
+# zpracuj_soubor, main
+#
+# Hromadné (headless) provedení sandhi nad velkým textovým souborem mimo Streamlit.
+# Vstup:  UTF-8 soubor, jedna věta na řádek (český vědecký přepis)
+# Výstup: JSONL ve stejném pořadí jako vstup, jeden řádek = jedna věta se seznamem změn (zmeny)
+#
+# Soubor se čte po dávkách (davka řádků), dávky se zpracují v ProcessPoolExecutor.
+# Každý proces si pravidla zkompiluje jen jednou (_init_proces) a cache dvojic slov drží po celou dobu běhu.
+#
+# Příklad použití:
+# python -m helpers.sandhi_hromadne vety.txt vety_sandhi.jsonl --procesy 4 --davka 2000
+
+# import
+import argparse
+import json
+import os
+import sys
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator
+
+# Vlastní moduly
+from helpers.sandhi_processor import SandhiProcessor
+
+# Procesor (včetně cache dvojic slov) - jeden pro každý pracovní proces
+_procesor: SandhiProcessor | None = None
+
+
+def _init_proces(json_file: str, engine: str = "python"):
+    """Inicializace pracovního procesu - pravidla se načtou a zkompilují jen jednou."""
+    global _procesor
+    _procesor = SandhiProcessor(json_file=json_file, engine=engine)
+
+
+def _zpracuj_davku(davka: list[tuple[int, str]]) -> list[str]:
+    """Zpracuje dávku (číslo řádku, věta) a vrátí hotové řádky JSONL."""
+    vystup = []
+    for cislo_radku, veta in davka:
+        zaznam = {"radek": cislo_radku, "veta": veta}
+        try:
+            zaznam["sandhi"], zaznam["zmeny"] = _procesor.aplikuj_sandhi(veta)
+        except Exception as e:
+            # chyba jedné věty nesmí zastavit celý soubor
+            zaznam["sandhi"], zaznam["zmeny"] = "", []
+            zaznam["chyba"] = f"{type(e).__name__}: {e}"
+        vystup.append(json.dumps(zaznam, ensure_ascii=False))
+    return vystup
+
+
+def _davky(soubor, velikost: int) -> Iterator[list[tuple[int, str]]]:
+    """Čte soubor po řádcích a vrací dávky (číslo řádku, věta) o dané velikosti."""
+    radky = ((i, radek.rstrip("\r\n")) for i, radek in enumerate(soubor, start=1))
+    while True:
+        davka = list(islice(radky, velikost))
+        if not davka:
+            return
+        yield davka
+
+
+def zpracuj_soubor(
+    vstup: str,
+    vystup: str,
+    json_file: str = "data/sandhi_pravidla.json",
+    procesy: int | None = None,
+    davka: int = 1000,
+    engine: str = "python",
+) -> int:
+    """
+    Provede sandhi nad každým řádkem souboru `vstup` a zapíše JSONL do `vystup`.
+    Pořadí výstupu odpovídá pořadí vstupu. V paměti je najednou nejvýše 2 × procesy dávek.
+
+    procesy : int | None
+        Počet pracovních procesů (None = počet CPU, 1 = bez poolu, v aktuálním procesu).
+
+    engine : str
+        Jádro sandhi ("python" / "regex"), viz SandhiProcessor.
+
+    Vrací počet zpracovaných řádků.
+    """
+
+    procesy = procesy or os.cpu_count() or 1
+    pocet = 0
+
+    with open(vstup, "r", encoding="utf-8") as f_in, open(vystup, "w", encoding="utf-8") as f_out:
+        davky = _davky(f_in, davka)
+
+        if procesy == 1:
+            _init_proces(json_file, engine)
+            for d in davky:
+                radky = _zpracuj_davku(d)
+                f_out.write("\n".join(radky) + "\n")
+                pocet += len(radky)
+            return pocet
+
+        with ProcessPoolExecutor(
+            max_workers=procesy, initializer=_init_proces, initargs=(json_file, engine)
+        ) as pool:
+            # rozpracované dávky ve frontě - výsledky se zapisují v pořadí zadání
+            fronta = deque(pool.submit(_zpracuj_davku, d) for d in islice(davky, 2 * procesy))
+            while fronta:
+                radky = fronta.popleft().result()
+                f_out.write("\n".join(radky) + "\n")
+                pocet += len(radky)
+
+                dalsi = next(davky, None)
+                if dalsi is not None:
+                    fronta.append(pool.submit(_zpracuj_davku, dalsi))
+
+    return pocet
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Hromadné provedení sandhi nad textovým souborem (jedna věta na řádek)."
+    )
+    parser.add_argument("vstup", help="vstupní UTF-8 soubor, věty v českém vědeckém přepisu")
+    parser.add_argument("vystup", help="výstupní soubor JSONL")
+    parser.add_argument("--pravidla", default="data/sandhi_pravidla.json", help="JSON s pravidly")
+    parser.add_argument("--procesy", type=int, default=None, help="počet procesů (výchozí = CPU)")
+    parser.add_argument("--davka", type=int, default=1000, help="počet řádků v jedné dávce")
+    parser.add_argument(
+        "--engine", choices=("python", "regex"), default="python", help="jádro sandhi"
+    )
+    args = parser.parse_args(argv)
+
+    pocet = zpracuj_soubor(
+        vstup=args.vstup,
+        vystup=args.vystup,
+        json_file=args.pravidla,
+        procesy=args.procesy,
+        davka=args.davka,
+        engine=args.engine,
+    )
+    print(f"Zpracováno řádků: {pocet} → {args.vystup}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,20 +13,27 @@
 # nova_veta, zmeny = proved_sandhi(veta, pravidla)
 
 # import
+import copy
+import hashlib
 import logging
+import os
 import sys
+import threading
 
 # import pytest
 import json
 import re
-import streamlit as st
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional
 
 # Vlastní moduly
-# from helpers.utils import urci_koncovku
-from helpers.ui_display import zobraz_toast
+# Procesor nezávisí na Streamlitu (session_state) - konfigurace jde přes konstruktor,
+# parametry slov (typ, pád, číslo) se předávají spolu s větou (SandhiToken)
+from helpers.lru_cache import LRUCache
+from helpers.sandhi_trace import SandhiTrace
+from helpers.sandhi_regex import SandhiRegex
+from helpers.snimek_dat import obsah_ze_snimku
 
 sys.dont_write_bytecode = True  # zakázat .pyc soubory
 
@@ -36,11 +43,52 @@ json_file = "data/sandhi_pravidla.json"
 # ==============================================================================================================================================
 
 
+class SandhiToken:
+    """
+    Slovo věty pro sandhi - tvar (český vědecký přepis) a parametry pro podmínky pravidel.
+    Odpovídá řádku matice_vety: typ "sub", pad "N", cislo "sg." (u slov bez pádu prázdné).
+    """
+
+    __slots__ = ("tvar", "typ", "pad", "cislo")
+
+    def __init__(self, tvar: str, typ: str = "", pad: str = "", cislo: str = ""):
+        self.tvar = tvar
+        self.typ = typ
+        self.pad = pad
+        self.cislo = cislo
+
+    @classmethod
+    def z_matice(cls, radek: dict, koncovka: str | None = None) -> "SandhiToken":
+        """
+        Token z řádku matice_vety (klíče s příponou koncovky, např. slovo_tran_cz_sub, pad_sub).
+        Koncovka odpovídá utils.urci_koncovku(typ), výchozí je typ řádku.
+        """
+        typ = radek.get("typ", "")
+        if koncovka is None:
+            koncovka = typ
+        return cls(
+            tvar=radek.get(f"slovo_tran_cz_{koncovka}", "") or "",
+            typ=typ,
+            pad=radek.get(f"pad_{koncovka}", "") or "",
+            cislo=radek.get(f"cislo_{koncovka}", "") or "",
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"SandhiToken({self.tvar!r}, typ={self.typ!r}, pad={self.pad!r}, cislo={self.cislo!r})"
+        )
+
+
+# ==============================================================================================================================================
+
+
 @dataclass
 class SandhiContext:
     # Index (pozice v seznamu slov)
     index_slovo: int = -1  # index pro slova ve větě
     index_vzor: int = None  # index pro vzory/náhrady v pravidlech
+    index_pravidlo: int = -1  # pořadí právě zkoušeného pravidla (pro trasování)
+    beh: int = 0  # číslo běhu v trasování (SandhiTrace.novy_beh)
     index_out: int = 0  # index pro log výstupu z procedury
     index_out_konci_na: int = 0  # index pro log výstupu z procedury _konci_na
     index_out_zacina_na: int = 0  # index pro log výstupu z procedury _zacina_na
@@ -77,6 +125,9 @@ class SandhiContext:
 
     # Vnitřní pole
     slova: List[str] = field(default_factory=list)
+    tokeny: List[Optional[SandhiToken]] = field(
+        default_factory=list
+    )  # parametry slov (None = neznámé)
     pravidlo: Optional[Dict] = field(default_factory=dict)
     pravidlo_typ: str = ""
     pravidlo_konec: str = ""
@@ -99,7 +150,10 @@ class SandhiProcessor:
         pravidla: list | None = None,
         *,
         f_cache: bool = True,
+        cache_velikost: int = 10_000,
         f_log: bool = False,
+        trace_velikost: int = 5_000,
+        engine: str = "python",
     ):
         """
         Inicializace SandhiEngine.
@@ -120,16 +174,43 @@ class SandhiProcessor:
         f_cache : bool
             Aktivovat výsledkový cache (urychlí transformace).
 
+        cache_velikost : int
+            Nejvyšší počet dvojic slov v cache (LRU).
+
         f_log : bool
-            Zapnout logování detailních informací.
+            Zapnout trasování průchodu pravidel (SandhiTrace v self.trace).
+
+        trace_velikost : int
+            Nejvyšší počet událostí v kruhovém bufferu trasování.
+
+        engine : str
+            Jádro vyhodnocení pravidel - "python" (referenční, krok po kroku)
+            nebo "regex" (tabulka pravidel zkompilovaná do jednoho výrazu, viz helpers.sandhi_regex).
         """
 
+        if engine not in ("python", "regex"):
+            raise ValueError(f"neznámé jádro sandhi: {engine}")
+
         # Nastavit logování
         self.f_log = f_log
         self.f_cache = f_cache
+        self.engine = engine
+
+        # Trasování - rozhodne se jednou zde, při vypnutém je self.trace None a volání se přeskakují
+        self.trace = SandhiTrace(max_udalosti=trace_velikost) if f_log else None
+
+        # Interní cache výsledků dvojic slov (LRU)
+        # klíč = (první, druhé, otisk pravidel, podmínky slova), hodnota = (nové první, nové druhé, typ pravidla | None)
+        self.cache = LRUCache(max_velikost=cache_velikost) if f_cache else None
 
-        # Interní cache
-        self.cache = {}  # klíč = vstupní věta, hodnota = výsledek
+        # Soubor pravidel se sleduje (a při změně znovu načte) jen pro části, které se z něj načetly
+        self.json_file = json_file
+        self._klice_ze_souboru = [
+            klic
+            for klic, hodnota in (("skupiny", skupiny), ("pravidla", pravidla))
+            if hodnota is None
+        ]
+        self._podpis_souboru = self._podpis(json_file) if self._klice_ze_souboru else None
 
         # načtení skupin/pravidel z param nebo souboru
         # if skupiny is not None:
@@ -150,13 +231,14 @@ class SandhiProcessor:
 
             # Použije se pouze tehdy, pokud nebylo předáno jako argument
             if skupiny is None:
-                self.skupiny = data.get("skupiny", {})
+                skupiny = data.get("skupiny", {})
             if pravidla is None:
-                self.pravidla = data.get("pravidla", [])
+                pravidla = data.get("pravidla", [])
 
-        # Atributy objektu (hluboké kopie pro bezpečnost)
-        self.skupiny = dict(skupiny) if skupiny is not None else {}
-        self.pravidla = list(pravidla) if pravidla is not None else []
+        # Atributy objektu (hluboké kopie - _prepare_rules pravidla normalizuje a předaná
+        # pravidla mohou být sdílená, např. ss["sandhi_pravidla"])
+        self.skupiny = copy.deepcopy(dict(skupiny))
+        self.pravidla = copy.deepcopy(list(pravidla))
 
         # Validace
         self._validate()
@@ -172,6 +254,47 @@ class SandhiProcessor:
         with open(json_file, "r", encoding="utf-8") as f:
             return json.load(f)
 
+    @staticmethod
+    def _podpis(cesta: str) -> tuple[int, int] | None:
+        """Podpis souboru (mtime, velikost) pro zjištění změny, None pokud soubor neexistuje."""
+        try:
+            st_soubor = os.stat(cesta)
+        except OSError:
+            return None
+        return st_soubor.st_mtime_ns, st_soubor.st_size
+
+    def _zkontroluj_pravidla(self):
+        """
+        Pokud se od načtení změnil soubor pravidel, načte ho znovu, překompiluje pravidla
+        a vyprázdní cache. Rozepsaný (neplatný) JSON se ignoruje a zkusí se příště.
+        """
+        if not self._klice_ze_souboru:
+            return
+
+        podpis = self._podpis(self.json_file)
+        if podpis == self._podpis_souboru:
+            return
+
+        try:
+            data = self._nacti_json(self.json_file) if podpis else {}
+        except (OSError, ValueError):
+            return
+
+        self._podpis_souboru = podpis
+        if "skupiny" in self._klice_ze_souboru:
+            self.skupiny = dict(data.get("skupiny", {}))
+        if "pravidla" in self._klice_ze_souboru:
+            self.pravidla = list(data.get("pravidla", []))
+
+        self._validate()
+        self._prepare_rules()
+        if self.cache is not None:
+            self.cache.clear()
+
+    def statistika_cache(self) -> dict:
+        """Statistika cache dvojic slov (zásahy, minutí, vytlačení), prázdná při f_cache = False."""
+        return self.cache.statistika() if self.cache is not None else {}
+
     # ==============================================================================================================================================
     def _validate(self):
         if not isinstance(self.skupiny, dict):
@@ -191,36 +314,170 @@ class SandhiProcessor:
             p["konec"] = p.get("konec", "") or ""
             p["zacatek"] = p.get("zacatek", "") or ""
 
+        # otisk sady pravidel - součást klíče cache
+        self.otisk = hashlib.sha1(
+            json.dumps(
+                {"skupiny": self.skupiny, "pravidla": self.pravidla},
+                sort_keys=True,
+                ensure_ascii=False,
+            ).encode("utf-8")
+        ).hexdigest()
+
+        # Kompilace indexu pravidel
+        # _trie_konec   - sufixová trie nad všemi vzory konců (vkládá se od posledního znaku)
+        # _trie_zacatek - prefixová trie nad všemi vzory začátků (skupiny "*..." rozbalené)
+        # v uzlu je pod klíčem None množina pořadí pravidel, jejichž vzor v tomto uzlu končí
+        self._trie_konec = {}
+        self._trie_zacatek = {}
+
+        # Paměť kompilace vzorů (skupiny rozbalené, "-" odstraněné, seřazeno od nejdelšího)
+        self._kompilace_konce = {}
+        self._kompilace_zacatku = {}
+
+        # pravidla s podmínkami na pád / číslo slova - jejich výsledek nezávisí jen na dvojici slov
+        self._podminena = {
+            idx
+            for idx, p in enumerate(self.pravidla)
+            if isinstance(p.get("podminky"), dict)
+            and (p["podminky"].get("pad") or p["podminky"].get("cislo"))
+        }
+
+        for idx, p in enumerate(self.pravidla):
+            for vz in self._vzory_konce(p["konec"]):
+                self._vloz_do_trie(self._trie_konec, reversed(vz), idx)
+            for vz in self._vzory_zacatku(p["zacatek"]):
+                self._vloz_do_trie(self._trie_zacatek, vz, idx)
+
+        # Zkompilovaná podoba pravidel (pro kontrolu / výpis), vzory jsou zároveň v paměti kompilace
+        self.zkompilovana = [
+            {
+                "typ": p.get("typ", ""),
+                "konec": self._konce_vzoru(p["konec"])[1],
+                "zacatek": self._zacatky_vzoru(p["zacatek"]),
+                "nahrada_konec": self._konce_vzoru(p.get("nahrada_konec", ""))[0],
+            }
+            for p in self.pravidla
+        ]
+
+        # Regex jádro - celá tabulka pravidel v jednom výrazu
+        self._regex = SandhiRegex(self.skupiny, self.pravidla) if self.engine == "regex" else None
+
     # ==============================================================================================================================================
-    def _log_pravidlo(self, ctx: SandhiContext, nadpis: str):
+    @staticmethod
+    def _klic_vzoru(vzor):
+        """Hashovatelný klíč vzoru pro paměť kompilace (seznamy → n-tice)."""
+        if isinstance(vzor, list):
+            return tuple(SandhiProcessor._klic_vzoru(v) for v in vzor)
+        return vzor
 
-        if not st.session_state["cfg"]["f_log"]:
-            return
+    def _konce_vzoru(self, vzor: str | list[str] | None) -> tuple[list, list[tuple[str, int]]]:
+        """
+        Zkompilovaný vzor konce (i náhrady konce): (vzory, seřazené).
+        vzory    - seznam po rozbalení skupiny (_normalize_vzor), v původním pořadí
+        seřazené - [(vzor bez "-", pořadí ve vzory)] od nejdelšího, v pořadí zkoušení v _konci_na;
+                   pořadí ve vzory je index pro f_dej_index_vzor
+        Počítá se jednou pro každý vzor (_prepare_rules), pak se bere z paměti.
+        """
+        klic = self._klic_vzoru(vzor)
+        vysledek = self._kompilace_konce.get(klic)
+        if vysledek is None:
+            vzory = self._normalize_vzor(vzor=vzor)
+            serazene = [
+                (v.strip("-"), vzory.index(v)) for v in sorted(vzory, key=len, reverse=True)
+            ]
+            vysledek = self._kompilace_konce[klic] = (vzory, serazene)
+        return vysledek
+
+    def _zacatky_vzoru(self, vzor: str | list[str] | None) -> list[str]:
+        """
+        Zkompilovaný vzor začátku - vzory bez "-" se skupinami rozbalenými, v pořadí zkoušení v _zacina_na
+        (seznam i skupina od nejdelšího). Počítá se jednou pro každý vzor, pak se bere z paměti.
+        """
+        klic = self._klic_vzoru(vzor)
+        vysledek = self._kompilace_zacatku.get(klic)
+        if vysledek is None:
+            vysledek = self._kompilace_zacatku[klic] = self._rozbal_zacatek(vzor)
+        return vysledek
 
-        log_txt = f"""
-        {nadpis}
-          index_out                         >{ctx.index_out}<
-          index_out_konci_na                >{ctx.index_out_konci_na}<
-          index_out_zacina_na               >{ctx.index_out_zacina_na}<
-          index_out_zpracuj_zacatek         >{ctx.index_out_zpracuj_zacatek}<
-          index_out_zpracuj_zacatek_nahrada >{ctx.index_out_zpracuj_zacatek_nahrada}<
-          f_nalezeno_vzor_konec             >{ctx.f_nalezeno_vzor_konec}<
-          f_nalezeno_nahrada_konec          >{ctx.f_nalezeno_nahrada_konec}<
-          f_nalezeno_vzor_zacatek           >{ctx.f_nalezeno_vzor_zacatek}<
-          f_nalezeno_nahrada_zacatek        >{ctx.f_nalezeno_nahrada_zacatek}<
-          f_continue                        >{ctx.f_continue}<
-          prvni                             >{ctx.prvni}<
-          druhe                             >{ctx.druhe}<
-          pravidlo_typ                      >{ctx.pravidlo.get('typ', '')}<
-          pravidlo_konec                    >{ctx.pravidlo.get('konec', '')}<
-          pravidlo_nahrada_konec            >{ctx.pravidlo.get('nahrada_konec', '')}<
-          pravidlo_zacatek                  >{ctx.pravidlo.get('zacatek', '')}<
-          pravidlo_nahrada_zacatek          >{ctx.pravidlo.get('nahrada_zacatek', '')}<
-          pravidlo_podminky                 >{ctx.pravidlo.get('podminky', '')}<
+    def _rozbal_zacatek(self, vzor: str | list[str] | None) -> list[str]:
+        if not vzor:
+            return []
+
+        # seznam může obsahovat i odkazy na skupiny
+        if isinstance(vzor, list):
+            return [
+                vz for v in sorted(vzor, key=len, reverse=True) for vz in self._rozbal_zacatek(v)
+            ]
+
+        vzor = vzor.strip("-")
+        if vzor.startswith("*"):
+            jmeno = vzor.strip("*-")
+            skupina = self.skupiny.get(jmeno, [])
+            return [z.strip("-") for z in sorted(skupina, key=len, reverse=True)]
+
+        return [vzor]
+
+    def _vzory_konce(self, vzor: str | list[str] | None) -> list[str]:
+        """Všechny neprázdné vzory konce pravidla, tak jak je porovnává _konci_na."""
+        return [vz for vz, _ in self._konce_vzoru(vzor)[1] if vz]
+
+    def _vzory_zacatku(self, vzor: str | list[str] | None) -> list[str]:
+        """Všechny neprázdné vzory začátku pravidla, tak jak je porovnává _zacina_na."""
+        return [vz for vz in self._zacatky_vzoru(vzor) if vz]
+
+    @staticmethod
+    def _vloz_do_trie(trie: dict, znaky, idx: int):
+        uzel = trie
+        for znak in znaky:
+            uzel = uzel.setdefault(znak, {})
+        uzel.setdefault(None, set()).add(idx)
+
+    @staticmethod
+    def _hledej_v_trie(trie: dict, znaky) -> set[int]:
+        """Projde trii po znacích a sesbírá pravidla všech vzorů, které jsou prefixem `znaky`."""
+        nalezeno = set()
+        uzel = trie
+        for znak in znaky:
+            uzel = uzel.get(znak)
+            if uzel is None:
+                break
+            nalezeno.update(uzel.get(None, ()))
+        return nalezeno
+
+    def _kandidati(self, prvni: str, druhe: str) -> list[int]:
+        """
+        Pořadí pravidel, jejichž konec sedí na konec prvního slova a začátek na začátek druhého.
+        Vrací je vzestupně, tj. se zachováním priority pravidel (první vhodné vyhrává).
+        Prázdné první slovo (po pravidle, které ho celé smazalo) v trie není - _konci_na pro ně
+        vrací náhradu podle pořadí, proto se zkoušejí všechna pravidla jako v původní smyčce.
         """
+        if not prvni:
+            return list(range(len(self.pravidla)))
+        konce = self._hledej_v_trie(self._trie_konec, reversed(prvni))
+        if not konce:
+            return []
+        return sorted(konce & self._hledej_v_trie(self._trie_zacatek, druhe))
 
-        if st.session_state["cfg"]["f_log"]:
-            logging.debug(log_txt)
+    # ==============================================================================================================================================
+    def _log_pravidlo(self, ctx: SandhiContext, nadpis: str):
+        """
+        Zaznamená krok zpracování do self.trace jako n-tici (bez formátování textu).
+        Volá se jen při zapnutém trasování (if self.trace is not None).
+        """
+        self.trace.zaznam(
+            ctx.beh,
+            nadpis,
+            ctx.index_slovo,
+            ctx.index_pravidlo,
+            ctx.prvni,
+            ctx.druhe,
+            ctx.f_nalezeno_vzor_konec
+            | ctx.f_nalezeno_nahrada_konec << 1
+            | ctx.f_nalezeno_vzor_zacatek << 2
+            | ctx.f_nalezeno_nahrada_zacatek << 3
+            | ctx.f_continue << 4
+            | ctx.f_break << 5,
+        )
 
     # ==============================================================================================================================================
 
@@ -240,48 +497,16 @@ class SandhiProcessor:
             ctx.index_out_zacina_na = 1
             return False, ""
 
-        # Pokud je vzorek typu list
-        if isinstance(vzor, list):
+        # vzory jsou již rozbalené (seznam, skupiny) a seřazené od nejdelšího - viz _zacatky_vzoru
+        # u kterého najde shodu vrátí True = našel jsem, a hodnotu vzorku začátku
+        for vz in self._zacatky_vzoru(vzor):
+            if slovo.startswith(vz):
+                ctx.index_out_zacina_na = 5
+                return True, vz
 
-            # Projde prvky seznamu (list) a volá samu sebe
-            for v in sorted(vzor, key=len, reverse=True):
-                f_nalezeno, z = self._zacina_na(ctx=ctx, slovo=slovo, vzor=v)
-                if f_nalezeno:
-                    ctx.index_out_zacina_na = 2
-                    return True, z
-
-            ctx.index_out_zacina_na = 3
-            return False, ""
-
-        vzor = vzor.strip("-")
-
-        # pokud začíná hvězdičkou pak za ní následuje název skupiny na kterou odkazuje
-        if vzor.startswith("*"):
-
-            # odstraní z názvu případné znaky
-            jmeno = vzor.strip("*-")
-            # pokud skupina tohoto jména nexistuje návrat, jinak pokračovat
-            if jmeno not in self.skupiny:
-                ctx.index_out_zacina_na = 4
-                return False, ""
-
-            vzor_sorted = sorted(self.skupiny[jmeno], key=len, reverse=True)
-            # seřadí prvky supiny (list) dle déky a pak bere jeden po druhém
-            for zacina in vzor_sorted:
-                vz = zacina.strip("-")
-                # a kontroluje jestli vzorek je na začátku slova
-                # u kterého najde shodu vrátí True = našel jsem, a hodnotu vzorku začátku
-                if slovo.startswith(vz):
-                    ctx.index_out_zacina_na = 5
-                    return True, vz
-            # nenajde-li žádný vhodný vzorek vrátí False = nenašel jsem, a prázdný řetězec""
-            ctx.index_out_zacina_na = 6
-            return False, ""
-        else:
-            vz = vzor
-            # kontroluje jestli je vzorek na začátku slova
-            ctx.index_out_zacina_na = 7
-            return (True, vz) if slovo.startswith(vz) else (False, "")
+        # nenajde-li žádný vhodný vzorek vrátí False = nenašel jsem, a prázdný řetězec""
+        ctx.index_out_zacina_na = 6
+        return False, ""
 
     def _normalize_vzor(self, vzor: str | list[str] | None) -> list[str]:
         # výchozí hodnota - neočekávaný typ
@@ -363,7 +588,8 @@ class SandhiProcessor:
         # )
 
         # Vždy dostaneme list nebo None
-        vzory = self._normalize_vzor(vzor=vzor)
+        # (spolu se seřazenými vzory a jejich pořadím z paměti kompilace - _konce_vzoru)
+        vzory, vzory_serazene = self._konce_vzoru(vzor)
 
         if not vzory:
             ctx.index_out_konci_na = 1
@@ -393,34 +619,18 @@ class SandhiProcessor:
                     ctx.index_out_konci_na = 5
                     return False, "", None
 
-        # 2. Normální režim – setřídit pokud netřeba zachovat pořadí
-        # Když je dej index - netřídit
-        vzory_sorted = sorted(vzory, key=len, reverse=True)
-
+        # 2. Normální režim – vzory seřazené od nejdelšího (předpočítané)
         # 3. Vyhodnocení jednotlivých vzorů
-        # Prohledávání seznamu — lokální index
-        # --- Vyhledání shody ---
-        # idx = 0
-        for idx, v in enumerate(vzory_sorted):
-            # položka listu - skupiny
-            vz = v.strip("-")
-
-            # slovo končí na položku ze skupiny na indexu idx
-            # Test konce
+        for vz, index in vzory_serazene:
+            # slovo končí na položku ze skupiny
             if slovo.endswith(vz):
                 # na skupinu není vázána náhrada konec ani začátek
                 # ctx.f_dej_index_vzor se používá pro seznam, list který je přímo v pravidle s odpovídajícími náhradami v pravidle
                 # primární list musí být unique, řazený vůči odpovídajícím sekundárním, pak musí být ctx.f_dej_index_vzor True
-                # ctx.vzor_konec = vz
-                # ctx.index = len(slovo) - len(vz)
-                # ctx.index_vzor = idx if ctx.f_dej_index_vzor else None
-                ctx.index_vzor = vzory.index(v) if ctx.f_dej_index_vzor else None
+                ctx.index_vzor = index if ctx.f_dej_index_vzor else None
                 # vrací - nalezeno, vzor, idx (musí být ctx.f_dej_index_vzor True pro pravidlo, False pro skupinu)
                 ctx.index_out_konci_na = 6
                 return True, vz, ctx.index_vzor
-            # idx = idx + 1
-
-            # return True, vz, (idx if not ctx.f_dej_index_vzor else ctx.index_vzor)
 
         # když slovo nekončí na žádnou položku ze skupiny
         # vrací - nalezeno, vzor, idx (musí být ctx.f_dej_index_vzor True pro pravidlo, False pro skupinu)
@@ -500,7 +710,8 @@ class SandhiProcessor:
         ctx.index_out = 4
 
         # Logging
-        self._log_pravidlo(ctx=ctx, nadpis="Nalezen konec:")
+        if self.trace is not None:
+            self._log_pravidlo(ctx=ctx, nadpis="Nalezen konec:")
 
         return ctx
 
@@ -616,7 +827,8 @@ class SandhiProcessor:
             ctx.index_out_zpracuj_zacatek = 2
 
             # Logging
-            self._log_pravidlo(ctx=ctx, nadpis="Nenalezen začátek:")
+            if self.trace is not None:
+                self._log_pravidlo(ctx=ctx, nadpis="Nenalezen začátek:")
 
             return ctx
 
@@ -626,7 +838,8 @@ class SandhiProcessor:
             ctx.index_out_zpracuj_zacatek = 3
 
             # Logging
-            self._log_pravidlo(ctx=ctx, nadpis="Nenalezen vzor začátek:")
+            if self.trace is not None:
+                self._log_pravidlo(ctx=ctx, nadpis="Nenalezen vzor začátek:")
 
             return ctx
 
@@ -636,7 +849,8 @@ class SandhiProcessor:
 
         # --- 3. LOG nalezeného začátku ---
         # Logging
-        self._log_pravidlo(ctx=ctx, nadpis="Nalezen začátek:")
+        if self.trace is not None:
+            self._log_pravidlo(ctx=ctx, nadpis="Nalezen začátek:")
 
         return ctx
 
@@ -647,8 +861,6 @@ class SandhiProcessor:
         Pokud podmínky nesplňují (např. !pad, !cislo) -> ctx.f_continue = True (není vhodné pravidlo).
         """
 
-        from helpers.utils import urci_koncovku
-
         # return f_continue, spojeni, nahrada_zacatek, pravidlo_typ
 
         ctx.f_continue = False
@@ -687,53 +899,27 @@ class SandhiProcessor:
         # prav_typ = ctx.pravidlo.get('typ', '')
         podminky = ctx.pravidlo.get("podminky", {})
 
+        # podmínky se vztahují k prvnímu slovu dvojice, v JSON jsou seznamy (["!du."]) i řetězce ("!V")
+        # neznámý pád / číslo (slovo bez parametrů) podmínku neporušuje
         if podminky:
-            podm_pad = podminky.get("pad", "")
-            podm_cislo = podminky.get("cislo", "")
-
-            # if not podm_pad == "" or not podm_cislo == "":
-            if podm_pad or podm_cislo:
-                # aktualni_slovo = st.session_state['matice_vety'][i]
-                aktualni_slovo = (
-                    ctx.slova[ctx.index_slovo]
-                    if ctx.slova and 0 <= ctx.index_slovo < len(ctx.slova)
-                    else None
-                )
-                if aktualni_slovo:
-                    # najít koncovku (typ) a pád v řádku tvaru, podobně jako jinde v kódu
-                    aktualni_typ = aktualni_slovo.get("typ", "")
-                    slovni_druh = st.session_state["slovni_druh"]
-
-                    r_typ = next(
-                        (r for r in slovni_druh if r["typ"] == aktualni_typ), slovni_druh[0]
-                    )
-
-                    koncovka = urci_koncovku(r_typ["typ"])  # (utils.py)
-                    # koncovka = r_typ['typ']
-
-                    aktualni_pad = aktualni_slovo.get(f"pad_{koncovka}", "")
-                    aktualni_cislo = aktualni_slovo.get(f"cislo_{koncovka}", "")
-
-                if podm_pad and podm_pad.startswith("!"):
-                    podm_ne_pad = podm_pad.strip("!")
-                    # Nesmí být tento pád, tento pád ne sandhi
-                    # Ikdyž jsem slova nabral tak je nemusím vracet pokud je bez sandhi
-                    if aktualni_pad == podm_ne_pad:
-                        ctx.f_continue = True  # další slovo
-                        ctx.index_out_zpracuj_zacatek_nahrada = 2
-                        return ctx
-
-                if podm_cislo and podm_cislo.startswith("!"):
-                    podm_ne_cislo = podm_cislo.strip("!")
-                    # Nesmí být toto číslo, toto číslo ne sandhi
-                    # Ikdyž jsem slova nabral tak je nemusím vracet pokud je bez sandhi
-                    if aktualni_cislo == podm_ne_cislo:
-                        ctx.f_continue = True  # další slovo
-                        ctx.index_out_zpracuj_zacatek_nahrada = 3
-                        return ctx
-        else:
-            podm_cislo = ""
-            podm_pad = ""
+            token = ctx.tokeny[ctx.index_slovo] if ctx.index_slovo < len(ctx.tokeny) else None
+            aktualni_pad = token.pad if token is not None else ""
+            aktualni_cislo = token.cislo if token is not None else ""
+
+            for podm_pad in self._seznam_podminek(podminky.get("pad")):
+                # Nesmí být tento pád, tento pád ne sandhi
+                # Ikdyž jsem slova nabral tak je nemusím vracet pokud je bez sandhi
+                if podm_pad.startswith("!") and aktualni_pad == podm_pad.strip("!"):
+                    ctx.f_continue = True  # další slovo
+                    ctx.index_out_zpracuj_zacatek_nahrada = 2
+                    return ctx
+
+            for podm_cislo in self._seznam_podminek(podminky.get("cislo")):
+                # Nesmí být toto číslo, toto číslo ne sandhi
+                if podm_cislo.startswith("!") and aktualni_cislo == podm_cislo.strip("!"):
+                    ctx.f_continue = True  # další slovo
+                    ctx.index_out_zpracuj_zacatek_nahrada = 3
+                    return ctx
 
         # pokud jsme došli sem => náhrada začátku platí
         ctx.f_nalezeno_nahrada_zacatek = True
@@ -742,6 +928,15 @@ class SandhiProcessor:
         ctx.index_out_zpracuj_zacatek_nahrada = 4
         return ctx
 
+    @staticmethod
+    def _seznam_podminek(podminka: str | list[str] | None) -> list[str]:
+        """Podmínka pravidla jako seznam neprázdných hodnot ("!V" → ["!V"], None → [])."""
+        if not podminka:
+            return []
+        if isinstance(podminka, str):
+            return [podminka]
+        return [p for p in podminka if isinstance(p, str) and p]
+
     def _nahrada_nahrada(self, ctx: SandhiContext) -> SandhiContext:
         """
         Provede náhradu podle pravidla a vrátí (f_break, slova, zmeny)
@@ -795,7 +990,8 @@ class SandhiProcessor:
         ctx.druhe = ctx.slova[ctx.index_slovo + 1]
 
         # Logging
-        self._log_pravidlo(ctx=ctx, nadpis="Výsledek:")
+        if self.trace is not None:
+            self._log_pravidlo(ctx=ctx, nadpis="Výsledek:")
 
         ctx.f_break = True  # první vhodná varianta
         return ctx
@@ -807,9 +1003,9 @@ class SandhiProcessor:
         i = ctx.index_slovo
         nove_druhe = ctx.slova[i + 1]
 
-        if not ctx.f_nalezeno_vzor_konec or (
-            ctx.f_nalezeno_vzor_konec and not ctx.f_nalezeno_vzor_zacatek
-        ):
+        # žádné pravidlo nebylo použito → slova se jen oddělí mezerou
+        # (příznaky nalezení vzorů patří poslednímu prověřenému kandidátovi, ne celé dvojici)
+        if not ctx.f_break:
             ctx.spojeni = " "
             nove_druhe = ctx.spojeni + ctx.druhe
             ctx.slova[i + 1] = nove_druhe
@@ -820,23 +1016,49 @@ class SandhiProcessor:
         #   f_nalezeno_vzor_zacatek  >{ctx.f_nalezeno_vzor_zacatek}<
         #   nove_druhe               >{nove_druhe}<
         # """
-        log_txt = f"""Za slovem:
-          nove_druhe                  >{nove_druhe}<
-        """
-        self._log_pravidlo(ctx=ctx, nadpis=log_txt)
+        if self.trace is not None:
+            self._log_pravidlo(ctx=ctx, nadpis="Za slovem:")
+
+    def _pouzij_z_pameti(self, ctx: SandhiContext, vysledek: tuple[str, str, str | None]):
+        """Zapíše do ctx dříve spočtený výsledek dvojice (nové první, nové druhé, typ pravidla)."""
+        i = ctx.index_slovo
+        nove_prvni, nove_druhe, typ = vysledek
+
+        if typ is not None:
+            ctx.zmeny.append(
+                {
+                    "index_slovo": i,
+                    "puvod": ctx.prvni + " " + ctx.druhe,
+                    "novy": nove_prvni + nove_druhe,
+                    "pravidlo": typ,
+                }
+            )
+
+        ctx.slova[i] = nove_prvni
+        ctx.slova[i + 1] = nove_druhe
 
     def zaver_2(self, ctx: SandhiContext):
 
         # Logging
-        self._log_pravidlo(ctx=ctx, nadpis="KONEC:")
+        if self.trace is not None:
+            self._log_pravidlo(ctx=ctx, nadpis="KONEC:")
 
-    def aplikuj_sandhi(self, veta: str) -> tuple[str, list]:
+    def aplikuj_sandhi(
+        self, veta: str, parametry: list[dict] | None = None, *, beh: int | None = None
+    ) -> tuple[str, list]:
         """
         Hlavní vstupní bod procesoru Sandhi.
         Přijímá větu jako string.
         Aplikuje pravidla Sandhi podle JSON struktury pomocí SandhiContext.
         Vrací výslednou větu a seznam změn
         (věta_po_sandhi, seznam_změn).
+
+        parametry : list[dict] | None
+            Parametry slov věty ve stejném pořadí jako slova, {"typ": "sub", "pad": "N", "cislo": "sg."}.
+            Používají se pro podmínky pravidel (pad, cislo). Bez nich se podmínky považují za splněné.
+        beh : int | None
+            Číslo běhu pro trasování (self.trace.novy_beh()) - události věty pak jdou vybrat
+            self.trace.udalosti(beh=beh). Bez něj dostane věta nové číslo.
         """
 
         # 1. Split (rozdělení) na slova
@@ -844,6 +1066,107 @@ class SandhiProcessor:
         if not slova:
             return "", []
 
+        tokeny = None
+        if parametry:
+            tokeny = [
+                (
+                    SandhiToken(
+                        tvar=slovo,
+                        typ=p.get("typ", "") or "",
+                        pad=p.get("pad", "") or "",
+                        cislo=p.get("cislo", "") or "",
+                    )
+                    if p
+                    else None
+                )
+                for slovo, p in zip(slova, parametry)
+            ]
+
+        self._zkontroluj_pravidla()
+        return self._aplikuj_na_slova(slova, pamet=self.cache, tokeny=tokeny, beh=beh)
+
+    def aplikuj_sandhi_tokeny(
+        self, tokeny: Iterable[SandhiToken], *, beh: int | None = None
+    ) -> tuple[str, list]:
+        """
+        Vstupní bod pro větu jako posloupnost tokenů (např. z matice_vety, SandhiToken.z_matice).
+        Podmínky pravidel (pad, cislo) se vyhodnotí z parametrů tokenů.
+        Tvar tokenu s mezerou se rozdělí na slova, parametry nese poslední z nich (koncovka).
+        Vrací (věta_po_sandhi, seznam_změn) jako aplikuj_sandhi, beh viz aplikuj_sandhi.
+        """
+
+        slova, tokeny_slov = self._rozloz_tokeny(tokeny)
+        if not slova:
+            return "", []
+
+        self._zkontroluj_pravidla()
+        return self._aplikuj_na_slova(slova, pamet=self.cache, tokeny=tokeny_slov, beh=beh)
+
+    @staticmethod
+    def _rozloz_tokeny(
+        tokeny: Iterable[SandhiToken],
+    ) -> tuple[list[str], list[SandhiToken | None]]:
+        """Slova tokenů (tvar rozdělený podle mezer) a k nim tokeny s parametry."""
+        slova = []
+        tokeny_slov = []
+        for token in tokeny:
+            casti = token.tvar.split()
+            if not casti:
+                continue
+            slova.extend(casti)
+            tokeny_slov.extend([None] * (len(casti) - 1))
+            tokeny_slov.append(token)
+        return slova, tokeny_slov
+
+    def aplikuj_sandhi_batch(
+        self, vety: Iterable[str | list[str] | list[SandhiToken]], pamet: dict | None = None
+    ) -> Iterator[tuple[str, list]]:
+        """
+        Dávkové zpracování vět (korpusy, generované věty offline).
+        Přijímá iterovatelnou posloupnost vět - string, již rozdělený seznam slov, nebo seznam tokenů.
+        Postupně vrací (věta_po_sandhi, seznam_změn) ve stejném pořadí jako vstup.
+
+        Zkompilovaná pravidla i paměť výsledků dvojic slov jsou společné pro celou dávku,
+        takže se každá dvojice (konec, začátek) vyhodnotí pravidly jen jednou.
+        Paměť je cache procesoru (self.cache), případně předaný slovník / LRUCache `pamet`.
+        """
+
+        self._zkontroluj_pravidla()
+        if pamet is None:
+            pamet = self.cache
+
+        for veta in vety:
+            tokeny = None
+            if isinstance(veta, str):
+                slova = veta.split()
+            elif any(isinstance(s, SandhiToken) for s in veta):
+                slova, tokeny = self._rozloz_tokeny(veta)
+            else:
+                slova = [s for s in veta if s]
+            if not slova:
+                yield "", []
+                continue
+
+            yield self._aplikuj_na_slova(slova, pamet=pamet, tokeny=tokeny)
+
+    def _aplikuj_na_slova(
+        self,
+        slova: list[str],
+        pamet: dict | None = None,
+        tokeny: list[SandhiToken | None] | None = None,
+        beh: int | None = None,
+    ) -> tuple[str, list]:
+        """
+        Aplikuje pravidla na seznam slov jedné věty.
+        pamet : dict | LRUCache | None
+            Paměť výsledků dvojic slov sdílená mezi voláními (self.cache, aplikuj_sandhi_batch).
+            U dvojic, na které se mohou vztahovat podmíněná pravidla, je součástí klíče pád a číslo.
+        tokeny : list[SandhiToken | None] | None
+            Parametry slov pro podmínky pravidel (pad, cislo), ve stejném pořadí jako slova.
+        beh : int | None
+            Číslo běhu pro trasování, None = nové.
+        """
+
         # 2. Inicializace kontextu
         ctx = SandhiContext(
             index_slovo=-1,
@@ -852,6 +1175,7 @@ class SandhiProcessor:
             druhe="",
             slovo="",
             slova=slova.copy(),
+            tokeny=list(tokeny or []),
             zmeny=[],
             spojeni=" ",
             pravidlo={},
@@ -867,6 +1191,9 @@ class SandhiProcessor:
             f_continue=False,
             f_break=False,
         )
+        # události věty v trasování označí vlastní číslo běhu
+        if self.trace is not None:
+            ctx.beh = beh if beh is not None else self.trace.novy_beh()
 
         # ----- Hlavní smyčka - procházení slov ------------
         # Pro každá dvě po sobě jdoucí slova
@@ -880,6 +1207,7 @@ class SandhiProcessor:
             ctx.spojeni = " "
 
             ctx.pravidlo = {}
+            ctx.index_pravidlo = -1
             ctx.vzor_konec = ""
             ctx.vzor_zacatek = ""
             ctx.nahrada_konec = ""
@@ -894,11 +1222,51 @@ class SandhiProcessor:
 
             # druhe = spojeni + druhe
 
+            kandidati = self._kandidati(ctx.prvni, ctx.druhe)
+
+            # 3. Dvojice už byla vyhodnocena (cache)
+            # bez kandidátů není co ukládat, podmíněná pravidla závisí i na parametrech slova
+            klic = None
+            if pamet is not None and kandidati:
+                podminky_slova = None
+                if not self._podminena.isdisjoint(kandidati):
+                    token = ctx.tokeny[i] if i < len(ctx.tokeny) else None
+                    podminky_slova = (token.pad, token.cislo) if token is not None else ("", "")
+                klic = (ctx.prvni, ctx.druhe, self.otisk, podminky_slova)
+                vysledek = pamet.get(klic)
+                if vysledek is not None:
+                    self._pouzij_z_pameti(ctx, vysledek)
+                    if self.trace is not None:
+                        self._log_pravidlo(ctx=ctx, nadpis="Z cache:")
+                    continue
+
+            # 4a. Regex jádro - první použitelné pravidlo jedním porovnáním
+            # (prázdné první slovo má v _konci_na zvláštní chování, to řeší referenční smyčka)
+            if self._regex is not None and kandidati and ctx.prvni:
+                token = ctx.tokeny[i] if i < len(ctx.tokeny) else None
+                nove_prvni, nove_druhe, idx_pravidlo = self._regex.vyhodnot(
+                    ctx.prvni, ctx.druhe, token
+                )
+                vysledek = (
+                    nove_prvni,
+                    nove_druhe,
+                    self._regex.typ(idx_pravidlo) if idx_pravidlo is not None else None,
+                )
+                self._pouzij_z_pameti(ctx, vysledek)
+                if klic is not None:
+                    pamet[klic] = vysledek
+                if self.trace is not None:
+                    ctx.index_pravidlo = -1 if idx_pravidlo is None else idx_pravidlo
+                    self._log_pravidlo(ctx=ctx, nadpis="Regex:")
+                continue
+
             # 4. Procházení pravidel
             # Iterace přes pravidla - hledáme první relevantní
-            for pravidlo in self.pravidla:  # načtou se v __init__
+            # jen kandidáti z indexu (konec i začátek sedí), v původním pořadí pravidel
+            for idx_pravidlo in kandidati:
                 # načte vzorek pravidla - řádek
-                ctx.pravidlo = pravidlo
+                ctx.pravidlo = self.pravidla[idx_pravidlo]
+                ctx.index_pravidlo = idx_pravidlo
 
                 # log_txt = f"""
                 # Začátek cyklu pravidel:
@@ -917,7 +1285,8 @@ class SandhiProcessor:
                 # --- KONEC ---
                 # Zpracování konce prvního slova
                 ctx = self._zpracuj_konec(ctx)
-                self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_konec:")
+                if self.trace is not None:
+                    self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_konec:")
 
                 if ctx.f_continue:
                     continue  # další pravidlo
@@ -936,7 +1305,8 @@ class SandhiProcessor:
                     # --- náhrada konce ---
                     # Zpracování náhrady konce
                     ctx = self._zpracuj_konec_nahrada(ctx)
-                    self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_konec_nahrada:")
+                    if self.trace is not None:
+                        self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_konec_nahrada:")
 
                     if ctx.f_continue:
                         continue  # další pravidlo
@@ -944,7 +1314,8 @@ class SandhiProcessor:
                     # --- začátek ---
                     # Zpracování začátku druhého slova
                     ctx = self._zpracuj_zacatek(ctx)
-                    self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_zacatek:")
+                    if self.trace is not None:
+                        self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_zacatek:")
 
                     if ctx.f_continue:
                         continue  # další pravidlo
@@ -952,7 +1323,8 @@ class SandhiProcessor:
                     # --- náhrada začátku ---
                     # Náhrada začátku
                     ctx = self._zpracuj_zacatek_nahrada(ctx)
-                    self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_zacatek_nahrada:")
+                    if self.trace is not None:
+                        self._log_pravidlo(ctx=ctx, nadpis="Po _zpracuj_zacatek_nahrada:")
 
                     if ctx.f_continue:
                         continue  # další pravidlo
@@ -961,7 +1333,8 @@ class SandhiProcessor:
                     # Pokud obě strany mají nalezené vzory, a náhrady proveď vlastní náhradu
                     # (metoda _nahrada_nahrada by měla upravit ctx.slovo a ctx.druhe, doplnit ctx.zmeny a nastavit ctx.f_break = True)
                     ctx = self._nahrada_nahrada(ctx)
-                    self._log_pravidlo(ctx=ctx, nadpis="Po _nahrada_nahrada:")
+                    if self.trace is not None:
+                        self._log_pravidlo(ctx=ctx, nadpis="Po _nahrada_nahrada:")
 
                     # po úspěšné náhradě přerušujeme hledání dalších pravidel pro tuto dvojici
                     if ctx.f_break:
@@ -996,17 +1369,27 @@ class SandhiProcessor:
             # Konec smyčky přes pravidla pro tuto dvojici
             # Provést závěrečné zpracování/report (volitelně)
             self.zaver_1(ctx)
-            self._log_pravidlo(ctx=ctx, nadpis="Po zaver_1:")
+            if self.trace is not None:
+                self._log_pravidlo(ctx=ctx, nadpis="Po zaver_1:")
+
+            # Uložení výsledku dvojice do cache
+            if klic is not None:
+                pamet[klic] = (
+                    ctx.slova[i],
+                    ctx.slova[i + 1],
+                    ctx.pravidlo.get("typ", "") if ctx.f_break else None,
+                )
 
         # End for slova
-        # Chybí zpracování podmínek - pád, číslo - nutno předat i větu s parametry slov
+        # Podmínky - pád, číslo - se berou z tokenů (aplikuj_sandhi_tokeny, parametry v aplikuj_sandhi)
         # Jak je ošetřeno když nemají vzor aby slova nevypadla.
         # Beru slova a vracím změny, když nevrátím změny zůstává původní.
 
         # 6. Celkový závěr
         # Konec hlavní smyčky přes dvojice
         self.zaver_2(ctx)
-        self._log_pravidlo(ctx=ctx, nadpis="Po zaver_2:")
+        if self.trace is not None:
+            self._log_pravidlo(ctx=ctx, nadpis="Po zaver_2:")
 
         # 7. Výsledná věta
         # Spojení všech ne-prázdných tokenů (pozor: ctx.druhe může již obsahovat počáteční mezeru/spojení)
@@ -1017,6 +1400,84 @@ class SandhiProcessor:
         return vysledna_veta, ctx.zmeny
 
 
+# ==============================================================================================================================================
+# Sdílené zkompilované procesory
+#
+# Jeden SandhiProcessor na obsah souboru pravidel pro celý proces (všechny sessions a reruny Streamlitu).
+# Klíčem je hash obsahu souboru, takže stejná pravidla pod jinou cestou použijí tentýž procesor
+# a změna souboru vytvoří nový. Sdílený procesor soubor sám nesleduje (pravidla jsou neměnná),
+# jeho cache dvojic slov je mezi vlákny chráněná zámkem (LRUCache).
+
+_MAX_SDILENYCH_PROCESORU = 8
+
+_sdilene_procesory: dict[tuple[str, bool], SandhiProcessor] = {}  # (hash obsahu, f_log) → procesor
+_sdilene_podpisy: dict[str, tuple] = {}  # cesta → (podpis souboru, hash obsahu)
+_sdilene_zamek = threading.Lock()
+
+
+def sdileny_procesor(json_file: str = json_file, *, f_log: bool = False) -> SandhiProcessor:
+    """
+    Vrátí zkompilovaný SandhiProcessor sdílený v rámci procesu.
+
+    Soubor se čte a hashuje jen při změně podpisu (mtime, velikost), jinak stojí volání jeden os.stat.
+    Neexistující soubor odpovídá prázdným pravidlům (stejně jako v SandhiProcessor.__init__).
+    """
+    podpis = SandhiProcessor._podpis(json_file)
+
+    with _sdilene_zamek:
+        znamy = _sdilene_podpisy.get(json_file)
+        obsah = None
+        if znamy is not None and podpis is not None and znamy[0] == podpis:
+            hash_obsahu = znamy[1]
+        else:
+            obsah = _nacti_obsah(json_file) if podpis else b""
+            hash_obsahu = hashlib.sha1(obsah).hexdigest()
+            _sdilene_podpisy[json_file] = (podpis, hash_obsahu)
+
+        klic = (hash_obsahu, f_log)
+        procesor = _sdilene_procesory.get(klic)
+        if procesor is not None:
+            return procesor
+
+        if obsah is None:
+            obsah = _nacti_obsah(json_file)
+        data = json.loads(obsah) if obsah else {}
+        procesor = SandhiProcessor(
+            json_file=json_file,
+            skupiny=data.get("skupiny", {}),
+            pravidla=data.get("pravidla", []),
+            f_log=f_log,
+        )
+
+        # nejstarší procesory (zastaralé verze souboru) se uvolní
+        while len(_sdilene_procesory) >= _MAX_SDILENYCH_PROCESORU:
+            _sdilene_procesory.pop(next(iter(_sdilene_procesory)))
+        _sdilene_procesory[klic] = procesor
+        return procesor
+
+
+def statistika_sdilenych_procesoru() -> dict[str, dict]:
+    """Statistika cache dvojic slov sdílených procesorů {"hash[:8] (f_log)": statistika}."""
+    with _sdilene_zamek:
+        procesory = list(_sdilene_procesory.items())
+    return {
+        f"{hash_obsahu[:8]}{' (f_log)' if f_log else ''}": procesor.statistika_cache()
+        for (hash_obsahu, f_log), procesor in procesory
+    }
+
+
+def _nacti_obsah(cesta: str) -> bytes:
+    # obsah ze snímku dat (snimek_dat), pokud v něm soubor je a nezměnil se
+    obsah = obsah_ze_snimku(cesta)
+    if obsah is not None:
+        return obsah
+    try:
+        with open(cesta, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
 # ==============================================================================================================================================
 
 if __name__ == "__main__":
@@ -0,0 +1,320 @@
+# helpers/sandhi_regex.py
+# SandhiRegex, porovnej_jadra, main
+#
+# Alternativní jádro sandhi (apply_sandhi_regex) - celá tabulka pravidel se rozbalenými skupinami
+# se zkompiluje do jednoho ukotveného regulárního výrazu nad hranicí dvojice slov:
+#
+#     obracene(prvni) + "\x00" + druhe
+#
+# Každé pravidlo je jedna větev alternace (v pořadí pravidel), takže re.match najde první použitelné
+# pravidlo jedním průchodem v C místo smyčky přes pravidla v Pythonu (_zpracuj_konec, _zpracuj_zacatek, ...).
+# Vzory konce se porovnávají na obráceném prvním slově, pořadí alternativ odpovídá pořadí,
+# ve kterém je zkouší referenční jádro (_konci_na, _zacina_na), a tím i výběr nalezeného vzoru.
+#
+# Vše, co referenční jádro rozhoduje až po nalezení vzoru, se rozhodne při kompilaci:
+#   - náhrada konce pro každý vzor konce (včetně f_dej_index_vzor), nepoužitelné náhrady pravidlo vyřadí,
+#   - spojení a náhrada začátku,
+#   - podmínky pad / cislo - pro každou kombinaci vyřazených pravidel se výraz zkompiluje zvlášť (líně).
+#
+# Použití: SandhiProcessor(json_file, engine="regex")
+# Rozdílový test proti referenčnímu jádru:
+# python -m helpers.sandhi_regex vety.txt --pravidla data/sandhi_pravidla.json
+
+# import
+import argparse
+import itertools
+import re
+import sys
+
+from typing import Iterable
+
+# hranice mezi (obráceným) prvním a druhým slovem - ve slovech se nevyskytuje
+HRANICE = "\x00"
+
+
+class SandhiRegex:
+
+    def __init__(self, skupiny: dict, pravidla: list):
+        """
+        skupiny, pravidla : dict, list
+            Stejná data jako v SandhiProcessor (po _prepare_rules).
+        """
+        self.skupiny = skupiny
+        self.pravidla = pravidla
+
+        # zkompilovaná pravidla - index pravidla → (konce, začátky, spojení, náhrada začátku, typ)
+        # konce = [(název skupiny v regexu, délka vzoru, náhrada konce)]
+        self.zkompilovana = {}
+        # podmíněná pravidla - index pravidla → (zakázané pády, zakázaná čísla)
+        self.podminena = {}
+        # výrazy podle množiny vyřazených (podmínkou nesplněných) pravidel
+        self._vyrazy = {}
+        self._vetve = {}
+
+        for idx, p in enumerate(pravidla):
+            self._zkompiluj_pravidlo(idx, p)
+
+        self._vyrazy[frozenset()] = self._sestav_vyraz(frozenset())
+
+    # ==============================================================================================================================================
+    # Kompilace
+
+    def _normalize_vzor(self, vzor) -> list:
+        """Seznam vzorů jako SandhiProcessor._normalize_vzor (seznam, skupina "*...", hodnota)."""
+        if isinstance(vzor, list):
+            return vzor
+        if isinstance(vzor, str):
+            vz = vzor.strip("-")
+            if vz.startswith("*"):
+                return self.skupiny.get(vz.strip("*-"), [])
+            return [vz]
+        return []
+
+    def _vzory_konce(self, vzor) -> list:
+        """Vzory konce v pořadí zkoušení (_konci_na): [(surový vzor, pořadí v seznamu)]."""
+        vzory = self._normalize_vzor(vzor)
+        return [(v, vzory.index(v)) for v in sorted(vzory, key=len, reverse=True)]
+
+    def _vzory_zacatku(self, vzor) -> list[str]:
+        """Vzory začátku v pořadí zkoušení (_zacina_na), již bez "-"."""
+        if not vzor:
+            return []
+
+        if isinstance(vzor, list):
+            return [
+                vz for v in sorted(vzor, key=len, reverse=True) for vz in self._vzory_zacatku(v)
+            ]
+
+        vzor = vzor.strip("-")
+        if vzor.startswith("*"):
+            jmeno = vzor.strip("*-")
+            if jmeno not in self.skupiny:
+                return []
+            return [z.strip("-") for z in sorted(self.skupiny[jmeno], key=len, reverse=True)]
+
+        return [vzor]
+
+    def _nahrada_konce(self, pravidlo: dict, index_vzor: int | None) -> str | None:
+        """Náhrada konce pro nalezený vzor (_zpracuj_konec_nahrada), None = pravidlo se nepoužije."""
+        konec_nahr = pravidlo.get("nahrada_konec", "")
+        if not konec_nahr:
+            return None
+        if konec_nahr == "_":
+            return "_"
+        if konec_nahr == "x":
+            return ""  # vypustit konec - v _nahrada_nahrada stejné jako prázdná náhrada
+
+        vzory = self._normalize_vzor(konec_nahr)
+        if not vzory:
+            return None
+
+        if index_vzor is not None:
+            nahrada = vzory[index_vzor] if index_vzor < len(vzory) else ""
+        elif len(vzory) == 1:
+            nahrada = vzory[0]
+        else:
+            # prázdné "slovo" končí jen na prázdný vzor - ten se ale jako náhrada nepoužije
+            nahrada = ""
+
+        return nahrada or None
+
+    def _zkompiluj_pravidlo(self, idx: int, p: dict):
+        """Předpočítá vše, co pravidlo potřebuje; pravidla, která se nemohou použít, vynechá."""
+        konec = p.get("konec", "")
+        zacatek = p.get("zacatek", "")
+        nahrada_zacatek = p.get("nahrada_zacatek", "")
+        if not konec or not zacatek or not isinstance(nahrada_zacatek, str):
+            return
+
+        podminky = p.get("podminky", {}) or {}
+        f_dej_index_vzor = bool(podminky.get("f_dej_index_vzor", False))
+
+        # konce - první prázdný vzor se vždy "najde" a pravidlo vyřadí, vzory za ním se nezkouší
+        konce = []
+        for v, index_vzor in self._vzory_konce(konec):
+            vz = v.strip("-")
+            if not vz:
+                break
+            nahrada = self._nahrada_konce(p, index_vzor if f_dej_index_vzor else None)
+            konce.append((vz, nahrada))
+        if not any(nahrada is not None for _, nahrada in konce):
+            return
+
+        # začátky - totéž pro první prázdný vzor
+        zacatky = list(itertools.takewhile(bool, self._vzory_zacatku(zacatek)))
+        if not zacatky:
+            return
+
+        zacatek_nahr = nahrada_zacatek.strip("-")
+        if not zacatek_nahr:
+            return
+        if zacatek_nahr.startswith("+"):
+            spojeni, zacatek_nahr = "", zacatek_nahr.strip("+")
+        else:
+            spojeni = " "
+
+        # větev regexu - vzor konce, který vede na nepoužitelnou náhradu, zastíní všechny další vzory
+        alternativy = []
+        skupiny_konce = []
+        zastinene = []
+        for j, (vz, nahrada) in enumerate(konce):
+            vz_obracene = re.escape(vz[::-1])
+            if nahrada is None:
+                zastinene.append(vz_obracene)
+                continue
+            jmeno = f"k{idx}_{j}"
+            predpoklad = "".join(f"(?!{z})" for z in zastinene)
+            alternativy.append(f"{predpoklad}(?P<{jmeno}>{vz_obracene})")
+            skupiny_konce.append((jmeno, len(vz), nahrada))
+
+        vetev = (
+            f"(?:{'|'.join(alternativy)})[^{HRANICE}]*{HRANICE}"
+            f"(?P<z{idx}>{'|'.join(re.escape(z) for z in zacatky)})"
+        )
+
+        self._vetve[idx] = vetev
+        self.zkompilovana[idx] = (skupiny_konce, spojeni, zacatek_nahr, p.get("typ", ""))
+
+        if podminky:
+            zakazane = []
+            for klic in ("pad", "cislo"):
+                hodnoty = podminky.get(klic)
+                if isinstance(hodnoty, str):
+                    hodnoty = [hodnoty]
+                zakazane.append(
+                    frozenset(
+                        h.strip("!")
+                        for h in hodnoty or []
+                        if isinstance(h, str) and h.startswith("!")
+                    )
+                )
+            if any(zakazane):
+                self.podminena[idx] = tuple(zakazane)
+
+    def _sestav_vyraz(self, vyrazena: frozenset) -> re.Pattern | None:
+        vetve = [v for idx, v in self._vetve.items() if idx not in vyrazena]
+        return re.compile("|".join(vetve)) if vetve else None
+
+    # ==============================================================================================================================================
+    # Vyhodnocení
+
+    def _vyraz_pro(self, token) -> re.Pattern | None:
+        if not self.podminena:
+            return self._vyrazy[frozenset()]
+
+        pad = token.pad if token is not None else ""
+        cislo = token.cislo if token is not None else ""
+        vyrazena = frozenset(
+            idx
+            for idx, (zakazane_pady, zakazana_cisla) in self.podminena.items()
+            if pad in zakazane_pady or cislo in zakazana_cisla
+        )
+
+        vyraz = self._vyrazy.get(vyrazena)
+        if vyraz is None and vyrazena not in self._vyrazy:
+            vyraz = self._vyrazy[vyrazena] = self._sestav_vyraz(vyrazena)
+        return vyraz
+
+    def vyhodnot(self, prvni: str, druhe: str, token=None) -> tuple[str, str, int | None]:
+        """
+        Vyhodnotí dvojici slov.
+        Vrací (nové první, nové druhé, index pravidla | None), bez pravidla (první, " " + druhé, None).
+        """
+        vyraz = self._vyraz_pro(token)
+        shoda = vyraz.match(prvni[::-1] + HRANICE + druhe) if vyraz is not None else None
+        if shoda is None:
+            return prvni, " " + druhe, None
+
+        idx = int(shoda.lastgroup[1:])
+        skupiny_konce, spojeni, zacatek_nahr, _ = self.zkompilovana[idx]
+        delka_konce, nahrada_konce = next(
+            (delka, nahrada) for jmeno, delka, nahrada in skupiny_konce if shoda.group(jmeno)
+        )
+        delka_zacatku = len(shoda.group(shoda.lastgroup))
+
+        # náhrady stejně jako _nahrada_nahrada
+        if nahrada_konce.startswith("_"):
+            nove_prvni = prvni
+        elif nahrada_konce.startswith("x"):
+            nove_prvni = prvni[:-delka_konce]
+        else:
+            nove_prvni = prvni[:-delka_konce] + nahrada_konce
+
+        if zacatek_nahr.startswith("_"):
+            nove_druhe = spojeni + druhe
+        elif zacatek_nahr.startswith("x"):
+            nove_druhe = spojeni + druhe[delka_zacatku:]
+        else:
+            nove_druhe = spojeni + zacatek_nahr + druhe[delka_zacatku:]
+
+        return nove_prvni, nove_druhe, idx
+
+    def typ(self, idx: int) -> str:
+        return self.zkompilovana[idx][3]
+
+
+# ==============================================================================================================================================
+# Rozdílový test jader
+
+
+def porovnej_jadra(
+    vety: Iterable[str],
+    json_file: str = "data/sandhi_pravidla.json",
+    f_parametry: bool = True,
+) -> dict:
+    """
+    Provede sandhi referenčním (python) i regex jádrem a porovná výsledné věty i seznamy změn.
+    S f_parametry se každá věta projde navíc se všemi kombinacemi pádu a čísla prvního slova
+    (podmíněná pravidla).
+    Vrací {"vety": počet porovnání, "rozdily": [(věta, parametry, reference, regex)]}.
+    """
+    from helpers.sandhi_processor import SandhiProcessor, SandhiToken
+
+    reference = SandhiProcessor(json_file=json_file, f_cache=False)
+    regex = SandhiProcessor(json_file=json_file, f_cache=False, engine="regex")
+
+    pady = ["", "N", "Ak", "I", "D", "Abl", "G", "L", "V"]
+    cisla = ["", "sg.", "du.", "pl."]
+
+    pocet = 0
+    rozdily = []
+    for veta in vety:
+        varianty = [None]
+        if f_parametry:
+            varianty += [(pad, cislo) for pad in pady for cislo in cisla]
+
+        for varianta in varianty:
+            if varianta is None:
+                ref, reg = reference.aplikuj_sandhi(veta), regex.aplikuj_sandhi(veta)
+            else:
+                tokeny = [SandhiToken(s, "", *varianta) for s in veta.split()]
+                ref = reference.aplikuj_sandhi_tokeny(tokeny)
+                reg = regex.aplikuj_sandhi_tokeny(tokeny)
+            pocet += 1
+            if ref != reg:
+                rozdily.append((veta, varianta, ref, reg))
+
+    return {"vety": pocet, "rozdily": rozdily}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Rozdílový test regex jádra sandhi proti referenci."
+    )
+    parser.add_argument("vstup", help="UTF-8 soubor, jedna věta na řádek (český vědecký přepis)")
+    parser.add_argument("--pravidla", default="data/sandhi_pravidla.json", help="JSON s pravidly")
+    parser.add_argument("--bez-parametru", action="store_true", help="nezkoušet pády a čísla")
+    args = parser.parse_args(argv)
+
+    with open(args.vstup, "r", encoding="utf-8") as f:
+        vety = [radek.strip() for radek in f if radek.strip()]
+
+    vysledek = porovnej_jadra(vety, json_file=args.pravidla, f_parametry=not args.bez_parametru)
+    for veta, varianta, ref, reg in vysledek["rozdily"][:20]:
+        print(f"{veta!r} {varianta}\n  python: {ref}\n  regex:  {reg}", file=sys.stderr)
+    print(f"Porovnáno: {vysledek['vety']}, rozdílů: {len(vysledek['rozdily'])}", file=sys.stderr)
+    return 1 if vysledek["rozdily"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# helpers/sandhi_trace.py
+# SandhiTrace
+#
+# Strukturované trasování průchodu pravidel sandhi (náhrada textového logu _log_pravidlo).
+# Události se ukládají jako krátké n-tice do kruhového bufferu (deque s maxlen),
+# nic se neformátuje - text vzniká až při exportu do JSONL.
+# Při vypnutém trasování procesor SandhiTrace vůbec nevytváří (self.trace = None).
+#
+# Událost: (beh, krok, index_slovo, index_pravidla, prvni, druhe, priznaky)
+#   beh            - číslo běhu (jedna věta, novy_beh) - sdílený procesor zapisuje události všech
+#                    sessions do jednoho bufferu, export se podle běhu filtruje
+#   krok           - místo v procesoru ("Po _zpracuj_konec:", "Výsledek:", ...)
+#   index_pravidla - pořadí pravidla v sandhi_pravidla.json, -1 mimo smyčku pravidel
+#   priznaky       - bitová maska příznaků kontextu (viz PRIZNAKY)
+#
+# Příklad použití:
+# sp = SandhiProcessor(json_file, f_log=True)
+# beh = sp.trace.novy_beh()
+# sp.aplikuj_sandhi("naraḥ gaččhati atra adja", beh=beh)
+# sp.trace.export_jsonl("sandhi_trace.jsonl", pravidla=sp.pravidla, beh=beh)
+
+# import
+import itertools
+import json
+import threading
+
+from collections import deque
+
+# Pořadí bitů v masce priznaky
+PRIZNAKY = (
+    "f_nalezeno_vzor_konec",
+    "f_nalezeno_nahrada_konec",
+    "f_nalezeno_vzor_zacatek",
+    "f_nalezeno_nahrada_zacatek",
+    "f_continue",
+    "f_break",
+)
+
+
+class SandhiTrace:
+
+    def __init__(self, max_udalosti: int = 5_000):
+        """
+        max_udalosti : int
+            Velikost kruhového bufferu, starší události se přepisují.
+        """
+        if max_udalosti < 1:
+            raise ValueError("max_udalosti musí být alespoň 1")
+
+        self._udalosti = deque(maxlen=max_udalosti)
+        self.pocet = 0  # celkový počet zaznamenaných událostí (včetně přepsaných)
+        self._behy = itertools.count(1)
+        self._zamek = threading.Lock()  # sdílený procesor zapisuje z více vláken
+
+    def novy_beh(self) -> int:
+        """Nové číslo běhu pro označení událostí jedné věty."""
+        with self._zamek:
+            return next(self._behy)
+
+    def zaznam(
+        self,
+        beh: int,
+        krok: str,
+        index_slovo: int,
+        index_pravidla: int,
+        prvni: str,
+        druhe: str,
+        priznaky: int,
+    ):
+        with self._zamek:
+            self._udalosti.append((beh, krok, index_slovo, index_pravidla, prvni, druhe, priznaky))
+            self.pocet += 1
+
+    def __len__(self) -> int:
+        return len(self._udalosti)
+
+    def clear(self):
+        with self._zamek:
+            self._udalosti.clear()
+            self.pocet = 0
+
+    def udalosti(self, pravidla: list | None = None, beh: int | None = None) -> list[dict]:
+        """
+        Události jako slovníky (v "priznaky" jen nastavené příznaky), s beh jen události běhu.
+        Se seznamem pravidel se doplní i typ pravidla.
+        """
+        with self._zamek:
+            udalosti = list(self._udalosti)
+        vystup = []
+        for beh_udalosti, krok, index_slovo, index_pravidla, prvni, druhe, priznaky in udalosti:
+            if beh is not None and beh_udalosti != beh:
+                continue
+            zaznam = {
+                "beh": beh_udalosti,
+                "krok": krok,
+                "index_slovo": index_slovo,
+                "index_pravidla": index_pravidla,
+                "prvni": prvni,
+                "druhe": druhe,
+            }
+            if pravidla is not None and 0 <= index_pravidla < len(pravidla):
+                zaznam["pravidlo_typ"] = pravidla[index_pravidla].get("typ", "")
+            zaznam["priznaky"] = [
+                nazev for bit, nazev in enumerate(PRIZNAKY) if priznaky >> bit & 1
+            ]
+            vystup.append(zaznam)
+        return vystup
+
+    @staticmethod
+    def jsonl(udalosti: list[dict]) -> str:
+        """Události (udalosti()) jako text JSONL."""
+        return "".join(json.dumps(zaznam, ensure_ascii=False) + "\n" for zaznam in udalosti)
+
+    def export_jsonl(self, cesta: str, pravidla: list | None = None, beh: int | None = None) -> int:
+        """
+        Zapíše obsah bufferu (s beh jen události běhu) do JSONL (soubor se přepíše),
+        vrací počet zapsaných událostí.
+        """
+        udalosti = self.udalosti(pravidla=pravidla, beh=beh)
+        with open(cesta, "w", encoding="utf-8") as f:
+            f.write(self.jsonl(udalosti))
+        return len(udalosti)
@@ -0,0 +1,339 @@
+# helpers/sandhi_viccheda.py
+# ObracenePravidlo, Rozdeleni, obracena_pravidla, slovnik_tvaru, rozdel_sandhi, main
+#
+# Rozdělení sandhi (viccheda) - obrácení SandhiProcessor.aplikuj_sandhi.
+# Ze spojeného textu (po sandhi) vyjmenuje možná rozdělení na slova seřazená podle ceny.
+#
+# 1. Obrácená pravidla: každé pravidlo sandhi_pravidla.json se rozbalí na konkrétní dvojice
+#    (konec prvního slova, začátek druhého) a přímý procesor se na ně zkusmo pustí. Ze změny
+#    vznikne obrácené pravidlo "spoj → (konec, začátek)", např. "ó’" → ("aḥ", "a"), "é" → ("a", "i").
+#    Mezera bez změny je obrácené pravidlo " " → ("", "").
+# 2. Hledání: stav = (pozice ve spojeném textu, začátek dalšího slova vrácený pravidlem).
+#    Ze stavu vedou hrany přes slova ze slovníku tvarů (paradigmata, neohebná slova a zájmena) -
+#    slovo = začátek + úsek textu + konec pravidla, jehož spoj v textu následuje. Cena slova 1,
+#    neznámého slova (celý úsek mezi mezerami) CENA_NEZNAMEHO. Nejlevnější rozdělení se hledají best-first (heapq), každý stav
+#    se rozvine nejvýše `paprsek` krát - počet kroků je polynomiální v délce textu i pro dlouhá složeniny.
+# 3. Ověření: rozdělení se vydá, jen pokud z něj přímý procesor složí zpět tentýž text.
+#
+# Výsledky se generují líně (generátor) ve vzestupném pořadí ceny, s limitem času a paprsku.
+# Věta se prohledá ve všech výkladech (IAST / český přepis) souběžně, limit času se mezi ně dělí.
+#
+# Příklad použití:
+# for r in rozdel_sandhi("naró’tra gaččhati"):   # Rozdeleni(slova=("naraḥ", "atra", "gaččhati"), ...)
+#     print(r.slova, r.cena)
+# python -m helpers.sandhi_viccheda "dévátra" --paprsek 8 --limit 0.5
+
+# import
+import argparse
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+import unicodedata
+
+from dataclasses import dataclass
+from typing import Iterator
+
+# Vlastní moduly
+from helpers.paradigmata import SLOVNIK_SLOVES, nacti_paradigmata
+from helpers.repozitar_dat import nacti_tabulku
+from helpers.rozbor_tvaru import vyklady
+from helpers.sandhi_processor import SandhiProcessor, json_file, sdileny_procesor
+from helpers.transliterate import CZECH_V, IAST, prepis_hromadne
+
+CENA_SLOVA = 1.0
+CENA_NEZNAMEHO = 10.0
+CENA_PRAVIDLA = 0.01  # mírně upřednostní slova oddělená mezerou před spojem pravidlem
+
+# Zkusmé kmeny prvního slova pro pravidla na konec slova (-aḥ, -t, ...) a zbytek druhého slova
+_ZKUSME_KMENY = ("ka", "kal")
+_ZKUSMY_ZBYTEK = "ta"
+
+
+@dataclass(frozen=True)
+class ObracenePravidlo:
+    spoj: str  # text v místě spoje po sandhi (může obsahovat mezeru)
+    konec: str  # konec prvního slova před sandhi
+    zacatek: str  # začátek druhého slova před sandhi
+    typ: str  # typ pravidla (visarga_a, samohlaska, ...), "" = mezera bez změny
+
+
+@dataclass(frozen=True)
+class Rozdeleni:
+    slova: tuple[str, ...]
+    cena: float
+    pravidla: tuple[str, ...]  # typy obrácených pravidel na spojích
+    nezname: int = 0  # počet slov mimo slovník tvarů
+
+    @property
+    def veta(self) -> str:
+        return " ".join(self.slova)
+
+
+# ==============================================================================================================================================
+# Obrácená pravidla
+
+
+def _rozbal(vzor, skupiny: dict, strana: str) -> list[tuple[str, bool]]:
+    """
+    Konkrétní texty vzoru pravidla - [(text, f_cast)], f_cast = vzor je jen konec / začátek slova.
+    strana : "konec" (-aḥ) nebo "zacatek" (a-), *skupina se rozbalí ze skupin.
+    """
+    vysledek = []
+    for v in vzor if isinstance(vzor, list) else [vzor]:
+        if not isinstance(v, str) or not v:
+            continue
+        f_cast = v.startswith("-") if strana == "konec" else v.endswith("-")
+        v = v.strip("-")
+        if v.startswith("*"):
+            vysledek.extend((c.strip("-"), True) for c in skupiny.get(v[1:], []) if c.strip("-"))
+        else:
+            vysledek.append((v, f_cast))
+    return vysledek
+
+
+def _odvod_pravidla(procesor: SandhiProcessor) -> list[ObracenePravidlo]:
+    """Obrácená pravidla zkusmým během přímého procesoru na rozbalené dvojice (konec, začátek)."""
+    zkousky = {}
+    for pravidlo in procesor.pravidla:
+        for konec, f_cast in _rozbal(pravidlo.get("konec"), procesor.skupiny, "konec"):
+            for zacatek, _ in _rozbal(pravidlo.get("zacatek"), procesor.skupiny, "zacatek"):
+                for kmen in _ZKUSME_KMENY if f_cast else ("",):
+                    zkousky[(kmen, konec, zacatek)] = None
+
+    pravidla = {ObracenePravidlo(" ", "", "", ""): None}
+    for kmen, konec, zacatek in zkousky:
+        puvodni = f"{kmen}{konec} {zacatek}{_ZKUSMY_ZBYTEK}"
+        vysledek, zmeny = procesor.aplikuj_sandhi(puvodni)
+        if not zmeny or vysledek == puvodni:
+            continue
+        if not vysledek.startswith(kmen) or not vysledek.endswith(_ZKUSMY_ZBYTEK):
+            continue  # pravidlo zasáhlo i mimo spoj - nelze obrátit
+        spoj = vysledek[len(kmen) : len(vysledek) - len(_ZKUSMY_ZBYTEK)]
+        typ = zmeny[0].get("pravidlo", "") or ""
+        pravidla[ObracenePravidlo(spoj, konec, zacatek, typ)] = None
+    return list(pravidla)
+
+
+_pravidla: dict[str, tuple] = {}  # json_file → (procesor, pravidla podle prvního znaku spoje)
+_zamek = threading.Lock()
+
+
+def obracena_pravidla(json_soubor: str = json_file) -> dict[str, list[ObracenePravidlo]]:
+    """Obrácená pravidla podle prvního znaku spoje, znovu odvozená při změně souboru pravidel."""
+    procesor = sdileny_procesor(json_soubor)
+    ulozene = _pravidla.get(json_soubor)
+    if ulozene is not None and ulozene[0] is procesor:
+        return ulozene[1]
+    with _zamek:
+        podle_znaku: dict[str, list[ObracenePravidlo]] = {}
+        for pravidlo in _odvod_pravidla(procesor):
+            if pravidlo.spoj:
+                podle_znaku.setdefault(pravidlo.spoj[0], []).append(pravidlo)
+        _pravidla[json_soubor] = (procesor, podle_znaku)
+        return podle_znaku
+
+
+# Neohebná slova a zájmena - (slovník, sloupec přepisu, přepis sloupce), IAST se převede
+SLOVNIKY_NEOHEBNE = (
+    ("data/ostatni_slova.csv", "transliterace", CZECH_V),
+    ("data/zajmena.csv", "transliterace", CZECH_V),
+    ("data/zajmena_ja.csv", "iast", IAST),
+    ("data/zajmena_ty.csv", "iast", IAST),
+    ("data/zajmena_kdo.csv", "iast", IAST),
+    ("data/zajmena_ukazovaci.csv", "iast", IAST),
+)
+
+_tvary: tuple = (None, frozenset())  # ((tabulka paradigmat, podpisy slovníků), tvary)
+
+
+def _podpis(cesta: str) -> tuple[int, int] | None:
+    try:
+        st_ = os.stat(cesta)
+    except OSError:
+        return None
+    return st_.st_mtime_ns, st_.st_size
+
+
+def _tvary_neohebnych() -> list[str]:
+    """Přepisy neohebných slov a zájmen (SLOVNIKY_NEOHEBNE) v českém vědeckém přepisu."""
+    tvary = []
+    for cesta, sloupec, zdroj in SLOVNIKY_NEOHEBNE:
+        try:
+            df = nacti_tabulku(cesta, dtype=str, keep_default_na=False)
+        except (OSError, ValueError):
+            continue  # chybějící nebo prázdný slovník
+        if sloupec not in df.columns:
+            continue
+        hodnoty = df[sloupec].str.strip()
+        if zdroj != CZECH_V:
+            hodnoty = prepis_hromadne(hodnoty, zdroj, CZECH_V)
+        tvary.extend(hodnoty)
+    return tvary
+
+
+def slovnik_tvaru() -> frozenset[str]:
+    """
+    Všechny tvary slov slovníků v českém vědeckém přepisu - tabulka paradigmat (jména, slovesa
+    jen v padě slovesa podle slovesa.csv) a neohebná slova a zájmena (SLOVNIKY_NEOHEBNE).
+    """
+    global _tvary
+    paradigmata = nacti_paradigmata()
+    klic = (
+        paradigmata,
+        tuple(_podpis(c) for c, _, _ in SLOVNIKY_NEOHEBNE),
+        _podpis(SLOVNIK_SLOVES),
+    )
+    if _tvary[0] != klic:
+        df = paradigmata.df
+        # tvary sloves v padě, kterou sloveso nemá, vynechá (jako rozbor_tvaru.IndexRozboru)
+        slovesa = nacti_tabulku(SLOVNIK_SLOVES, dtype=str, keep_default_na=False)
+        pady = df["cz"].map(dict(zip(slovesa["cz"], slovesa["pada"].str.strip()))).fillna("")
+        platne = (df["typ"] != "verb") | (df["pada"] == "") | (pady == "") | (pady == df["pada"])
+        tvary = itertools.chain(df.loc[platne, "tvar_tran_cz"], _tvary_neohebnych())
+        tvary = (unicodedata.normalize("NFC", t.strip()) for t in tvary)
+        _tvary = (klic, frozenset(t for t in tvary if t and " " not in t))
+    return _tvary[1]
+
+
+# ==============================================================================================================================================
+# Hledání rozdělení
+
+
+def _rozdel_text(
+    text: str,
+    pravidla: dict[str, list[ObracenePravidlo]],
+    tvary: frozenset[str],
+    procesor: SandhiProcessor,
+    paprsek: int,
+    casovy_limit: float,
+) -> Iterator[Rozdeleni]:
+    """Rozdělení jednoho výkladu textu ve vzestupném pořadí ceny, casovy_limit = čas vlastního běhu."""
+    n = len(text)
+    max_delka = max(map(len, tvary), default=0)
+    rozvinuto: dict[tuple[int, str], int] = {}
+    vydane = set()
+    poradi = itertools.count()
+
+    # (cena, pořadí, pozice, začátek dalšího slova, slova, pravidla, neznámá)
+    fronta = [(0.0, next(poradi), 0, "", (), (), 0)]
+    # čas mimo generátor (mezi vydáními) se do limitu nepočítá
+    konec_casu = time.perf_counter() + casovy_limit
+    while fronta:
+        if time.perf_counter() > konec_casu:
+            return
+        cena, _, i, zacatek, slova, typy, nezname = heapq.heappop(fronta)
+
+        if i == n and not zacatek:
+            if slova in vydane:
+                continue
+            vydane.add(slova)
+            # ověření přímým během pravidel
+            if procesor.aplikuj_sandhi(" ".join(slova))[0] == text:
+                zbyva = konec_casu - time.perf_counter()
+                yield Rozdeleni(slova, round(cena, 4), typy, nezname)
+                konec_casu = time.perf_counter() + zbyva
+            continue
+
+        stav = (i, zacatek)
+        if rozvinuto.get(stav, 0) >= paprsek:
+            continue
+        rozvinuto[stav] = rozvinuto.get(stav, 0) + 1
+
+        def pridej(slovo, j, dalsi, typ, cena_slova, f_nezname=False):
+            heapq.heappush(
+                fronta,
+                (cena + cena_slova + (CENA_PRAVIDLA if typ else 0.0), next(poradi), j, dalsi,
+                 (*slova, slovo), (*typy, typ) if typ else typy, nezname + f_nezname),
+            )  # fmt: skip
+
+        for j in range(i, min(n, i + max_delka) + 1):
+            usek = text[i:j]
+            if j == n:
+                slovo = zacatek + usek
+                if slovo in tvary:
+                    pridej(slovo, n, "", "", CENA_SLOVA)
+                break
+            for pravidlo in pravidla.get(text[j], ()):
+                if not text.startswith(pravidlo.spoj, j):
+                    continue
+                slovo = zacatek + usek + pravidlo.konec
+                if slovo and slovo in tvary:
+                    pridej(
+                        slovo, j + len(pravidlo.spoj), pravidlo.zacatek, pravidlo.typ, CENA_SLOVA
+                    )
+
+        # neznámé slovo - celý úsek mezi mezerami beze změny
+        if not zacatek and (i == 0 or text[i - 1] == " "):
+            j = text.find(" ", i)
+            j = n if j < 0 else j
+            if j > i:
+                pridej(text[i:j], min(j + 1, n), "", "", CENA_NEZNAMEHO, True)
+
+
+def rozdel_sandhi(
+    veta: str,
+    *,
+    paprsek: int = 8,
+    casovy_limit: float = 0.5,
+    json_soubor: str = json_file,
+) -> Iterator[Rozdeleni]:
+    """
+    Možná rozdělení věty po sandhi na slova, líně ve vzestupném pořadí ceny.
+    veta         : text v dévanágarí, IAST nebo českém vědeckém přepisu
+    paprsek      : kolikrát se nejvýše rozvine jeden stav hledání (šířka paprsku)
+    casovy_limit : limit času na celou větu v sekundách, dělí se mezi výklady věty (IAST / přepis)
+    Rozdělení jen na neznámá slova se vydá jen pro zadaný zápis věty, ne pro jeho další výklady.
+    """
+    pravidla = obracena_pravidla(json_soubor)
+    procesor = sdileny_procesor(json_soubor)
+    tvary = slovnik_tvaru()
+    texty = _vyklady_vety(veta)
+    limit = casovy_limit / max(len(texty), 1)
+
+    # výklady se prohledávají souběžně, heapq.merge vydá jejich rozdělení podle ceny
+    vysledky = heapq.merge(
+        *(_rozdel_text(text, pravidla, tvary, procesor, paprsek, limit) for text in texty),
+        key=lambda r: r.cena,
+    )
+    vydane = set()
+    for rozdeleni in vysledky:
+        # jen neznámá slova = text výkladu beze změny - z jiného výkladu než zadaného je to jen
+        # artefakt přepisu (xyz → xjz), vydá se jen zadaný text
+        if rozdeleni.nezname == len(rozdeleni.slova) and rozdeleni.veta != texty[0]:
+            continue
+        if rozdeleni.slova not in vydane:
+            vydane.add(rozdeleni.slova)
+            yield rozdeleni
+
+
+def _vyklady_vety(veta: str) -> list[str]:
+    """Věta v českém vědeckém přepisu (latinka v obou výkladech), mezery sjednocené, ' → ’."""
+    veta = " ".join(veta.replace("ऽ", "’").split())
+    return list(dict.fromkeys(v.replace("'", "’") for v in vyklady(veta)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rozdělení sandhi (viccheda) spojeného textu.")
+    parser.add_argument("veta", nargs="+", help="text po sandhi")
+    parser.add_argument("--paprsek", type=int, default=8, help="šířka paprsku (rozvinutí stavu)")
+    parser.add_argument("--limit", type=float, default=0.5, help="limit času na větu (s)")
+    parser.add_argument("--pocet", type=int, default=5, help="počet vypsaných rozdělení")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    vysledky = itertools.islice(
+        rozdel_sandhi(" ".join(args.veta), paprsek=args.paprsek, casovy_limit=args.limit),
+        args.pocet,
+    )
+    for r in vysledky:
+        pravidla = f" [{', '.join(r.pravidla)}]" if r.pravidla else ""
+        print(f"{r.cena:6.2f}  {r.veta}{pravidla}")
+    print(f"({time.perf_counter() - start:.3f} s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
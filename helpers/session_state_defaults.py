@@ -10,7 +10,8 @@
 # if_dir_exist, if_file_exist, load_css, init_ciselniky_session_state, init_session_state_on_startup
 #
 # Volá:
-# zobraz_toast, nacti_soubor, nacti_csv, prazdna_veta, generovani_sandhi_pravidel
+# zobraz_toast, nacti_soubor, nacti_csv, prazdna_veta, generovani_sandhi_pravidel, nastav_pamet_prepisu,
+# nastav_rozpocet_dat, nastav_backend_lexikonu
 
 # import
 import os
@@ -34,6 +35,9 @@ from helpers.utils import (
 )
 
 from helpers.generovani_sandhi_json import generovani_sandhi_pravidel
+from helpers.transliterate import nastav_pamet_prepisu
+from helpers.repozitar_dat import nastav_rozpocet_dat
+from helpers.lexikon import nastav_backend_lexikonu
 
 
 # 2️⃣ Načtení CSS stylu
@@ -423,6 +427,22 @@ def init_session_state_on_startup():
         # režim logování vypnut
         "f_log": False,
         # -------------------------------------------------
+        # Paměť přepisů - počet vět a slov v LRU pro každou dvojici schémat (viz stránka Diagnostika)
+        "prepis_cache_velikost": 5_000,
+        # -------------------------------------------------
+        # Rozdělení sandhi (sanskrt → cz) - šířka paprsku, limit času na větu v s, počet zobrazených rozdělení
+        "viccheda_paprsek": 8,
+        "viccheda_limit_s": 0.3,
+        "viccheda_pocet": 3,
+        # -------------------------------------------------
+        # Sdílené tabulky data/*.csv - rozpočet paměti v MB (viz stránka Diagnostika)
+        "data_cache_mb": 64,
+        # -------------------------------------------------
+        # Slovníky slovních druhů - "csv" nebo "sqlite" (data/lexikon.sqlite, python -m helpers.lexikon_sqlite),
+        # u "sqlite" se slovo vybírá hledáním, počet zobrazených slov
+        "lexikon_backend": "csv",
+        "lexikon_hledani_limit": 50,
+        # -------------------------------------------------
         # POM SEKCE pro nastavení dočasných hodnot
         # Nastvení aplikace
         # konfigurace aplikace - auto sandhi po sestavení věty - vpravo 2.
@@ -448,6 +468,13 @@ def init_session_state_on_startup():
         if k not in ss["cfg"]:
             ss["cfg"][k] = v
 
+    # velikost paměti přepisů (sdílená procesem, změna velikosti paměti vyprázdní)
+    nastav_pamet_prepisu(ss["cfg"]["prepis_cache_velikost"])
+    # rozpočet paměti sdílených tabulek (vytlačí se při dalším načtení)
+    nastav_rozpocet_dat(ss["cfg"]["data_cache_mb"])
+    # úložiště slovníků (sdílené procesem)
+    nastav_backend_lexikonu(ss["cfg"]["lexikon_backend"])
+
     # počet průběhů
     if "init" not in ss:
         ss["init"] = 0
@@ -5,52 +5,17 @@ import pandas as pd
 import unicodedata
 
 from typing import Tuple
-from helpers.loader_csv import nacti_csv
+from helpers.koncovky import koncovka_padu_k, koncovky_padu_k_tabulka, odstran_diacritiku
+from helpers.transliterate import CZECH_V, DEVA, IAST, prepis_hromadne
 
-
-def odstran_diacritiku(text: str) -> str:
-    return "".join(c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn")
+PADY = ("N", "Ak", "I", "D", "Abl", "G", "L", "V")
+RODY = ("m", "n", "f")
+CISLA = ("sg.", "du.", "pl.")
 
 
 def ziskej_koncovku_padu_k(x_kmen: str, pad: str, rod: str, cislo: str) -> str:
-    # df = pd.read_csv("data/koncovky_pady_k.csv", sep=";")
-    df = nacti_csv(
-        cesta="data/koncovky_pady_k.csv", sloupec_trideni=None, zobraz=False, typ="dataframe"
-    )
-
-    # st.sidebar.write("🔍 Všechny řádky pro x_kmen='a' a rod='f':")
-    # st.sidebar.write(df[(df["x_kmen"] == "a") & (df["rod"] == "m")])
-    # st.sidebar.write(df[(df["x_kmen"] == "a") & (df["rod"] == "n")])
-    # st.sidebar.write(df[(df["x_kmen"] == "a") & (df["rod"] == "f")])
-    # st.sidebar.write(df[(df["x_kmen"] == "á") & (df["rod"] == "f")])
-
-    # filtr = (
-    #     (df["x_kmen"] == x_kmen) &
-    #     (df["pad"] == pad) &
-    #     (df['rod'] == rod) &
-    #     (df["cislo"] == cislo)
-    # )
-
-    filtr = (
-        (df["x_kmen"].apply(odstran_diacritiku) == odstran_diacritiku(x_kmen))
-        & (df["pad"] == pad)
-        & (df["rod"] == rod)
-        & (df["cislo"] == cislo)
-    )
-
-    vysledky = df[filtr]
-
-    # st.sidebar.write("🔍 Unikátní hodnoty sloupce rod:", df["rod"].unique().tolist())
-    # st.sidebar.write(f"❗️ Zadaný pad >{pad}<")
-    # st.sidebar.write(f"❗️ Zadaný rod >{rod}<")
-    # st.sidebar.write(f"❗️ Zadaný cislo >{cislo}<")
-    # st.sidebar.write(f"❗️ Zadaný filtr >{filtr}<")
-    # st.sidebar.write(f"❗️ Zadaný vysledky >{vysledky}<")
-    # st.sidebar.write(f"❗️ Zadané parametry pro získání koncovky. x_kmen >{x_kmen}<")
-
-    if not vysledky.empty:
-        return vysledky.iloc[0]["koncovka"]
-    return ""
+    # Index koncovky_pady_k.csv podle (x_kmen bez diakritiky, pád, rod, číslo), viz helpers/koncovky.py
+    return koncovka_padu_k(x_kmen, pad, rod, cislo)
 
 
 def sklonuj_k(slovo_in: str, pad: str, rod: str, cislo: str) -> tuple[str, str, str, str]:
@@ -68,4 +33,67 @@ def sklonuj_k(slovo_in: str, pad: str, rod: str, cislo: str) -> tuple[str, str,
         return None, None, None, None
 
 
+def sklonuj_hromadne(
+    kmeny: pd.DataFrame | list[str],
+    rody: list[str] | None = None,
+    f_rod_slova: bool = False,
+    f_prepis: bool = True,
+) -> pd.DataFrame:
+    """
+    Vektorové skloňování mnoha kmenů najednou - jedno spojení (merge) kmenů s koncovky_pady_k.
+    Tvary jsou stejné jako ze sklonuj_k, kombinace bez koncovky ve výsledku chybí.
+
+    kmeny       : DataFrame se sloupcem "kmen" (ostatní sloupce se přenesou, "rod" jako "rod_slova"),
+                  nebo seznam kmenů
+    rody        : jen vybrané rody (výchozí m, n, f)
+    f_rod_slova : jen rod ze sloupce rod_slova (prázdný rod slova = všechny rody)
+    f_prepis    : doplnit sloupce tvar_tran_iast a tvar_dev
+
+    Vrací DataFrame se sloupci vstupu a x_kmen, kmen_0, pad, rod, cislo, koncovka, tvar_tran_cz,
+    seřazený podle vstupu, pádu (N … V), rodu (m, n, f) a čísla (sg., du., pl.).
+    """
+    if isinstance(kmeny, pd.DataFrame):
+        df = kmeny.reset_index(drop=True).rename(columns={"rod": "rod_slova"})
+    else:
+        df = pd.DataFrame({"kmen": list(kmeny)})
+    df["_poradi"] = range(len(df))
+
+    zaklad = df["kmen"].fillna("").astype(str).str.rstrip("- ")
+    df = df[zaklad != ""].copy()
+    df["x_kmen"] = zaklad[zaklad != ""].str[-1]
+    df["kmen_0"] = df["kmen"].str.rstrip("aeiouáéíóú- ")
+    # koncová hláska bez diakritiky - převádí se jen každá různá hodnota
+    df["_x"] = df["x_kmen"].map({x: odstran_diacritiku(x) for x in df["x_kmen"].unique()})
+
+    poradi_padu = {pad: i for i, pad in enumerate(PADY)}
+    poradi_rodu = {rod: i for i, rod in enumerate(rody or RODY)}
+    poradi_cisel = {cislo: i for i, cislo in enumerate(CISLA)}
+    koncovky = koncovky_padu_k_tabulka().rename(columns={"x_kmen": "_x"})
+    koncovky = koncovky[
+        (koncovky["koncovka"] != "")
+        & koncovky["pad"].isin(poradi_padu)
+        & koncovky["rod"].isin(poradi_rodu)
+        & koncovky["cislo"].isin(poradi_cisel)
+    ]
+
+    tvary = df.merge(koncovky[["_x", "pad", "rod", "cislo", "koncovka"]], on="_x", how="inner")
+    if f_rod_slova and "rod_slova" in tvary.columns:
+        rod_slova = tvary["rod_slova"].fillna("").astype(str).str.strip()
+        tvary = tvary[(rod_slova == "") | (rod_slova == tvary["rod"])]
+    tvary["tvar_tran_cz"] = tvary["kmen_0"] + tvary["koncovka"]
+
+    tvary = tvary.assign(
+        _pad=tvary["pad"].map(poradi_padu),
+        _rod=tvary["rod"].map(poradi_rodu),
+        _cislo=tvary["cislo"].map(poradi_cisel),
+    )
+    tvary = tvary.sort_values(["_poradi", "_pad", "_rod", "_cislo"], kind="stable")
+    tvary = tvary.drop(columns=["_poradi", "_x", "_pad", "_rod", "_cislo"]).reset_index(drop=True)
+
+    if f_prepis:
+        tvary["tvar_tran_iast"] = prepis_hromadne(tvary["tvar_tran_cz"], CZECH_V, IAST)
+        tvary["tvar_dev"] = prepis_hromadne(tvary["tvar_tran_cz"], CZECH_V, DEVA)
+    return tvary
+
+
 # helpers/sklonovani.py
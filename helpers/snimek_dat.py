@@ -0,0 +1,391 @@
+# helpers/snimek_dat.py
+# sestav_snimek, otevri_snimek, zavri_snimek, varianta_snimku, tabulka_ze_snimku, zaznamy_ze_snimku,
+# obsah_ze_snimku, statistika_snimku, main
+#
+# Binární snímek dat - všechny data/*.csv a pravidla sandhi (JSON) v jednom souboru
+# data/snimek_dat.arrow (Arrow IPC), otevřený přes memory map. Odpadá parsování CSV, každé čtení
+# ale sestaví nový DataFrame (to_pandas) - načtení všech tabulek cca 64 ms → 36 ms, ne bez kopie.
+#
+# Formát souboru (verze FORMAT):
+#   MAGIC (8 B) | délka manifestu (8 B, little endian) | manifest (JSON) | zarovnání na 64 B | segmenty
+#   manifest : {"format", "verze", "vytvoreno", "adresar" (zdrojů, relativně ke snímku),
+#               "zdroje": {soubor: [mtime_ns, velikost]},
+#               "tabulky": {soubor: {varianta: [offset, délka], "zaznamy": bool}},
+#               "obsahy": {soubor: [offset, délka]}}
+#   segment  : jeden kompletní Arrow IPC soubor (tabulka) nebo obsah JSON, offset od začátku segmentů
+# verze je hash obsahu všech zdrojů - dva snímky ze stejných dat mají stejnou verzi.
+#
+# Každé CSV je ve dvou variantách načtení (VARIANTY): "auto" = pd.read_csv(sep=";") s odvozenými
+# typy (jako loader_csv.nacti_csv), "text" = vše jako str bez NaN (paradigmata, rozbor_tvaru).
+# Varianta se do snímku zapíše, jen když z něj vznikne stejná tabulka jako z CSV; záznamy
+# (csv.DictReader) se z varianty "text" vydávají, jen když se při sestavení shodovaly.
+#
+# Při čtení se pro každý soubor porovná podpis (mtime, velikost) se snímkem - změněný soubor
+# (zastaralý snímek) i soubor mimo snímek vrací None a volající (repozitar_dat) čte CSV.
+# Chybějící snímek nebo chybějící pyarrow znamená vždy čtení CSV.
+#
+# Příklad použití:
+# python -m helpers.snimek_dat                   # sestavení data/snimek_dat.arrow
+# python -m helpers.snimek_dat --mereni          # načtení všech tabulek z CSV a ze snímku
+# df = tabulka_ze_snimku("data/slovesa.csv", "auto")   # None = číst CSV
+
+# import
+import argparse
+import csv
+import functools
+import glob
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+
+import pandas as pd
+
+# pyarrow je volitelný - bez něj se čte vždy CSV
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+soubor_snimku = "data/snimek_dat.arrow"
+adresar_dat = "data"
+SOUBORY_JSON = ("sandhi_pravidla.json", "sandhi_pravidla_default.json")
+
+FORMAT = 1
+MAGIC = b"SKSNIMEK"
+_ZAROVNANI = 64
+
+# parametry pd.read_csv variant (sep=";" a encoding="utf-8" mají všechny)
+VARIANTY = {
+    "auto": {},
+    "text": {"dtype": str, "keep_default_na": False},
+}
+
+
+def _podpis(cesta: str) -> list[int] | None:
+    try:
+        st_ = os.stat(cesta)
+    except OSError:
+        return None
+    return [st_.st_mtime_ns, st_.st_size]
+
+
+def _zarovnej(delka: int) -> int:
+    return -delka % _ZAROVNANI
+
+
+# ==============================================================================================================================================
+# Sestavení
+
+
+def _segment_tabulky(df: pd.DataFrame) -> bytes:
+    tabulka = pa.Table.from_pandas(df, preserve_index=False)
+    vystup = pa.BufferOutputStream()
+    with pa.ipc.new_file(vystup, tabulka.schema) as zapis:
+        zapis.write_table(tabulka)
+    return vystup.getvalue().to_pybytes()
+
+
+def _tabulka_ze_segmentu(data) -> pd.DataFrame:
+    return pa.ipc.open_file(data).read_all().to_pandas()
+
+
+def _stejne(df: pd.DataFrame, df_snimek: pd.DataFrame) -> bool:
+    return df.equals(df_snimek) and list(df.dtypes) == list(df_snimek.dtypes)
+
+
+def sestav_snimek(adresar: str = adresar_dat, cesta: str = soubor_snimku) -> dict:
+    """
+    Sestaví snímek všech CSV a souborů pravidel sandhi z `adresar` do `cesta` (zápis přes dočasný
+    soubor). Vrací manifest. Bez pyarrow vyvolá RuntimeError.
+    """
+    if pa is None:
+        raise RuntimeError("Chybí pyarrow - snímek dat nelze sestavit.")
+
+    segmenty: list[bytes] = []
+    delka = 0
+
+    def pridej(data: bytes) -> list[int]:
+        nonlocal delka
+        misto = [delka, len(data)]
+        segmenty.extend((data, b"\0" * _zarovnej(len(data))))
+        delka += len(data) + _zarovnej(len(data))
+        return misto
+
+    zdroje, tabulky, obsahy = {}, {}, {}
+    hash_dat = hashlib.sha1()
+    for soubor in sorted(glob.glob(os.path.join(adresar, "*.csv"))):
+        nazev = os.path.basename(soubor)
+        podpis = _podpis(soubor)
+        with open(soubor, "rb") as f:
+            hash_dat.update(nazev.encode("utf-8") + f.read())
+
+        zaznam = {}
+        for varianta, parametry in VARIANTY.items():
+            try:
+                df = pd.read_csv(soubor, sep=";", encoding="utf-8", **parametry)
+            except (ValueError, pd.errors.ParserError):
+                continue  # prázdný nebo poškozený soubor zůstane na CSV
+            segment = _segment_tabulky(df)
+            if not _stejne(df, _tabulka_ze_segmentu(segment)):
+                continue
+            zaznam[varianta] = pridej(segment)
+            if varianta == "text":
+                with open(soubor, mode="r", encoding="utf-8", newline="") as f:
+                    zaznamy = list(csv.DictReader(f, delimiter=";"))
+                zaznam["zaznamy"] = df.to_dict("records") == zaznamy
+        if zaznam:
+            zdroje[nazev] = podpis
+            tabulky[nazev] = zaznam
+
+    for nazev in SOUBORY_JSON:
+        soubor = os.path.join(adresar, nazev)
+        if not os.path.exists(soubor):
+            continue
+        with open(soubor, "rb") as f:
+            obsah = f.read()
+        hash_dat.update(nazev.encode("utf-8") + obsah)
+        zdroje[nazev] = _podpis(soubor)
+        obsahy[nazev] = pridej(obsah)
+
+    manifest = {
+        "format": FORMAT,
+        "verze": hash_dat.hexdigest()[:12],
+        "vytvoreno": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "adresar": os.path.relpath(
+            os.path.abspath(adresar), os.path.dirname(os.path.abspath(cesta))
+        ),
+        "zdroje": zdroje,
+        "tabulky": tabulky,
+        "obsahy": obsahy,
+    }
+    hlavicka = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+    hlavicka = MAGIC + struct.pack("<Q", len(hlavicka)) + hlavicka
+    hlavicka += b"\0" * _zarovnej(len(hlavicka))
+
+    # další čtení otevře nový snímek (starý memory map zůstává čtenářům, kteří ho drží)
+    zavri_snimek()
+    docasny = f"{cesta}.tmp"
+    with open(docasny, "wb") as f:
+        f.write(hlavicka)
+        for segment in segmenty:
+            f.write(segment)
+    os.replace(docasny, cesta)
+    return manifest
+
+
+# ==============================================================================================================================================
+# Čtení
+
+
+class Snimek:
+    """Otevřený snímek (memory map) - tabulky se sestaví ze segmentů, platnost podle podpisů zdrojů."""
+
+    def __init__(self, cesta: str):
+        self.cesta = cesta
+        self.podpis = _podpis(cesta)
+        self._soubor = pa.memory_map(cesta, "r")
+        self._data = self._soubor.read_buffer()
+
+        if self._data[: len(MAGIC)].to_pybytes() != MAGIC:
+            raise ValueError(f"{cesta} není snímek dat")
+        (delka,) = struct.unpack("<Q", self._data[len(MAGIC) : len(MAGIC) + 8].to_pybytes())
+        zacatek = len(MAGIC) + 8
+        self.manifest = json.loads(self._data[zacatek : zacatek + delka].to_pybytes())
+        if self.manifest.get("format") != FORMAT:
+            raise ValueError(f"{cesta}: nepodporovaný formát {self.manifest.get('format')}")
+        self._segmenty = zacatek + delka + _zarovnej(zacatek + delka)
+        # adresář zdrojových CSV (snímek může ležet i jinde, např. --vystup)
+        self.adresar = os.path.normpath(
+            os.path.join(os.path.dirname(os.path.abspath(cesta)), self.manifest.get("adresar", "."))
+        )
+
+    def _segment(self, misto: list[int]):
+        return self._data.slice(self._segmenty + misto[0], misto[1])
+
+    def platny_nazev(self, cesta: str) -> str | None:
+        """Název souboru ve snímku, pokud je ze stejného adresáře a nezměnil se, jinak None."""
+        cesta = os.path.abspath(cesta)
+        nazev = os.path.basename(cesta)
+        if os.path.dirname(cesta) != self.adresar or nazev not in self.manifest["zdroje"]:
+            return None
+        return nazev if _podpis(cesta) == self.manifest["zdroje"][nazev] else None
+
+    def tabulka(self, nazev: str, varianta: str) -> pd.DataFrame | None:
+        misto = self.manifest["tabulky"].get(nazev, {}).get(varianta)
+        return _tabulka_ze_segmentu(self._segment(misto)) if misto else None
+
+    def zaznamy(self, nazev: str) -> list[dict] | None:
+        if not self.manifest["tabulky"].get(nazev, {}).get("zaznamy"):
+            return None
+        return self.tabulka(nazev, "text").to_dict("records")
+
+    def obsah(self, nazev: str) -> bytes | None:
+        misto = self.manifest["obsahy"].get(nazev)
+        return self._segment(misto).to_pybytes() if misto else None
+
+
+_snimek: Snimek | None = None
+_zamek = threading.Lock()
+_pocty = {"vydano": 0, "zastarale": 0}
+_zamek_poctu = threading.Lock()
+
+
+def _zapocitej(klic: str):
+    with _zamek_poctu:
+        _pocty[klic] += 1
+
+
+def otevri_snimek(cesta: str = soubor_snimku) -> Snimek | None:
+    """Snímek sdílený procesem, znovu otevřený při změně souboru snímku. None = není / je poškozený."""
+    global _snimek
+    if pa is None:
+        return None
+    podpis = _podpis(cesta)
+    snimek = _snimek
+    if snimek is not None and snimek.cesta == cesta and snimek.podpis == podpis:
+        return snimek
+
+    with _zamek:
+        if _snimek is not None and (_snimek.cesta != cesta or _snimek.podpis != podpis):
+            _snimek = None
+        if _snimek is None and podpis is not None:
+            try:
+                _snimek = Snimek(cesta)
+            except (OSError, ValueError, KeyError, struct.error):
+                _snimek = None
+        return _snimek
+
+
+def zavri_snimek():
+    """
+    Zahodí sdílený snímek, další čtení ho otevře znovu. Snímek se nezavírá - jiné sessions ho
+    mohou právě číst, memory map se uvolní, až ho nikdo nedrží (ani tabulky z něj přečtené).
+    """
+    global _snimek
+    with _zamek:
+        _snimek = None
+
+
+def _vydej(cesta: str, cteni, cesta_snimku: str):
+    snimek = otevri_snimek(cesta_snimku)
+    if snimek is None:
+        return None
+    nazev = snimek.platny_nazev(cesta)
+    if nazev is None:
+        if os.path.basename(cesta) in snimek.manifest["zdroje"]:
+            _zapocitej("zastarale")
+        return None
+    vysledek = cteni(snimek, nazev)
+    if vysledek is not None:
+        _zapocitej("vydano")
+    return vysledek
+
+
+def varianta_snimku(parametry: dict) -> str | None:
+    """Varianta snímku pro parametry pd.read_csv, None = snímek je nemá."""
+    for varianta, parametry_varianty in VARIANTY.items():
+        if parametry == {"sep": ";", "encoding": "utf-8", **parametry_varianty}:
+            return varianta
+    return None
+
+
+def tabulka_ze_snimku(
+    cesta: str, varianta: str, cesta_snimku: str = soubor_snimku
+) -> pd.DataFrame | None:
+    """Tabulka CSV ze snímku (stejná jako z pd.read_csv varianty), None = číst CSV."""
+    return _vydej(cesta, lambda snimek, nazev: snimek.tabulka(nazev, varianta), cesta_snimku)
+
+
+def zaznamy_ze_snimku(cesta: str, cesta_snimku: str = soubor_snimku) -> list[dict] | None:
+    """Záznamy CSV ze snímku (stejné jako z csv.DictReader), None = číst CSV."""
+    return _vydej(cesta, lambda snimek, nazev: snimek.zaznamy(nazev), cesta_snimku)
+
+
+def obsah_ze_snimku(cesta: str, cesta_snimku: str = soubor_snimku) -> bytes | None:
+    """Obsah souboru pravidel sandhi ze snímku, None = číst soubor."""
+    return _vydej(cesta, lambda snimek, nazev: snimek.obsah(nazev), cesta_snimku)
+
+
+def statistika_snimku(cesta_snimku: str = soubor_snimku) -> dict:
+    """Verze a stáří snímku, počet souborů a vydaných / zastaralých čtení."""
+    snimek = otevri_snimek(cesta_snimku)
+    if snimek is None:
+        return {"snimek": "není", **_pocty}
+    manifest = snimek.manifest
+    return {
+        "snimek": manifest["verze"],
+        "vytvoreno": manifest["vytvoreno"],
+        "souboru": len(manifest["zdroje"]),
+        "mb": round(snimek.podpis[1] / 2**20, 2),
+        **_pocty,
+    }
+
+
+# ==============================================================================================================================================
+# Měření
+
+
+def _zmer(cteni) -> float:
+    start = time.perf_counter()
+    for soubor in sorted(glob.glob(os.path.join(adresar_dat, "*.csv"))):
+        for varianta, parametry in VARIANTY.items():
+            cteni(soubor, varianta, parametry)
+    return time.perf_counter() - start
+
+
+def _cteni_csv(soubor: str, varianta: str, parametry: dict):
+    try:
+        pd.read_csv(soubor, sep=";", encoding="utf-8", **parametry)
+    except (ValueError, pd.errors.ParserError):
+        pass
+
+
+def _cteni_snimku(soubor: str, varianta: str, parametry: dict, cesta_snimku: str):
+    if tabulka_ze_snimku(soubor, varianta, cesta_snimku) is None:
+        _cteni_csv(soubor, varianta, parametry)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Binární snímek data/*.csv a pravidel sandhi.")
+    parser.add_argument("--vystup", default=soubor_snimku, help="výstupní soubor snímku")
+    parser.add_argument(
+        "--mereni", action="store_true", help="jen změří načtení všech tabulek (CSV / snímek)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.mereni:
+        csv_s = _zmer(_cteni_csv)
+        otevreni = time.perf_counter()
+        if otevri_snimek(args.vystup) is None:
+            print(f"Snímek {args.vystup} není - nejdřív ho sestav.", file=sys.stderr)
+            return 1
+        otevreni = time.perf_counter() - otevreni
+        snimek_s = _zmer(functools.partial(_cteni_snimku, cesta_snimku=args.vystup))
+        print(
+            f"CSV: {csv_s * 1000:.1f} ms, snímek: {snimek_s * 1000:.1f} ms"
+            f" (+ otevření {otevreni * 1000:.1f} ms), {statistika_snimku(args.vystup)}",
+            file=sys.stderr,
+        )
+        return 0
+
+    start = time.perf_counter()
+    try:
+        manifest = sestav_snimek(cesta=args.vystup)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(
+        f"Snímek {manifest['verze']}: {len(manifest['tabulky'])} tabulek,"
+        f" {len(manifest['obsahy'])} JSON → {args.vystup},"
+        f" {os.path.getsize(args.vystup) // 1024} kB, {time.perf_counter() - start:.2f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,217 +6,487 @@
 # transliterate_czech_v_to_iast(text) Přepis Český vědecký do IAST
 # transliterate_iast_to_czech_f(text) Přepis IAST do Český fonetický, pro čtení
 # transliterate_iast_to_czech_l(text) Přepis IAST do Český literární (zjednodušený pro běžné čtení)
-# transliterate_czech_v_to_deva(text) Přepis Český vědecký do dévanágarí = czech_v to iast to deva
+# transliterate_czech_v_to_deva(text) Přepis Český vědecký do dévanágarí (přímo, PrevodDevanagari)
+# prepis(text, zdroj, cil, f_pamet)   Přepis mezi libovolnými schématy (SCHEMATA)
+# prepis_hromadne(hodnoty, zdroj, cil) Přepis celého sloupce (Series, list, Arrow) s odstraněním duplicit
+# nastav_pamet_prepisu, statistika_pameti_prepisu, vycisti_pamet_prepisu  Paměť přepisů (LRU na dvojici schémat)
+#
+# Přepisy mezi latinkovými schématy jsou deklarativní tabulky (_TABULKY), které se zkompilují
+# do jednoho regulárního výrazu (alternace od nejdelšího klíče) a převádí se jedním průchodem
+# zleva doprava s nejdelší shodou. V tabulkách jsou jen znaky, které se mění, ostatní zůstávají.
+# Český vědecký → dévanágarí převádí PrevodDevanagari přímo z tabulek souhlásek, samohlásek a znaků
+# (spřežky viramem, anusvára, visarga); text se znaky mimo tabulku jde záložně přes IAST knihovnou.
+# Shodu s původními řetězci .replace() ověřuje helpers.transliterate_kontrola.
 
 # import
-import streamlit as st
+import re
+import unicodedata
+import numpy as np
+import pandas as pd
 
-from indic_transliteration import sanscript
-from indic_transliteration.sanscript import transliterate
+# Vlastní moduly
+from helpers.lru_cache import LRUCache
 
+# indic_transliteration je volitelná - bez ní funguje přímý převod czech_v → dévanágarí bez zálohy
+try:
+    from indic_transliteration import sanscript
+    from indic_transliteration.sanscript import transliterate
+except ImportError:  # pragma: no cover
+    sanscript = None
+    transliterate = None
 
-# 📌 Přepis IAST do dévanágarí
-def transliterate_iast_to_deva(text):
+# Schémata přepisu
+IAST = "iast"
+CZECH_V = "czech_v"  # český vědecký
+CZECH_F = "czech_f"  # český fonetický
+CZECH_L = "czech_l"  # český literární
+DEVA = "deva"  # dévanágarí
+
+SCHEMATA = (IAST, CZECH_V, CZECH_F, CZECH_L, DEVA)
+
+# ==============================================================================================================================================
+# Převodní tabulky (zdroj, cíl) → {znak / skupina znaků: náhrada}
+
+_TABULKY = {
+    # 📜 IAST → český přepis vědecký
+    # jh → džh, jñ → džñ vyplývá z j → dž
+    (IAST, CZECH_V): {
+        "j": "dž",
+        "y": "j",
+        "ch": "čh",
+        "c": "č",
+        "ph": "f",
+        "ā": "á",
+        "ī": "í",
+        "ū": "ú",
+        "e": "é",
+        "o": "ó",
+    },
+    # 📜 český přepis vědecký → IAST
+    # džh → jh, džñ → jñ, čh → ch vyplývá z dž → j, č → c
+    (CZECH_V, IAST): {
+        "j": "y",
+        "dž": "j",
+        "č": "c",
+        "f": "ph",
+        "á": "ā",
+        "í": "ī",
+        "ú": "ū",
+        "é": "e",
+        "ó": "o",
+    },
+    # IAST → Český fonetický, pro čtení
+    (IAST, CZECH_F): {
+        "jñ": "gj",
+        "gx": "gj",  # původní pomocná značka pro jñ
+        "j": "dž",
+        "y": "j",
+        "ch": "čh",
+        "c": "č",
+        "ph": "f",
+        "ṅ": "ng",
+        "ñ": "ň",
+        "ī": "í",
+        "ṛ": "ṛi",
+        "ṝ": "ṝí",
+        "ā": "á",
+        "ū": "ú",
+        "e": "é",
+        "o": "ó",
+    },
+    # IAST → Český literární (zjednodušený pro běžné čtení)
+    (IAST, CZECH_L): {
+        "jñ": "gj",
+        "gx": "gj",  # původní pomocná značka pro jñ
+        "j": "dž",
+        "y": "j",
+        "ch": "čh",
+        "c": "č",
+        "ph": "f",
+        "ṅ": "ng",
+        "ñ": "ň",
+        "ṇ": "n",
+        "ī": "í",
+        "ṛ": "ri",
+        "ṝ": "rí",
+        "ā": "á",
+        "ū": "ú",
+        "e": "é",
+        "o": "ó",
+        "ḷ": "l",
+        "ḹ": "ĺ",
+        "ṃ": "m",
+        "ḥ": "h",
+        "ṭ": "t",
+        "ḍ": "d",
+        "ś": "š",
+        "ṣ": "š",
+        "ʼ": "",
+    },
+}
+
+
+class PrevodniTabulka:
+    """Zkompilovaná převodní tabulka - nejdelší shoda, jeden průchod zleva doprava."""
+
+    def __init__(self, tabulka: dict[str, str]):
+        self.tabulka = dict(tabulka)
+        # alternace od nejdelšího klíče = nejdelší shoda na každé pozici
+        klice = sorted(self.tabulka, key=len, reverse=True)
+        self._vyraz = re.compile("|".join(re.escape(k) for k in klice))
+        self._nahrada = lambda shoda: self.tabulka[shoda.group()]
+
+    def __call__(self, text: str) -> str:
+        return self._vyraz.sub(self._nahrada, text)
+
+
+_PREVODNIKY = {par: PrevodniTabulka(tabulka) for par, tabulka in _TABULKY.items()}
+
+# ==============================================================================================================================================
+# Český vědecký → dévanágarí přímo (bez mezikroku přes IAST)
+
+# Souhlásky - bez samohlásky dostanou virám, ve skupině vzniká spřežka (क्ष = क + ् + ष)
+# Vedle českých znaků (č, dž, j, f) i IAST znaky, které czech_v → iast ponechává (c, ch, y, ph)
+_DEVA_SOUHLASKY = {
+    "k": "क",
+    "kh": "ख",
+    "g": "ग",
+    "gh": "घ",
+    "ṅ": "ङ",
+    "č": "च",
+    "čh": "छ",
+    "c": "च",
+    "ch": "छ",
+    "dž": "ज",
+    "džh": "झ",
+    "ñ": "ञ",
+    "ṭ": "ट",
+    "ṭh": "ठ",
+    "ḍ": "ड",
+    "ḍh": "ढ",
+    "ṇ": "ण",
+    "t": "त",
+    "th": "थ",
+    "d": "द",
+    "dh": "ध",
+    "n": "न",
+    "p": "प",
+    "ph": "फ",
+    "f": "फ",
+    "b": "ब",
+    "bh": "भ",
+    "m": "म",
+    "j": "य",
+    "y": "य",
+    "r": "र",
+    "l": "ल",
+    "v": "व",
+    "ś": "श",
+    "ṣ": "ष",
+    "s": "स",
+    "h": "ह",
+}
+
+# Samohlásky - (samostatná, znaménko po souhlásce), "a" po souhlásce je inherentní
+_DEVA_SAMOHLASKY = {
+    "a": ("अ", ""),
+    "á": ("आ", "ा"),
+    "ā": ("आ", "ा"),
+    "i": ("इ", "ि"),
+    "í": ("ई", "ी"),
+    "ī": ("ई", "ी"),
+    "u": ("उ", "ु"),
+    "ú": ("ऊ", "ू"),
+    "ū": ("ऊ", "ू"),
+    "ṛ": ("ऋ", "ृ"),
+    "r̥": ("ऋ", "ृ"),
+    "ṝ": ("ॠ", "ॄ"),
+    "ḷ": ("ऌ", "ॢ"),
+    "ḹ": ("ॡ", "ॣ"),
+    "e": ("ए", "े"),
+    "é": ("ए", "े"),
+    "ai": ("ऐ", "ै"),
+    "o": ("ओ", "ो"),
+    "ó": ("ओ", "ो"),
+    "au": ("औ", "ौ"),
+}
+
+# Ostatní znaky - anusvára, visarga, avagraha, číslice, dandy
+_DEVA_ZNAKY = {
+    "ṃ": "ं",
+    "ḥ": "ः",
+    "~": "ँ",
+    "'": "ऽ",
+    "|": "।",
+    "||": "॥",
+    **{str(cislice): chr(0x966 + cislice) for cislice in range(10)},
+}
+
+
+class PrevodDevanagari:
+    """
+    Přímý převod latinkového přepisu do dévanágarí jedním průchodem.
+    Text se rozdělí na nejdelší známé skupiny (souhláska / samohláska / znak) a jednoduchý
+    stavový automat doplní znaménka samohlásek a virám za souhláskou bez samohlásky.
+    Stejná pravidla jako indic_transliteration (IAST → dévanágarí), včetně samostatného ओं → ॐ.
+
+    zaloha : znaky, které zná knihovna, ale ne tabulka (velká písmena, přízvuky, ṁ, m̐, ...).
+             Text s nimi se převede funkcí `zalozni` (knihovnou), jinak znak projde beze změny.
+    """
+
+    def __init__(self, souhlasky, samohlasky, znaky, zaloha=frozenset(), zalozni=None):
+        self.souhlasky = dict(souhlasky)
+        self.samohlasky = dict(samohlasky)
+        self.znaky = dict(znaky)
+        self.zaloha = frozenset(zaloha)
+        self.zalozni = zalozni
+
+        klice = sorted({**self.souhlasky, **self.samohlasky, **self.znaky}, key=len, reverse=True)
+        # nejdelší známá skupina, jinak jeden libovolný znak
+        self.znama = frozenset("".join(klice))
+        self._vyraz = re.compile("|".join(re.escape(k) for k in klice) + "|.", re.DOTALL)
+        self._om = re.compile("ओ(?:ं|म्)")
+
+    def __call__(self, text: str) -> str:
+        if self.zalozni is not None and not self.zaloha.isdisjoint(text):
+            return self.zalozni(text)
+
+        souhlasky, samohlasky, znaky = self.souhlasky, self.samohlasky, self.znaky
+        vystup = []
+        pridej = vystup.append
+        po_souhlasce = False
+        for skupina in self._vyraz.findall(text):
+            samohlaska = samohlasky.get(skupina)
+            if samohlaska is not None:
+                pridej(samohlaska[1] if po_souhlasce else samohlaska[0])
+                po_souhlasce = False
+                continue
+            if po_souhlasce:
+                pridej("्")
+            souhlaska = souhlasky.get(skupina)
+            if souhlaska is not None:
+                pridej(souhlaska)
+                po_souhlasce = True
+            else:
+                pridej(znaky.get(skupina, skupina))
+                po_souhlasce = False
+        if po_souhlasce:
+            pridej("्")
+
+        vysledek = "".join(vystup)
+        if "ओ" in vysledek:
+            vysledek = self._om.sub(self._oddelene_om, vysledek)
+        return vysledek
+
+    @staticmethod
+    def _hranice(znak: str) -> bool:
+        return znak.isspace() or unicodedata.category(znak).startswith("P")
+
+    def _oddelene_om(self, shoda) -> str:
+        """ओं / ओम् jako samostatné slovo → ॐ (mezera, interpunkce nebo kraj textu z obou stran)."""
+        text, zacatek, konec = shoda.string, shoda.start(), shoda.end()
+        if (zacatek == 0 or self._hranice(text[zacatek - 1])) and (
+            konec == len(text) or self._hranice(text[konec])
+        ):
+            return "ॐ"
+        return shoda.group()
+
+
+def _znaky_knihovny() -> frozenset:
+    """Všechny znaky, které indic_transliteration rozpoznává v IAST."""
+    mapa = sanscript._get_scheme_map(sanscript.IAST, sanscript.DEVANAGARI)
+    klice = (*mapa.non_marks_viraama, *mapa.vowels, *mapa.vowel_marks, *mapa.accents)
+    return frozenset("".join(klice))
+
+
+def _czech_v_pres_iast_do_deva(text: str) -> str:
+    return transliterate(_PREVODNIKY[(CZECH_V, IAST)](text), sanscript.IAST, sanscript.DEVANAGARI)
+
+
+_CZECH_V_DO_DEVA = PrevodDevanagari(_DEVA_SOUHLASKY, _DEVA_SAMOHLASKY, _DEVA_ZNAKY)
+if sanscript is not None:
+    # záloha jen pro znaky, které knihovna zná a tabulka ne (ostatní knihovna také ponechá)
+    _CZECH_V_DO_DEVA.zaloha = _znaky_knihovny() - _CZECH_V_DO_DEVA.znama
+    _CZECH_V_DO_DEVA.zalozni = _czech_v_pres_iast_do_deva
+
+
+def _prepis(text: str, zdroj: str, cil: str) -> str:
+    """
+    Přepis bez paměti.
+    Dvojice bez vlastní tabulky jdou přes IAST (např. czech_v → czech_f = czech_v → iast → czech_f).
+    Do IAST se nepřevádí z českého fonetického a literárního přepisu (nejsou jednoznačné).
+    """
+    prevodnik = _PREVODNIKY.get((zdroj, cil))
+    if prevodnik is not None:
+        return prevodnik(text)
+
+    if zdroj == CZECH_V and cil == DEVA:
+        return _CZECH_V_DO_DEVA(text)
+
+    if sanscript is None:
+        raise ValueError(f"přepis {zdroj} → {cil} vyžaduje balíček indic_transliteration")
+    if zdroj == IAST and cil == DEVA:
+        return transliterate(text, sanscript.IAST, sanscript.DEVANAGARI)
+    if zdroj == DEVA and cil == IAST:
+        return transliterate(text, sanscript.DEVANAGARI, sanscript.IAST)
+
+    if IAST not in (zdroj, cil) and zdroj in (CZECH_V, DEVA):
+        return _prepis(_prepis(text, zdroj, IAST), IAST, cil)
+
+    raise ValueError(f"nepodporovaný přepis: {zdroj} → {cil}")
+
+
+# ==============================================================================================================================================
+# Paměť přepisů - jedna omezená LRU pro každou dvojici (zdroj, cíl)
+# Ukládají se celé věty i jednotlivá slova: nová věta ze známých slov se jen složí z paměti.
+# Slova se dělí na bílých znacích - žádné pravidlo přepisu je nepřekračuje, výsledek je stejný.
+
+_VELIKOST_PAMETI = 5_000
+_pameti: dict[tuple[str, str], LRUCache] = {}
+_MEZERY = re.compile(r"(\s+)")
+
+
+def _pamet(zdroj: str, cil: str) -> LRUCache:
+    pamet = _pameti.get((zdroj, cil))
+    if pamet is None:
+        pamet = _pameti.setdefault((zdroj, cil), LRUCache(max_velikost=_VELIKOST_PAMETI))
+    return pamet
+
+
+def nastav_pamet_prepisu(max_velikost: int):
+    """Nastaví velikost pamětí přepisu (na dvojici schémat). Při změně se paměti vyprázdní."""
+    global _VELIKOST_PAMETI
+    if max_velikost < 1:
+        raise ValueError("max_velikost musí být alespoň 1")
+    if max_velikost != _VELIKOST_PAMETI:
+        _VELIKOST_PAMETI = max_velikost
+        _pameti.clear()
+
+
+def vycisti_pamet_prepisu():
+    """Vyprázdní paměti přepisu včetně statistiky."""
+    _pameti.clear()
+
+
+def statistika_pameti_prepisu() -> dict[str, dict]:
+    """Statistika pamětí přepisu {"zdroj → cíl": LRUCache.statistika()} pro diagnostiku."""
+    return {f"{zdroj} → {cil}": p.statistika() for (zdroj, cil), p in sorted(_pameti.items())}
+
+
+def prepis(text: str | None, zdroj: str, cil: str, f_pamet: bool = True) -> str:
+    """
+    Přepis textu ze schématu `zdroj` do schématu `cil` (viz SCHEMATA), s pamětí vět i slov.
+    f_pamet=False převádí bez paměti (dlouhé texty a proudy, které by paměť jen vytlačily).
+    """
     if text is None:
         return ""
-    return transliterate(text, sanscript.IAST, sanscript.DEVANAGARI)
+    if zdroj == cil:
+        return text
+    if not f_pamet:
+        return _prepis(text, zdroj, cil)
+
+    pamet = _pamet(zdroj, cil)
+    vysledek = pamet.get(text)
+    if vysledek is not None:
+        return vysledek
+
+    casti = _MEZERY.split(text)
+    if len(casti) > 1:
+        # liché části jsou mezery, sudé slova
+        for i in range(0, len(casti), 2):
+            slovo = casti[i]
+            if slovo:
+                prevedene = pamet.get(slovo)
+                if prevedene is None:
+                    prevedene = pamet[slovo] = _prepis(slovo, zdroj, cil)
+                casti[i] = prevedene
+        vysledek = "".join(casti)
+    else:
+        vysledek = _prepis(text, zdroj, cil)
+
+    pamet[text] = vysledek
+    return vysledek
+
+
+def prepis_hromadne(hodnoty, zdroj: str, cil: str):
+    """
+    Přepis celého sloupce jedním voláním - každá různá hodnota se převede jen jednou.
+    hodnoty : pandas Series → Series (stejný index a název)
+              pyarrow Array / ChunkedArray → pyarrow Array (string)
+              jiný iterovatelný objekt (list, tuple, ...) → list
+    Chybějící hodnoty (None, NaN, null) zůstávají chybějící.
+    Hromadný přepis paměť přepisů nepoužívá (nevytlačí z ní slova aktuální věty).
+    """
+    if isinstance(hodnoty, pd.Series):
+        # kody -1 = chybějící hodnota → poslední prvek pole (None)
+        kody, unikatni = pd.factorize(hodnoty)
+        prevedene = np.empty(len(unikatni) + 1, dtype=object)
+        prevedene[:-1] = [prepis(str(h), zdroj, cil, f_pamet=False) for h in unikatni]
+        vysledek = pd.Series(prevedene[kody], index=hodnoty.index, name=hodnoty.name)
+        if pd.api.types.is_string_dtype(hodnoty.dtype):
+            vysledek = vysledek.astype(hodnoty.dtype)
+        return vysledek
+
+    if type(hodnoty).__module__.startswith("pyarrow"):
+        import pyarrow as pa
+
+        if isinstance(hodnoty, pa.ChunkedArray):
+            hodnoty = hodnoty.combine_chunks()
+        slovnik = hodnoty.dictionary_encode()
+        prevedene = pa.array(
+            [prepis(h, zdroj, cil, f_pamet=False) for h in slovnik.dictionary.to_pylist()],
+            type=pa.string(),
+        )
+        return prevedene.take(slovnik.indices)
+
+    pamet = {}
+    vysledek = []
+    for h in hodnoty:
+        if h is None or h != h:  # None / NaN
+            vysledek.append(h)
+            continue
+        prevedeny = pamet.get(h)
+        if prevedeny is None:
+            prevedeny = pamet[h] = prepis(h, zdroj, cil, f_pamet=False)
+        vysledek.append(prevedeny)
+    return vysledek
+
+
+# ==============================================================================================================================================
+
+
+# 📌 Přepis IAST do dévanágarí
+def transliterate_iast_to_deva(text):
+    return prepis(text, IAST, DEVA)
 
 
 # 📌 Přepis dévanágarí do IAST
 def transliterate_deva_to_iast(text):
-    if text is None:
-        return ""
-    return transliterate(text, sanscript.DEVANAGARI, sanscript.IAST)
+    return prepis(text, DEVA, IAST)
 
 
 # 📜 IAST → český přepis vědecký
 # 📌 Přepis IAST do Český vědecký
 def transliterate_iast_to_czech_v(text):
-    if text is None:
-        return ""
-    return (
-        text.replace("jh", "džh")
-        .replace("jñ", "džñ")
-        .replace("j", "dž")
-        .replace("y", "j")
-        .replace("ai", "ai")
-        .replace("au", "au")
-        .replace("kh", "kh")
-        .replace("gh", "gh")
-        .replace("ṭh", "ṭh")
-        .replace("ḍh", "ḍh")
-        .replace("th", "th")
-        .replace("dh", "dh")
-        .replace("ch", "čh")
-        .replace("ph", "f")
-        .replace("bh", "bh")
-        .replace("a", "a")
-        .replace("ā", "á")
-        .replace("i", "i")
-        .replace("ī", "í")
-        .replace("u", "u")
-        .replace("ū", "ú")
-        .replace("e", "é")
-        .replace("o", "ó")
-        .replace("ṛ", "ṛ")
-        .replace("ṝ", "ṝ")
-        .replace("ḷ", "ḷ")
-        .replace("ḹ", "ḹ")
-        .replace("ṅ", "ṅ")
-        .replace("ñ", "ñ")
-        .replace("ṇ", "ṇ")
-        .replace("n", "n")
-        .replace("m", "m")
-        .replace("ś", "ś")
-        .replace("ṣ", "ṣ")
-        .replace("k", "k")
-        .replace("g", "g")
-        .replace("ṭ", "ṭ")
-        .replace("ḍ", "ḍ")
-        .replace("t", "t")
-        .replace("d", "d")
-        .replace("ṃ", "ṃ")
-        .replace("ḥ", "ḥ")
-        .replace("h", "h")
-        .replace("r", "r")
-        .replace("l", "l")
-        .replace("v", "v")
-        .replace("c", "č")
-        .replace("p", "p")
-        .replace("b", "b")
-        .replace("ʼ", "ʼ")
-    )
+    return prepis(text, IAST, CZECH_V)
 
 
 # 📜 český přepis vědecký → IAST
 # 📌 Přepis Český vědecký do IAST
 def transliterate_czech_v_to_iast(text):
-    if text is None:
-        return ""
-    return (
-        text.replace("j", "y")
-        .replace("džñ", "jñ")
-        .replace("džh", "jh")
-        .replace("dž", "j")
-        .replace("ai", "ai")
-        .replace("au", "au")
-        .replace("kh", "kh")
-        .replace("gh", "gh")
-        .replace("ṭh", "ṭh")
-        .replace("ḍh", "ḍh")
-        .replace("th", "th")
-        .replace("dh", "dh")
-        .replace("čh", "ch")
-        .replace("bh", "bh")
-        .replace("p", "p")
-        .replace("f", "ph")
-        .replace("a", "a")
-        .replace("á", "ā")
-        .replace("i", "i")
-        .replace("í", "ī")
-        .replace("u", "u")
-        .replace("ú", "ū")
-        .replace("é", "e")
-        .replace("ó", "o")
-        .replace("ṛ", "ṛ")
-        .replace("ṝ", "ṝ")
-        .replace("ḷ", "ḷ")
-        .replace("ḹ", "ḹ")
-        .replace("ṅ", "ṅ")
-        .replace("ñ", "ñ")
-        .replace("ṇ", "ṇ")
-        .replace("n", "n")
-        .replace("m", "m")
-        .replace("ś", "ś")
-        .replace("ṣ", "ṣ")
-        .replace("k", "k")
-        .replace("g", "g")
-        .replace("ṭ", "ṭ")
-        .replace("ḍ", "ḍ")
-        .replace("t", "t")
-        .replace("d", "d")
-        .replace("ṃ", "ṃ")
-        .replace("ḥ", "ḥ")
-        .replace("h", "h")
-        .replace("r", "r")
-        .replace("l", "l")
-        .replace("v", "v")
-        .replace("č", "c")
-        .replace("b", "b")
-        .replace("ʼ", "ʼ")
-    )
-
-
-# 📌 Přepis Český vědecký do dévanágarí = czech_v to iast to deva
+    return prepis(text, CZECH_V, IAST)
+
+
+# 📌 Přepis Český vědecký do dévanágarí (přímo, bez mezikroku přes IAST)
 def transliterate_czech_v_to_deva(text):
-    if text is None:
-        return ""
-    return transliterate_iast_to_deva(transliterate_czech_v_to_iast(text))
+    return prepis(text, CZECH_V, DEVA)
 
 
 # 📌 Přepis IAST do Český fonetický, pro čtení
 def transliterate_iast_to_czech_f(text):
-    if text is None:
-        return ""
-    return (
-        text.replace("jñ", "gx")
-        .replace("j", "dž")
-        .replace("gx", "gj")
-        .replace("y", "j")
-        .replace("ch", "čh")
-        .replace("c", "č")
-        .replace("ph", "f")
-        .replace("ṅ", "ng")
-        .replace("ñ", "ň")
-        .replace("ṇ", "ṇ")
-        .replace("ī", "í")
-        .replace("ṛ", "ṛi")
-        .replace("ṝ", "ṝí")
-        .replace("ā", "á")
-        .replace("ū", "ú")
-        .replace("e", "é")
-        .replace("o", "ó")
-        .replace("ḷ", "ḷ")
-        .replace("ḹ", "ḹ")
-        .replace("ś", "ś")
-        .replace("ṣ", "ṣ")
-        .replace("ṭ", "ṭ")
-        .replace("ḍ", "ḍ")
-        .replace("ṃ", "ṃ")
-        .replace("ḥ", "ḥ")
-        .replace("ʼ", "ʼ")
-    )
+    return prepis(text, IAST, CZECH_F)
 
 
 # 📌 Přepis IAST do Český literární (zjednodušený pro běžné čtení)
 def transliterate_iast_to_czech_l(text):
-    if text is None:
-        return ""
-    return (
-        text.replace("jñ", "gx")
-        .replace("j", "dž")
-        .replace("gx", "gj")
-        .replace("y", "j")
-        .replace("ch", "čh")
-        .replace("c", "č")
-        .replace("ph", "f")
-        .replace("ṅ", "ng")
-        .replace("ñ", "ň")
-        .replace("ṇ", "n")
-        .replace("ī", "í")
-        .replace("ṛ", "ri")
-        .replace("ṝ", "rí")
-        .replace("ā", "á")
-        .replace("ū", "ú")
-        .replace("e", "é")
-        .replace("o", "ó")
-        .replace("ḷ", "l")
-        .replace("ḹ", "ĺ")
-        .replace("ṃ", "m")
-        .replace("ḥ", "h")
-        .replace("ṭ", "t")
-        .replace("ḍ", "d")
-        .replace("ś", "š")
-        .replace("ṣ", "š")
-        .replace("ʼ", "")
-    )
+    return prepis(text, IAST, CZECH_L)
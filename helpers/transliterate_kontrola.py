@@ -0,0 +1,299 @@
+# helpers/transliterate_kontrola.py
+# porovnej_s_puvodnim, korpus_z_dat, main
+#
+# Kontrola shody tabulkového přepisu (helpers.transliterate) s původní implementací
+# řetězci str.replace(), která je zde ponechána jako reference (_puvodni_*).
+# Korpus tvoří všechny textové buňky data/*.csv a náhodné řetězce ze znaků všech schémat
+# (včetně znaků, které přímý převod czech_v → dévanágarí předává záložně knihovně).
+# Výstupy se porovnávají v normalizaci NFC - původní "identické" náhrady ṛ, ṭ, ḍ měly ve zdrojovém
+# kódu náhradu rozloženou (r + U+0323), tabulkový přepis vrací znaky složené jako v datech.
+#
+# Příklad použití:
+# python -m helpers.transliterate_kontrola
+# python -m helpers.transliterate_kontrola --nahodnych 100000
+
+# import
+import argparse
+import csv
+import glob
+import random
+import sys
+import unicodedata
+
+from indic_transliteration import sanscript
+from indic_transliteration.sanscript import transliterate
+
+# Vlastní moduly
+from helpers.transliterate import (
+    transliterate_czech_v_to_deva,
+    transliterate_czech_v_to_iast,
+    transliterate_iast_to_czech_f,
+    transliterate_iast_to_czech_l,
+    transliterate_iast_to_czech_v,
+)
+
+# ==============================================================================================================================================
+# Původní implementace (reference)
+
+
+# 📜 IAST → český přepis vědecký
+# 📌 Přepis IAST do Český vědecký
+def _puvodni_iast_to_czech_v(text):
+    if text is None:
+        return ""
+    return (
+        text.replace("jh", "džh")
+        .replace("jñ", "džñ")
+        .replace("j", "dž")
+        .replace("y", "j")
+        .replace("ai", "ai")
+        .replace("au", "au")
+        .replace("kh", "kh")
+        .replace("gh", "gh")
+        .replace("ṭh", "ṭh")
+        .replace("ḍh", "ḍh")
+        .replace("th", "th")
+        .replace("dh", "dh")
+        .replace("ch", "čh")
+        .replace("ph", "f")
+        .replace("bh", "bh")
+        .replace("a", "a")
+        .replace("ā", "á")
+        .replace("i", "i")
+        .replace("ī", "í")
+        .replace("u", "u")
+        .replace("ū", "ú")
+        .replace("e", "é")
+        .replace("o", "ó")
+        .replace("ṛ", "ṛ")
+        .replace("ṝ", "ṝ")
+        .replace("ḷ", "ḷ")
+        .replace("ḹ", "ḹ")
+        .replace("ṅ", "ṅ")
+        .replace("ñ", "ñ")
+        .replace("ṇ", "ṇ")
+        .replace("n", "n")
+        .replace("m", "m")
+        .replace("ś", "ś")
+        .replace("ṣ", "ṣ")
+        .replace("k", "k")
+        .replace("g", "g")
+        .replace("ṭ", "ṭ")
+        .replace("ḍ", "ḍ")
+        .replace("t", "t")
+        .replace("d", "d")
+        .replace("ṃ", "ṃ")
+        .replace("ḥ", "ḥ")
+        .replace("h", "h")
+        .replace("r", "r")
+        .replace("l", "l")
+        .replace("v", "v")
+        .replace("c", "č")
+        .replace("p", "p")
+        .replace("b", "b")
+        .replace("ʼ", "ʼ")
+    )
+
+
+# 📜 český přepis vědecký → IAST
+# 📌 Přepis Český vědecký do IAST
+def _puvodni_czech_v_to_iast(text):
+    if text is None:
+        return ""
+    return (
+        text.replace("j", "y")
+        .replace("džñ", "jñ")
+        .replace("džh", "jh")
+        .replace("dž", "j")
+        .replace("ai", "ai")
+        .replace("au", "au")
+        .replace("kh", "kh")
+        .replace("gh", "gh")
+        .replace("ṭh", "ṭh")
+        .replace("ḍh", "ḍh")
+        .replace("th", "th")
+        .replace("dh", "dh")
+        .replace("čh", "ch")
+        .replace("bh", "bh")
+        .replace("p", "p")
+        .replace("f", "ph")
+        .replace("a", "a")
+        .replace("á", "ā")
+        .replace("i", "i")
+        .replace("í", "ī")
+        .replace("u", "u")
+        .replace("ú", "ū")
+        .replace("é", "e")
+        .replace("ó", "o")
+        .replace("ṛ", "ṛ")
+        .replace("ṝ", "ṝ")
+        .replace("ḷ", "ḷ")
+        .replace("ḹ", "ḹ")
+        .replace("ṅ", "ṅ")
+        .replace("ñ", "ñ")
+        .replace("ṇ", "ṇ")
+        .replace("n", "n")
+        .replace("m", "m")
+        .replace("ś", "ś")
+        .replace("ṣ", "ṣ")
+        .replace("k", "k")
+        .replace("g", "g")
+        .replace("ṭ", "ṭ")
+        .replace("ḍ", "ḍ")
+        .replace("t", "t")
+        .replace("d", "d")
+        .replace("ṃ", "ṃ")
+        .replace("ḥ", "ḥ")
+        .replace("h", "h")
+        .replace("r", "r")
+        .replace("l", "l")
+        .replace("v", "v")
+        .replace("č", "c")
+        .replace("b", "b")
+        .replace("ʼ", "ʼ")
+    )
+
+
+# 📌 Přepis Český vědecký do dévanágarí = czech_v to iast to deva
+def _puvodni_czech_v_to_deva(text):
+    if text is None:
+        return ""
+    return transliterate(_puvodni_czech_v_to_iast(text), sanscript.IAST, sanscript.DEVANAGARI)
+
+
+# 📌 Přepis IAST do Český fonetický, pro čtení
+def _puvodni_iast_to_czech_f(text):
+    if text is None:
+        return ""
+    return (
+        text.replace("jñ", "gx")
+        .replace("j", "dž")
+        .replace("gx", "gj")
+        .replace("y", "j")
+        .replace("ch", "čh")
+        .replace("c", "č")
+        .replace("ph", "f")
+        .replace("ṅ", "ng")
+        .replace("ñ", "ň")
+        .replace("ṇ", "ṇ")
+        .replace("ī", "í")
+        .replace("ṛ", "ṛi")
+        .replace("ṝ", "ṝí")
+        .replace("ā", "á")
+        .replace("ū", "ú")
+        .replace("e", "é")
+        .replace("o", "ó")
+        .replace("ḷ", "ḷ")
+        .replace("ḹ", "ḹ")
+        .replace("ś", "ś")
+        .replace("ṣ", "ṣ")
+        .replace("ṭ", "ṭ")
+        .replace("ḍ", "ḍ")
+        .replace("ṃ", "ṃ")
+        .replace("ḥ", "ḥ")
+        .replace("ʼ", "ʼ")
+    )
+
+
+# 📌 Přepis IAST do Český literární (zjednodušený pro běžné čtení)
+def _puvodni_iast_to_czech_l(text):
+    if text is None:
+        return ""
+    return (
+        text.replace("jñ", "gx")
+        .replace("j", "dž")
+        .replace("gx", "gj")
+        .replace("y", "j")
+        .replace("ch", "čh")
+        .replace("c", "č")
+        .replace("ph", "f")
+        .replace("ṅ", "ng")
+        .replace("ñ", "ň")
+        .replace("ṇ", "n")
+        .replace("ī", "í")
+        .replace("ṛ", "ri")
+        .replace("ṝ", "rí")
+        .replace("ā", "á")
+        .replace("ū", "ú")
+        .replace("e", "é")
+        .replace("o", "ó")
+        .replace("ḷ", "l")
+        .replace("ḹ", "ĺ")
+        .replace("ṃ", "m")
+        .replace("ḥ", "h")
+        .replace("ṭ", "t")
+        .replace("ḍ", "d")
+        .replace("ś", "š")
+        .replace("ṣ", "š")
+        .replace("ʼ", "")
+    )
+
+
+# ==============================================================================================================================================
+# Porovnání
+
+# (název, nová funkce, původní funkce)
+PREVODY = [
+    ("iast → czech_v", transliterate_iast_to_czech_v, _puvodni_iast_to_czech_v),
+    ("czech_v → iast", transliterate_czech_v_to_iast, _puvodni_czech_v_to_iast),
+    ("iast → czech_f", transliterate_iast_to_czech_f, _puvodni_iast_to_czech_f),
+    ("iast → czech_l", transliterate_iast_to_czech_l, _puvodni_iast_to_czech_l),
+    ("czech_v → deva", transliterate_czech_v_to_deva, _puvodni_czech_v_to_deva),
+]
+
+# znaky všech latinkových schémat (pro náhodné řetězce)
+ZNAKY = "aāáiīíuūúeéoóṛṝḷḹkgṅcčjñṭḍṇtdnpbmyrlvśṣshṃḥʼfždžxň ĺ'|~0.,-AṁQ\u0325\u0304\u0323"
+
+
+def korpus_z_dat(vzor: str = "data/*.csv") -> list[str]:
+    """Všechny neprázdné textové buňky CSV souborů (oddělovač ";", u jiných "," se přečte celý řádek)."""
+    texty = set()
+    for cesta in sorted(glob.glob(vzor)):
+        with open(cesta, "r", encoding="utf-8") as f:
+            for radek in csv.reader(f, delimiter=";"):
+                texty.update(bunka.strip() for bunka in radek if bunka.strip())
+    return sorted(texty)
+
+
+def nahodne_texty(pocet: int, seed: int = 0) -> list[str]:
+    nahoda = random.Random(seed)
+    return ["".join(nahoda.choices(ZNAKY, k=nahoda.randint(1, 12))) for _ in range(pocet)]
+
+
+def porovnej_s_puvodnim(texty: list[str]) -> dict:
+    """
+    Převede texty novou i původní implementací a porovná je (v normalizaci NFC).
+    Vrací {název převodu: [(text, nový, původní)]} - prázdné seznamy = shoda.
+    """
+    rozdily = {}
+    for nazev, novy, puvodni in PREVODY:
+        rozdily[nazev] = [
+            (t, novy(t), puvodni(t))
+            for t in texty
+            if unicodedata.normalize("NFC", novy(t)) != unicodedata.normalize("NFC", puvodni(t))
+        ]
+    return rozdily
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Shoda tabulkového přepisu s původními .replace()."
+    )
+    parser.add_argument("--data", default="data/*.csv", help="CSV soubory korpusu")
+    parser.add_argument("--nahodnych", type=int, default=20_000, help="počet náhodných řetězců")
+    args = parser.parse_args(argv)
+
+    texty = korpus_z_dat(args.data) + nahodne_texty(args.nahodnych)
+    rozdily = porovnej_s_puvodnim(texty)
+
+    chyby = 0
+    for nazev, seznam in rozdily.items():
+        print(f"{nazev}: {len(texty)} textů, rozdílů {len(seznam)}", file=sys.stderr)
+        for text, novy, puvodni in seznam[:5]:
+            print(f"  {text!r}: {novy!r} ≠ {puvodni!r}", file=sys.stderr)
+        chyby += len(seznam)
+    return 1 if chyby else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
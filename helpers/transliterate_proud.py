@@ -0,0 +1,161 @@
+# helpers/transliterate_proud.py
+# useky, prepis_proudu, main
+#
+# Proudový přepis velkých textových souborů (nebo stdin → stdout) mezi schématy z helpers.transliterate
+# bez načtení celého textu do paměti - mimo Streamlit.
+#
+# Text se čte po řádcích, nebo s --buffer po blocích o dané velikosti (ve znacích). Blok se vždy
+# utne těsně před bílým znakem, za kterým nenásleduje kombinační znak - žádné pravidlo přepisu
+# bílý znak nepřekračuje, takže se nerozdělí skupina (k|h, dž|h) ani písmeno s diakritikou (r + ̥).
+# UTF-8 dekóduje TextIOWrapper průběžně, vícebajtové znaky se na hranici bloku nerozpadnou.
+#
+# S --procesy > 1 se dávky úseků převádějí v ProcessPoolExecutor (jako helpers.sandhi_hromadne),
+# výstup zůstává v pořadí vstupu a v paměti je nejvýše 2 × procesy dávek.
+# Paměť přepisů (LRU) se nepoužívá - úseky se neopakují a paměť by rostla s délkou bloků.
+#
+# Příklad použití:
+# python -m helpers.transliterate_proud --z iast --do czech_v gita_iast.txt gita_cz.txt
+# cat gita_cz.txt | python -m helpers.transliterate_proud --z czech_v --do iast > gita_iast.txt
+# python -m helpers.transliterate_proud --z czech_v --do deva --buffer 1000000 --procesy 4 vstup.txt vystup.txt
+
+# import
+import argparse
+import os
+import sys
+import unicodedata
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, TextIO
+
+# Vlastní moduly
+from helpers.transliterate import SCHEMATA, prepis
+
+
+def _lze_rozdelit(text: str, i: int) -> bool:
+    """Lze text rozdělit před pozicí i? (bílý znak, za ním nic kombinačního)"""
+    if not text[i].isspace():
+        return False
+    return i + 1 >= len(text) or not unicodedata.combining(text[i + 1])
+
+
+def useky(soubor: TextIO, buffer: int | None = None) -> Iterator[str]:
+    """
+    Úseky textu ke zpracování - po řádcích (buffer=None), jinak bloky o zhruba `buffer` znacích.
+    Spojení úseků dá přesně původní text. Blok bez vhodného bílého znaku se prodlužuje,
+    dokud se bílý znak neobjeví (paměť je omezená délkou nejdelšího slova).
+    """
+    if buffer is None:
+        yield from soubor
+        return
+
+    zbytek = ""
+    while True:
+        cast = soubor.read(buffer)
+        if not cast:
+            if zbytek:
+                yield zbytek
+            return
+        text = zbytek + cast
+        # poslední znak se nechává - rozhodnutí závisí i na znaku za ním
+        rez = next((i for i in range(len(text) - 2, 0, -1) if _lze_rozdelit(text, i)), None)
+        if rez is None:
+            zbytek = text
+            continue
+        yield text[:rez]
+        zbytek = text[rez:]
+
+
+def _prevod_davky(davka: list[str], zdroj: str, cil: str) -> str:
+    return "".join(prepis(usek, zdroj, cil, f_pamet=False) for usek in davka)
+
+
+def prepis_proudu(
+    vstup: TextIO,
+    vystup: TextIO,
+    zdroj: str,
+    cil: str,
+    buffer: int | None = None,
+    procesy: int = 1,
+    davka: int = 1000,
+) -> int:
+    """
+    Přepíše text ze vstupu do výstupu po úsecích (viz useky), vrací počet úseků.
+    davka : počet úseků předaných pracovnímu procesu najednou (jen pro procesy > 1)
+    """
+    if zdroj not in SCHEMATA or cil not in SCHEMATA:
+        raise ValueError(f"neznámé schéma: {zdroj} → {cil} (známá: {', '.join(SCHEMATA)})")
+    # nepodporovaná dvojice schémat skončí chybou hned, ne až v pracovním procesu
+    prepis("a", zdroj, cil)
+
+    pocet = 0
+    if procesy <= 1:
+        for usek in useky(vstup, buffer):
+            vystup.write(prepis(usek, zdroj, cil, f_pamet=False))
+            pocet += 1
+        return pocet
+
+    casti = useky(vstup, buffer)
+    davky = iter(lambda: list(islice(casti, davka)), [])
+
+    with ProcessPoolExecutor(max_workers=procesy) as pool:
+        # rozpracované dávky ve frontě - výsledky se zapisují v pořadí zadání
+        fronta = deque()
+        for d in islice(davky, 2 * procesy):
+            fronta.append((len(d), pool.submit(_prevod_davky, d, zdroj, cil)))
+        while fronta:
+            delka, vysledek = fronta.popleft()
+            vystup.write(vysledek.result())
+            pocet += delka
+
+            dalsi = next(davky, None)
+            if dalsi is not None:
+                fronta.append((len(dalsi), pool.submit(_prevod_davky, dalsi, zdroj, cil)))
+
+    return pocet
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Proudový přepis textového souboru (nebo stdin) mezi schématy."
+    )
+    parser.add_argument("vstup", nargs="?", default="-", help="vstupní UTF-8 soubor (- = stdin)")
+    parser.add_argument("vystup", nargs="?", default="-", help="výstupní soubor (- = stdout)")
+    parser.add_argument("--z", dest="zdroj", required=True, choices=SCHEMATA, help="zdroj")
+    parser.add_argument("--do", dest="cil", required=True, choices=SCHEMATA, help="cíl")
+    parser.add_argument(
+        "--buffer", type=int, default=None, help="velikost bloku ve znacích (výchozí po řádcích)"
+    )
+    parser.add_argument("--procesy", type=int, default=1, help="počet procesů (0 = počet CPU)")
+    parser.add_argument("--davka", type=int, default=1000, help="počet úseků v jedné dávce")
+    args = parser.parse_args(argv)
+
+    procesy = args.procesy or os.cpu_count() or 1
+
+    # newline="" - konce řádků (\r\n) projdou beze změny
+    if args.vstup == "-":
+        vstup = open(sys.stdin.fileno(), "r", encoding="utf-8", newline="", closefd=False)
+    else:
+        vstup = open(args.vstup, "r", encoding="utf-8", newline="")
+    if args.vystup == "-":
+        vystup = open(sys.stdout.fileno(), "w", encoding="utf-8", newline="", closefd=False)
+    else:
+        vystup = open(args.vystup, "w", encoding="utf-8", newline="")
+
+    with vstup, vystup:
+        pocet = prepis_proudu(
+            vstup,
+            vystup,
+            zdroj=args.zdroj,
+            cil=args.cil,
+            buffer=args.buffer,
+            procesy=procesy,
+            davka=args.davka,
+        )
+    print(f"Přepsáno úseků: {pocet} ({args.zdroj} → {args.cil})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
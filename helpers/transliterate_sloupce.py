@@ -0,0 +1,195 @@
+# helpers/transliterate_sloupce.py
+# najdi_sloupce, zkontroluj_soubor, main
+#
+# Kontrola a přegenerování odvozených sloupců s dévanágarí v data/*.csv.
+# Odvozený sloupec = přepis zdrojového sloupce (kmen → devanagari, tran_kmen → dev_kmen, iast → devanagari, ...),
+# páry sloupců jsou v PARY_SLOUPCU a hledají se v hlavičce každého CSV souboru.
+# Celý sloupec se převádí jedním voláním prepis_hromadne (každá různá hodnota jen jednou).
+# Ze zdrojové hodnoty se před přepisem odstraní koncová pomlčka / čárka (putra- → पुत्र, gam-, → गम्).
+#
+# Soubory se při přepisu mění jen v buňkách, které se liší - ostatní řádky, uvozovky,
+# prázdné řádky a konce řádků zůstávají beze změny. Porovnává se v normalizaci NFC.
+#
+# Příklad použití:
+# python -m helpers.transliterate_sloupce                     # kontrola, návratový kód 1 při rozdílech
+# python -m helpers.transliterate_sloupce --prepsat --jen-prazdne
+# python -m helpers.transliterate_sloupce --prepsat data/slovesa.csv
+
+# import
+import argparse
+import glob
+import re
+import sys
+import time
+import unicodedata
+
+from dataclasses import dataclass
+
+# Vlastní moduly
+from helpers.transliterate import CZECH_V, DEVA, IAST, prepis_hromadne
+
+# (zdrojový sloupec, odvozený sloupec, schéma zdroje) - cílem je vždy dévanágarí
+PARY_SLOUPCU = (
+    ("kmen", "devanagari", CZECH_V),
+    ("transliterace", "devanagari", CZECH_V),
+    ("iast", "devanagari", IAST),
+    ("tran_kmen", "dev_kmen", CZECH_V),
+    ("tran_prezens_3sg", "dev_prezens_3sg", CZECH_V),
+    ("tran_ppp", "dev_ppp", CZECH_V),
+)
+
+# Buňka CSV: v uvozovkách (zdvojené "" uvnitř) nebo cokoli do dalšího středníku
+_BUNKA = re.compile(r'"(?:[^"]|"")*"(?=;|$)|[^;]*')
+
+
+@dataclass
+class Rozdil:
+    soubor: str
+    radek: int  # číslo řádku v souboru (hlavička = 1)
+    sloupec: str
+    zdroj: str
+    puvodni: str
+    ocekavany: str
+    prepsano: bool = False
+
+
+def _bunky(radek: str) -> list[str]:
+    """Rozdělí řádek na buňky v původním zápisu (včetně uvozovek)."""
+    bunky, pozice = [], 0
+    while True:
+        shoda = _BUNKA.match(radek, pozice)
+        bunky.append(shoda.group())
+        pozice = shoda.end()
+        if pozice >= len(radek) or radek[pozice] != ";":
+            return bunky
+        pozice += 1
+
+
+def _hodnota(bunka: str) -> str:
+    if len(bunka) >= 2 and bunka[0] == bunka[-1] == '"':
+        return bunka[1:-1].replace('""', '"')
+    return bunka
+
+
+def _zaklad(hodnota: str) -> str:
+    """Zdrojová hodnota bez koncové pomlčky kmene a čárky (gam-, → gam)."""
+    return hodnota.strip().rstrip("-, ")
+
+
+def _nfc(text: str) -> str:
+    return unicodedata.normalize("NFC", text)
+
+
+def najdi_sloupce(hlavicka: list[str]) -> list[tuple[int, int, str]]:
+    """Indexy párů (zdroj, cíl, schéma) z PARY_SLOUPCU, které hlavička obsahuje."""
+    return [
+        (hlavicka.index(zdroj), hlavicka.index(cil), schema)
+        for zdroj, cil, schema in PARY_SLOUPCU
+        if zdroj in hlavicka and cil in hlavicka
+    ]
+
+
+def zkontroluj_soubor(
+    cesta: str, prepsat: bool = False, jen_prazdne: bool = False
+) -> tuple[int, list[Rozdil]]:
+    """
+    Porovná odvozené sloupce souboru s přepisem zdrojových sloupců.
+    prepsat     : rozdílné buňky se v souboru nahradí přepisem
+    jen_prazdne : přepisují se jen prázdné odvozené buňky (ruční opravy zůstanou)
+    Vrací (počet kontrolovaných buněk, rozdíly).
+    """
+    with open(cesta, "r", encoding="utf-8", newline="") as f:
+        radky = f.read().splitlines(keepends=True)
+    if not radky:
+        return 0, []
+
+    sloupce = najdi_sloupce(radky[0].rstrip("\r\n").split(";"))
+    if not sloupce:
+        return 0, []
+
+    tabulka = [_bunky(radek.rstrip("\r\n")) for radek in radky[1:]]
+    rozdily = []
+    pocet = 0
+    zmenene = set()
+
+    for i_zdroj, i_cil, schema in sloupce:
+        # řádky, které oba sloupce mají a zdroj není prázdný
+        vybrane = [
+            (i, bunky)
+            for i, bunky in enumerate(tabulka)
+            if len(bunky) > max(i_zdroj, i_cil) and _zaklad(_hodnota(bunky[i_zdroj]))
+        ]
+        zdroje = [_zaklad(_hodnota(bunky[i_zdroj])) for _, bunky in vybrane]
+        prepisy = prepis_hromadne(zdroje, schema, DEVA)
+        pocet += len(vybrane)
+
+        for (i, bunky), ocekavany in zip(vybrane, prepisy):
+            puvodni = _hodnota(bunky[i_cil])
+            if _nfc(puvodni.strip()) == _nfc(ocekavany):
+                continue
+            rozdil = Rozdil(
+                soubor=cesta,
+                radek=i + 2,
+                sloupec=radky[0].split(";")[i_cil].strip(),
+                zdroj=_hodnota(bunky[i_zdroj]),
+                puvodni=puvodni,
+                ocekavany=ocekavany,
+            )
+            if prepsat and (not jen_prazdne or not puvodni.strip()):
+                bunky[i_cil] = ocekavany
+                rozdil.prepsano = True
+                zmenene.add(i)
+            rozdily.append(rozdil)
+
+    if zmenene:
+        for i in zmenene:
+            radek = radky[i + 1]
+            konec = radek[len(radek.rstrip("\r\n")) :]
+            radky[i + 1] = ";".join(tabulka[i]) + konec
+        with open(cesta, "w", encoding="utf-8", newline="") as f:
+            f.write("".join(radky))
+
+    return pocet, rozdily
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Kontrola / přegenerování sloupců s dévanágarí v CSV datech."
+    )
+    parser.add_argument("soubory", nargs="*", help="CSV soubory (výchozí data/*.csv)")
+    parser.add_argument("--prepsat", action="store_true", help="rozdílné buňky přepsat v souboru")
+    parser.add_argument(
+        "--jen-prazdne", action="store_true", help="s --prepsat doplnit jen prázdné buňky"
+    )
+    parser.add_argument("--tichy", action="store_true", help="nevypisovat jednotlivé rozdíly")
+    args = parser.parse_args(argv)
+
+    soubory = args.soubory or sorted(glob.glob("data/*.csv"))
+    start = time.perf_counter()
+    celkem, vsechny = 0, []
+    for cesta in soubory:
+        pocet, rozdily = zkontroluj_soubor(
+            cesta, prepsat=args.prepsat, jen_prazdne=args.jen_prazdne
+        )
+        celkem += pocet
+        vsechny.extend(rozdily)
+        if not args.tichy:
+            for r in rozdily:
+                znacka = "přepsáno " if r.prepsano else ""
+                print(
+                    f"{r.soubor}:{r.radek} {r.sloupec}: {znacka}{r.zdroj} → {r.ocekavany}"
+                    f" (je {r.puvodni})"
+                )
+
+    trvani = time.perf_counter() - start
+    prepsano = sum(r.prepsano for r in vsechny)
+    print(
+        f"Zkontrolováno buněk: {celkem}, rozdílů: {len(vsechny)}, přepsáno: {prepsano}"
+        f" ({trvani:.2f} s)",
+        file=sys.stderr,
+    )
+    return 1 if any(not r.prepsano for r in vsechny) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@
 # Zobrazovací procedury volané z více míst, ochrana proti zacyklení, udržení struktury do stromu
 #
 # Obsahuje:
-# zobraz_toast, zobraz_vetu
+# zobraz_toast, zobraz_vetu, zobraz_diagnostiku
 #
 # Volá:
 #
@@ -26,6 +26,17 @@ from streamlit.web.cli import _get_command_line_as_string
 from streamlit.runtime.state import session_state
 from streamlit.runtime.scriptrunner import get_script_run_ctx
 
+# Vlastní moduly
+from helpers.transliterate import statistika_pameti_prepisu, vycisti_pamet_prepisu
+from helpers.sandhi_processor import statistika_sdilenych_procesoru
+from helpers.sandhi_trace import SandhiTrace
+from helpers.koncovky import statistika_indexu
+from helpers.kontrola_projektu import obnov_overeni, statistika_overeni
+from helpers.lexikon import statistika_lexikonu
+from helpers.lexikon_sqlite import statistika_databaze
+from helpers.repozitar_dat import obnov_data, statistika_dat
+from helpers.snimek_dat import sestav_snimek, statistika_snimku
+
 
 def zobraz_toast(
     text: str,
@@ -253,6 +264,94 @@ def vypis_konfiguraci():
     zobraz_config(".streamlit/config.toml")
 
 
+# Diagnostika - stránka pages/diagnostika.py
+# ================================================================
+
+
+def _tabulka_statistik(statistiky: dict[str, dict]) -> pd.DataFrame:
+    df = pd.DataFrame.from_dict(statistiky, orient="index")
+    if "uspesnost" in df.columns:
+        df["uspesnost"] = (df["uspesnost"] * 100).round(1).astype(str) + " %"
+    return df
+
+
+def zobraz_diagnostiku():
+    """Statistika pamětí procesu - přepis (LRU), cache sandhi, indexy koncovek a tabulky dat."""
+    st.write("### 🩺 Diagnostika")
+
+    st.write("#### Paměť přepisů (věty i slova)")
+    statistiky = statistika_pameti_prepisu()
+    if statistiky:
+        st.dataframe(_tabulka_statistik(statistiky))
+    else:
+        st.info("Paměť přepisů je zatím prázdná.")
+    if st.button("🗑️ Vyprázdnit paměť přepisů", key="diagnostika_vycisti_prepis"):
+        vycisti_pamet_prepisu()
+        st.rerun()
+
+    st.write("#### Cache sandhi (dvojice slov)")
+    statistiky = {k: v for k, v in statistika_sdilenych_procesoru().items() if v}
+    if statistiky:
+        st.dataframe(_tabulka_statistik(statistiky))
+    else:
+        st.info("Sandhi zatím nebylo použito.")
+    # trasování poslední věty této session (cfg f_log)
+    udalosti = st.session_state.get("sandhi_trace")
+    if udalosti:
+        st.download_button(
+            f"⬇️ Trasování sandhi poslední věty ({len(udalosti)} událostí, JSONL)",
+            data=SandhiTrace.jsonl(udalosti),
+            file_name="sandhi_trace.jsonl",
+            mime="application/jsonl",
+            key="diagnostika_sandhi_trace",
+        )
+
+    st.write("#### Indexy koncovek")
+    st.dataframe(_tabulka_statistik(statistika_indexu()))
+
+    st.write("#### Tabulky dat (data/*.csv)")
+    statistiky = statistika_dat()
+    st.dataframe(_tabulka_statistik({"celkem": statistiky["souhrn"]}))
+    if statistiky["soubory"]:
+        st.dataframe(_tabulka_statistik(statistiky["soubory"]))
+    if st.button("🔄 Znovu načíst data", key="diagnostika_obnov_data"):
+        # změněné soubory se načtou i samy (podpis souboru), tlačítko zahodí vše
+        obnov_data()
+        st.rerun()
+
+    st.write("#### Lexikony slovních druhů")
+    statistiky = statistika_lexikonu()
+    if statistiky:
+        st.dataframe(_tabulka_statistik(statistiky))
+    else:
+        st.info("Zatím nebyl použit žádný slovník.")
+    statistiky = statistika_databaze()
+    if statistiky:
+        st.write("Slovníky v data/lexikon.sqlite")
+        st.dataframe(_tabulka_statistik(statistiky))
+
+    st.write("#### Snímek dat (data/snimek_dat.arrow)")
+    st.dataframe(_tabulka_statistik({"snímek": statistika_snimku()}))
+    if st.button("📦 Sestavit snímek dat", key="diagnostika_sestav_snimek"):
+        try:
+            sestav_snimek()
+        except (RuntimeError, OSError) as e:
+            zobraz_toast(text=f"❌ Snímek dat nelze sestavit: {e}", icon="⚠️", trvani=3.0)
+        else:
+            obnov_data()
+            st.rerun()
+
+    st.write("#### Soubory projektu (soubory_projektu.csv, ověřeno při startu)")
+    statistiky = statistika_overeni()
+    if statistiky:
+        st.dataframe(_tabulka_statistik(statistiky))
+    else:
+        st.info("Seznam souborů projektu nebyl nalezen.")
+    if st.button("🔍 Znovu ověřit soubory", key="diagnostika_obnov_overeni"):
+        obnov_overeni()
+        st.rerun()
+
+
 # Výstup - konec, vpravo
 # ================================================================
 # Výpis sestavené věty - tabulka z "matice_vet"
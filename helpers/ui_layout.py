@@ -8,7 +8,7 @@
 # Volá:
 # vyber_slova_form, vypis_tvaru_slova, zobraz_tlacitka_pro_vlozeni_do_matice_vety, render_sentence_matrix_0,
 # zobraz_vetu, vypis_nove_slovo, nastyluj_sloupce, zobraz_prepinac_smeru, layout_cz_do_sanskrt,
-# layout_sanskrt_do_cz, zobraz_label_hodnotu, urci_koncovku
+# layout_sanskrt_do_cz, zobraz_label_hodnotu, urci_koncovku, rozeber_vetu, rozdel_sandhi
 #
 # Nevyužito:
 # test_radku_0, radek_hybrid, radek_flexbox, radek_sloupce,
@@ -38,6 +38,7 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Sequence, Optional, List, Dict, Any
 from functools import partial
+from itertools import islice
 
 # from datetime         import datetime
 from helpers.ui_display import (
@@ -49,6 +50,8 @@ from helpers.ui_display import (
 
 from helpers.forms import vyber_slova_form
 from helpers.utils import urci_koncovku
+from helpers.rozbor_tvaru import rozeber_vetu
+from helpers.sandhi_viccheda import rozdel_sandhi
 
 # Obecné
 # ================================================================
@@ -399,14 +402,47 @@ def layout_cz_do_sanskrt(col1, col2, col3, col4, col5, col6):
 def layout_sanskrt_do_cz():
     # st.header("📤 Sanskrit → CZ")
 
+    ss = st.session_state
+
     st.markdown("### 📜 Zadej sanskrtskou větu (v dévanágarí nebo transliteraci)")
     vstup_sa = st.text_input("Zadej větu:", key="vstup_sa")
 
     if vstup_sa:
         st.write("🔎 *Rozklad na slova, rozpoznání sandhi, analýza tvarů a překlad*")
 
+    # Rozdělení sandhi - nejlepší rozdělení (líně, s limitem času a paprsku z cfg)
+    rozdeleni = []
+    if vstup_sa:
+        rozdeleni = list(
+            islice(
+                rozdel_sandhi(
+                    vstup_sa,
+                    paprsek=ss["cfg"]["viccheda_paprsek"],
+                    casovy_limit=ss["cfg"]["viccheda_limit_s"],
+                ),
+                ss["cfg"]["viccheda_pocet"],
+            )
+        )
+        st.markdown("✂️ Rozdělení sandhi:")
+        for r in rozdeleni:
+            st.markdown(f"- {r.veta} `{r.cena:g}`")
+
     st.markdown("🧾 Analytický rozklad:")
-    # Později sem přidáme bloky výstupu rozboru a překlad
+    # Rozbor tvarů slov nejlepšího rozdělení
+    veta = rozdeleni[0].veta if rozdeleni else (vstup_sa or "")
+    for slovo, rozbory in rozeber_vetu(veta):
+        if not rozbory:
+            st.markdown(f"**{slovo}** – ❓ tvar nerozpoznán")
+            continue
+        st.markdown(f"**{slovo}**")
+        st.dataframe(
+            [
+                {"cz": r.cz, "slovo": r.lemma, "druh": r.typ, "tvar": r.popis, "kmen": r.kmen_0}
+                for r in rozbory
+            ],
+            hide_index=True,
+        )
+    # Později sem přidáme překlad
 
 
 # Úvod
@@ -7,7 +7,8 @@
 #
 # Volá:
 # aplikuj_sandhi, prazdna_veta, aplikuj_transliteraci, ne_sestav_vetu,
-# zobraz_vetu, zobraz_toast, SandhiProcessor, transliterate_czech_v_to_iast, transliterate_czech_v_to_deva
+# zobraz_vetu, zobraz_toast, sdileny_procesor, transliterate_czech_v_to_iast, transliterate_czech_v_to_deva,
+# sklonuj_hromadne, prepis_hromadne, overeni_adresaru, overeni_souboru
 
 # modul pro zpracování tlačítek z ui_layout
 # sestavení věty, provedení sandhi (volá sandhi_engine), převod do dévanágarí, export, výmaz matice věty, matice vět, věty
@@ -28,9 +29,17 @@ from helpers.ui_display import (
     zobraz_vetu,
 )
 
-from helpers.sandhi_processor import SandhiProcessor
+from helpers.kontrola_projektu import overeni_adresaru, overeni_souboru
+
+from helpers.sandhi_processor import SandhiToken, sdileny_procesor
+
+from helpers.sklonovani import CISLA, PADY, sklonuj_hromadne
 
 from helpers.transliterate import (
+    CZECH_V,
+    DEVA,
+    IAST,
+    prepis_hromadne,
     transliterate_iast_to_deva,
     transliterate_deva_to_iast,
     transliterate_iast_to_czech_v,
@@ -46,38 +55,31 @@ from helpers.transliterate import (
 # 1️⃣ Ověření adresářů
 def if_dir_exist(seznam: str):
     """
-    Načte seznam adresářů z CSV a ověří jejich existenci.
-    Pokud adresář neexistuje, vytvoří ho.
+    Ověří adresáře ze seznamu (CSV), chybějící vytvoří.
+    Ověření proběhne jednou za proces (kontrola_projektu), rerun už na disk nesahá.
     """
-    soubor = os.path.basename(seznam)
-    adresar = os.path.dirname(seznam) or "."
-    if not os.path.exists(seznam):
+    if overeni_adresaru(seznam) is None and _poprve_v_session(f"if_dir_exist_{seznam}"):
+        soubor = os.path.basename(seznam)
+        adresar = os.path.dirname(seznam) or "."
         zobraz_toast(
             text=f"Soubor seznamu adresářů projektu '{soubor}' nebyl nalezen v adresáři '{adresar}'.",
             icon="⚠️",
             trvani=3,
         )
-        return
-
-    with open(seznam, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        data = [row for row in reader if any(row.values())]  # ignoruje zcela prázdné řádky
-        for radek in data:
-            adresar = radek["cesta"]
-            # popis = radek.get('popis', '')
-            if not os.path.exists(adresar):
-                os.makedirs(adresar)
 
 
 # 1️⃣ Ověření souborů
 def if_file_exist(seznam: str):
     """
-    Načte seznam souborů z CSV a ověří jejich existenci.
-    Pokud soubor neexistuje, zobrazí toast.
+    Ověří soubory ze seznamu (CSV) - existence a velikost (jednou za proces).
+    Chybějící soubory ohlásí toastem jednou za session.
     """
-    soubor = os.path.basename(seznam)
-    adresar = os.path.dirname(seznam) or "."
-    if not os.path.exists(seznam):
+    if not _poprve_v_session(f"if_file_exist_{seznam}"):
+        return
+    soubory = overeni_souboru(seznam)
+    if soubory is None:
+        soubor = os.path.basename(seznam)
+        adresar = os.path.dirname(seznam) or "."
         zobraz_toast(
             text=f"Soubor seznamu souborů projektu '{soubor}' nebyl nalezen v adresáři '{adresar}'.",
             icon="⚠️",
@@ -85,20 +87,23 @@ def if_file_exist(seznam: str):
         )
         return
 
-    with open(seznam, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        data = [row for row in reader if any(row.values())]  # ignoruje zcela prázdné řádky
-        for radek in data:
-            cesta = radek["cesta"]
-            soubor = os.path.basename(cesta)
-            adresar = os.path.dirname(cesta) or "."
-            popis = radek.get("popis", "")
-            if not os.path.exists(cesta):
-                zobraz_toast(
-                    text=f"Soubor '{soubor}' ({popis}) nebyl nalezen v adresáři '{adresar}'!",
-                    icon="⚠️",
-                    trvani=3,
-                )
+    for s in soubory:
+        if not s.existuje:
+            zobraz_toast(
+                text=f"Soubor '{os.path.basename(s.cesta)}' ({s.popis}) nebyl nalezen"
+                f" v adresáři '{os.path.dirname(s.cesta) or '.'}'!",
+                icon="⚠️",
+                trvani=3,
+            )
+
+
+def _poprve_v_session(klic: str) -> bool:
+    """True při prvním volání s klíčem v této session (hlášení se neopakují při každém rerunu)."""
+    ohlaseno = st.session_state.setdefault("overeni_ohlaseno", set())
+    if klic in ohlaseno:
+        return False
+    ohlaseno.add(klic)
+    return True
 
 
 def clean_value(value, default=None, strip=True):
@@ -461,16 +466,34 @@ def aplikuj_sandhi() -> bool:
         #     st.markdown("### Věta po Sandhi:")
         #     st.write(ss['veta_sandhi'])
 
-        # Inicializace Processor
+        # Sdílený Processor - pravidla se kompilují jednou pro proces, ne při každém kliknutí
+        # (ss["sandhi_skupiny"] / ss["sandhi_pravidla"] jsou načtené ze stejného souboru)
         json_file = ss["sandhi_pravidla_file"]
-        skupiny = ss["sandhi_skupiny"]
-        pravidla = ss["sandhi_pravidla"]
-        # pravidla = ss['sandhi_pravidla_file']
-        processor = SandhiProcessor(json_file=json_file, skupiny=skupiny, pravidla=pravidla)
+        processor = sdileny_procesor(json_file=json_file, f_log=ss["cfg"]["f_log"])
+        # vlastní číslo běhu - trasování sdíleného procesoru obsahuje i věty jiných sessions
+        beh = processor.trace.novy_beh() if processor.trace is not None else None
 
         # Zpracuj sandhi do veta_tran_cz_sandhi
         # Provedení Sandhi
-        veta_tran_cz_sandhi, veta_tran_cz_sandhi_zmeny = processor.aplikuj_sandhi(veta_tran_cz)
+        # Slova s parametry (typ, pád, číslo) z matice věty - pro podmínky pravidel
+        # věta vzniká z matice (vytvor_verze_vety), jinak se zpracuje jen text
+        tokeny = [
+            SandhiToken.z_matice(radek, koncovka=urci_koncovku(radek.get("typ", "")))
+            for radek in ss.get("matice_vety", [])
+        ]
+        if " ".join(t.tvar for t in tokeny).split() == veta_tran_cz.split():
+            veta_tran_cz_sandhi, veta_tran_cz_sandhi_zmeny = processor.aplikuj_sandhi_tokeny(
+                tokeny, beh=beh
+            )
+        else:
+            veta_tran_cz_sandhi, veta_tran_cz_sandhi_zmeny = processor.aplikuj_sandhi(
+                veta_tran_cz, beh=beh
+            )
+
+        # Trasování pravidel (jen při cfg f_log) - jen události této věty, do session
+        # (stažení JSONL na stránce Diagnostika)
+        if processor.trace is not None:
+            ss["sandhi_trace"] = processor.trace.udalosti(pravidla=processor.pravidla, beh=beh)
         # veta_tran_cz_sandhi = veta_tran_cz  # Prozatím bez změn
 
         # Uložení výsledků
@@ -624,33 +647,13 @@ def smaz_vetu() -> bool:
 
 
 # 1. Získání tvarů pro slovo
-def sklonuj_slovo(slovo, rod, vzor):
+def sklonuj_slovo(slovo, rod, vzor=None):
     # rod: "m" | "f" | "n"
-    # vzor: např. "a-kmen", "i-kmen"
-    pady = [
-        "nominativ",
-        "akuzativ",
-        "instrumentál",
-        "datív",
-        "ablatív",
-        "genitiv",
-        "lokativ",
-        "vokativ",
-    ]
-    cisla = ["sg", "du", "pl"]
-
-    # Tady by se načetla koncovková tabulka podle rodu a vzoru
-    KONCOVKY = ["-a", "-am", "-ena"]  # příklad
-    tabulka_koncovek = KONCOVKY[vzor][rod]
-
-    tvary = []
-    for i, pad in enumerate(pady):
-        radek = []
-        for j, cislo in enumerate(cisla):
-            tvar = slovo + tabulka_koncovek[i][j]
-            radek.append(tvar)
-        tvary.append(radek)
-    return tvary  # [ [sg, du, pl], [sg, du, pl], ... ]
+    # vzor: např. "a-kmen", "i-kmen" - určuje se z koncové hlásky kmene (sklonuj_hromadne), nepoužito
+    tvary = sklonuj_hromadne([slovo], rody=[rod], f_prepis=False)
+    mrizka = tvary.pivot(index="pad", columns="cislo", values="tvar_tran_cz")
+    mrizka = mrizka.reindex(index=list(PADY), columns=list(CISLA)).fillna("")
+    return mrizka.values.tolist()  # [ [sg, du, pl], [sg, du, pl], ... ]
 
 
 # ==============================================================================================================================================
@@ -699,26 +702,30 @@ def transliterace(slova, typ="IAST"):
 
 
 # 4. Finální funkce vyskloňuj()
+# Všechny verze věty najednou - tvary z jednoho spojení s tabulkou koncovek (sklonuj_hromadne),
+# sandhi dávkou (aplikuj_sandhi_batch) a přepis sloupců (prepis_hromadne), bez smyčky přes buňky.
 def vysklonuj(slovo, rod, vzor, veta_slova, index):
-    tvary = sklonuj_slovo(slovo, rod, vzor)
-    verze_vety = vytvor_verze_vety(veta_slova, index, tvary, rod)
-
-    vysledky = []
-    for v in verze_vety:
-        bez_sandhi_text = v["veta"]
-        sandhi_text = aplikuj_sandhi(bez_sandhi_text)
-        vysledky.append(
-            {
-                "pad": v["pad"],
-                "rod": rod,
-                "cislo": v["cislo"],
-                "bez_sandhi": bez_sandhi_text,
-                "sandhi": sandhi_text,
-                "iast": transliterace(v["veta"], "IAST"),
-                "dev": transliterace(v["veta"], "DEV"),
-            }
-        )
-    return vysledky
+    tvary = sklonuj_hromadne([slovo], rody=[rod], f_prepis=False)
+    vety = [veta_slova[:index] + [tvar] + veta_slova[index + 1 :] for tvar in tvary["tvar_tran_cz"]]
+
+    bez_sandhi = pd.Series([" ".join(v) for v in vety], dtype=object)
+    sandhi = [veta for veta, _ in sdileny_procesor().aplikuj_sandhi_batch(vety)]
+    iast = prepis_hromadne(bez_sandhi, CZECH_V, IAST)
+    dev = prepis_hromadne(bez_sandhi, CZECH_V, DEVA)
+
+    poradi_padu = {pad: i + 1 for i, pad in enumerate(PADY)}
+    return [
+        {
+            "pad": poradi_padu[pad],
+            "rod": rod,
+            "cislo": cislo.rstrip("."),
+            "bez_sandhi": v,
+            "sandhi": s,
+            "iast": i.split(" "),
+            "dev": d.split(" "),
+        }
+        for pad, cislo, v, s, i, d in zip(tvary["pad"], tvary["cislo"], vety, sandhi, iast, dev)
+    ]
 
 
 # =======================================================================================================
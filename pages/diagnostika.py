@@ -0,0 +1,12 @@
+# pages/diagnostika.py
+#
+# Stránka Diagnostika - statistika pamětí procesu (paměť přepisů, cache sandhi, indexy koncovek, tabulky dat)
+#
+# Volá:
+# zobraz_diagnostiku
+
+
+# Vlastní moduly
+from helpers.ui_display import zobraz_diagnostiku
+
+zobraz_diagnostiku()